@@ -4,45 +4,230 @@ A Flask-based web application for analyzing IT resumes using NLP techniques
 Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
 """
 
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, request, jsonify, make_response, render_template, send_from_directory
 from flask_cors import CORS
 import os
-import tempfile
+import hashlib
 import logging
+import math
+from functools import wraps
 from datetime import datetime
 from dotenv import load_dotenv
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.middleware.proxy_fix import ProxyFix
 
-# Import custom modules
-from backend.utils.pdf_processor import PDFProcessor
-from backend.services.openrouter_service import OpenRouterService
-from backend.services.analyzer import ResumeAnalyzer
-from backend.models.skill_database import SkillDatabase
+# Import custom modules; the services themselves are imported by their factories below
+from backend.services.registry import ServiceRegistry
+from backend.services.resume_index import QuerySyntaxError
+from backend.utils.admission import (AdmissionController, ConcurrencyGate, MemoryTokenBuckets, Overloaded,
+                                     SQLiteConcurrencyGate, SQLiteTokenBuckets, default_gate_sizes)
+from backend.utils.http_cache import VersionedResponseCache, compress_response
+from backend.utils.json_provider import FastJSONProvider
+from backend.utils.upload_stream import UploadError, receive_pdf_upload
 
 # Load environment variables
 load_dotenv()
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = FastJSONProvider(app)  # orjson when installed; compact output outside debug mode
 CORS(app)  # Enable CORS for all routes
 
 # Configure app
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key')
+app.config['MAX_BATCH_JOBS'] = int(os.environ.get('MAX_BATCH_JOBS', 100))
+app.config['MAX_DETAILED_COMPARISONS'] = int(os.environ.get('MAX_DETAILED_COMPARISONS', 5))
+app.config['MAX_BATCH_RESUMES'] = int(os.environ.get('MAX_BATCH_RESUMES', 500))
+app.config['SKILLS_DATABASE_MAX_AGE'] = int(os.environ.get('SKILLS_DATABASE_MAX_AGE', 60))
+app.config['COMPRESS_MIN_SIZE'] = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+app.config['COMPRESS_GZIP_LEVEL'] = int(os.environ.get('COMPRESS_GZIP_LEVEL', 6))
+app.config['COMPRESS_BROTLI_QUALITY'] = int(os.environ.get('COMPRESS_BROTLI_QUALITY', 5))
+# Admission control of the expensive (analysis and LLM) routes
+app.config['RATE_LIMIT_PER_MINUTE'] = float(os.environ.get('RATE_LIMIT_PER_MINUTE', 30))
+app.config['RATE_LIMIT_BURST'] = int(os.environ.get('RATE_LIMIT_BURST', 10))
+app.config['RATE_LIMIT_STORE_PATH'] = os.environ.get('RATE_LIMIT_STORE_PATH', '')
+app.config['RATE_LIMIT_API_KEYS'] = {key.strip() for key in os.environ.get('RATE_LIMIT_API_KEYS', '').split(',') if key.strip()}
+# Proxies (nginx, load balancers) in front of the app whose X-Forwarded-For
+# and X-Forwarded-Proto are trusted; without this every client behind them
+# shares the proxy's address and rate-limit bucket
+app.config['TRUSTED_PROXY_COUNT'] = int(os.environ.get('TRUSTED_PROXY_COUNT', 0))
+if app.config['TRUSTED_PROXY_COUNT']:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['TRUSTED_PROXY_COUNT'],
+                            x_proto=app.config['TRUSTED_PROXY_COUNT'])
+# The gate is sized from the request threads it sees: one gunicorn worker's,
+# or every worker's when it is shared through RATE_LIMIT_STORE_PATH
+_request_threads = int(os.environ.get('GUNICORN_THREADS') or 4)
+if app.config['RATE_LIMIT_STORE_PATH']:
+    _request_threads *= int(os.environ.get('WEB_CONCURRENCY') or 1)
+_gate_limit, _gate_queue, _shed_depth = default_gate_sizes(_request_threads)
+app.config['MAX_CONCURRENT_REQUESTS'] = int(os.environ.get('MAX_CONCURRENT_REQUESTS') or _gate_limit)
+app.config['ADMISSION_QUEUE_SIZE'] = int(os.environ.get('ADMISSION_QUEUE_SIZE') or _gate_queue)
+app.config['ADMISSION_QUEUE_TIMEOUT'] = float(os.environ.get('ADMISSION_QUEUE_TIMEOUT', 10))
+app.config['SHED_QUEUE_DEPTH'] = int(os.environ.get('SHED_QUEUE_DEPTH') or _shed_depth)
 
-# Create upload directory
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+# Services are built on first use, so importing the app stays cheap
+services = ServiceRegistry()
 
-# Initialize services
-pdf_processor = PDFProcessor()
-openrouter_service = OpenRouterService()
-resume_analyzer = ResumeAnalyzer()
-skill_database = SkillDatabase()
+def _create_pdf_processor():
+    from backend.utils.pdf_processor import PDFProcessor
+    return PDFProcessor()
+
+def _create_skill_database():
+    from backend.models.skill_database import SkillDatabase
+    return SkillDatabase()
+
+def _create_resume_analyzer():
+    from backend.services.analyzer import ResumeAnalyzer
+    return ResumeAnalyzer(skill_database=services.skill_database)
+
+def _create_resume_store():
+    from backend.services.resume_store import ResumeStore
+    return ResumeStore()
+
+def _create_candidate_ranker():
+    from backend.services.ranking import CandidateRanker
+    ranker = CandidateRanker(services.resume_analyzer)
+    # Rebuild the candidate pool from resumes stored by previous runs
+    ranker.sync_from(services.resume_store)
+    return ranker
+
+def _create_resume_index():
+    from backend.services.resume_index import ResumeIndex
+    return ResumeIndex()
+
+def _create_admission():
+    # A SQLite file shares the rate limits and the gate between worker processes
+    path = app.config['RATE_LIMIT_STORE_PATH']
+    gate_sizes = (app.config['MAX_CONCURRENT_REQUESTS'], app.config['ADMISSION_QUEUE_SIZE'],
+                  app.config['ADMISSION_QUEUE_TIMEOUT'])
+    if path:
+        buckets = SQLiteTokenBuckets(path)
+        # Slots of a killed worker are released once its requests would have timed out
+        gate = SQLiteConcurrencyGate(path, *gate_sizes, lease=float(os.environ.get('GUNICORN_TIMEOUT') or 120))
+    else:
+        buckets = MemoryTokenBuckets()
+        gate = ConcurrencyGate(*gate_sizes)
+    return AdmissionController(buckets, gate, app.config['RATE_LIMIT_PER_MINUTE'] / 60,
+                               app.config['RATE_LIMIT_BURST'], app.config['SHED_QUEUE_DEPTH'])
+
+services.register('pdf_processor', _create_pdf_processor)
+services.register('skill_database', _create_skill_database)
+services.register('resume_analyzer', _create_resume_analyzer)
+services.register('resume_store', _create_resume_store)
+services.register('candidate_ranker', _create_candidate_ranker)
+services.register('resume_index', _create_resume_index)
+services.register('admission', _create_admission)
+
+def __getattr__(name):
+    """Module-level access to the services (app.resume_analyzer and the like)"""
+    if name in services:
+        return services.get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# The skills database response is serialized and compressed once per taxonomy version
+skills_database_response = VersionedResponseCache(
+    lambda: app.json.dumps_bytes({'success': True, 'skills': services.skill_database.get_all_skills()}),
+    max_age=app.config['SKILLS_DATABASE_MAX_AGE']
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Exercises the local analysis paths during warm-up; never sent to the LLM or stored
+WARM_UP_RESUME = """Experience
+Senior Software Engineer, 2019 - Present. 5+ years building Python, Flask and React services on AWS with Docker.
+Skills
+Python, JavaScript, SQL, Git, Kubernetes, Leadership, Communication"""
+
+def warm_up():
+    """
+    Build everything that is otherwise created lazily on first traffic
+    
+    Called by wsgi.py before the server forks its workers, so the services,
+    skills indexes, search engine, learning-path graph, prepared responses
+    and first-use regex caches are built once and shared copy-on-write.
+    """
+    services.create_all()
+    # PDFProcessor imports PyPDF2 on first use; import it before the fork too
+    import PyPDF2
+    
+    skill_database = services.skill_database
+    skill_database.get_records()
+    skill_database.search_engine
+    skill_database.learning_graph
+    
+    text = services.pdf_processor._clean_text(WARM_UP_RESUME)
+    services.resume_analyzer._extract_basic_skills(text)
+    services.resume_analyzer._analyze_experience_indicators(text)
+    
+    client = app.test_client()
+    for path in ('/health', '/api/skills-database', '/api/skills/search?q=py'):
+        response = client.get(path, headers={'Accept-Encoding': 'gzip'})
+        if response.status_code != 200:
+            logger.warning(f"Warm-up request {path} returned {response.status_code}")
+    logger.info("Warm-up complete")
+
+@app.cli.command('build-match-corpus')
+def build_match_corpus():
+    """Snapshot BM25 statistics of the stored resumes to MATCH_CORPUS_PATH (used after a restart)"""
+    from backend.services.matching import CorpusStats
+    path = os.environ.get('MATCH_CORPUS_PATH', os.path.join('cache', 'match_corpus.json'))
+    if not path:
+        raise SystemExit("MATCH_CORPUS_PATH is empty")
+    corpus = CorpusStats.from_records(services.resume_store.iter_records())
+    corpus.save(path)
+    print(f"Wrote match corpus {corpus.version} ({corpus.document_count} resumes) to {path}")
+
+def client_id() -> str:
+    """Rate-limit identity of the caller: a configured X-API-Key, else the client address (see TRUSTED_PROXY_COUNT)"""
+    api_key = request.headers.get('X-API-Key')
+    if api_key and api_key in app.config['RATE_LIMIT_API_KEYS']:
+        return 'key:' + hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+    return f'ip:{request.remote_addr}'
+
+def too_many_requests(message: str, retry_after: int):
+    response = jsonify({'error': message, 'retry_after': retry_after})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(retry_after)
+    return response
+
+def admission_controlled(view):
+    """
+    Rate limit an expensive route per client and bound how many run at once
+    
+    Requests over the client's limit, or that find the queue full or time
+    out waiting, get 429 with Retry-After. While the queue is deep, admitted
+    requests do not queue: they skip the LLM and are answered at once from
+    local analysis only.
+    """
+    @wraps(view)
+    def admitted(*args, **kwargs):
+        admission = services.admission
+        retry_after = admission.retry_after(client_id())
+        if retry_after:
+            return too_many_requests('Rate limit exceeded. Please slow down.', retry_after)
+        
+        if admission.should_shed():
+            with services.resume_analyzer.openrouter_service.local_only():
+                response = make_response(view(*args, **kwargs))
+            response.headers['X-Analysis-Mode'] = 'local-only'
+            return response
+        try:
+            with admission.gate.slot():
+                return view(*args, **kwargs)
+        except Overloaded as e:
+            return too_many_requests('Server busy. Please retry shortly.', math.ceil(e.retry_after))
+    return admitted
+
+@app.after_request
+def compress(response):
+    """Compress JSON and page responses for clients that accept gzip or brotli"""
+    return compress_response(response, request, app.config['COMPRESS_MIN_SIZE'],
+                             app.config['COMPRESS_GZIP_LEVEL'], app.config['COMPRESS_BROTLI_QUALITY'])
+
 @app.route('/')
 def index():
     """Serve the main application page"""
@@ -58,59 +243,58 @@ def health_check():
     })
 
 @app.route('/api/analyze-resume', methods=['POST'])
+@admission_controlled
 def analyze_resume():
     """
     Main endpoint to analyze resume
-    Expects: multipart/form-data with 'resume' file
+    Expects: multipart/form-data with 'resume' file (a PDF)
     """
     try:
-        # Check if file is present
-        if 'resume' not in request.files:
+        # The body is read as a stream: bad uploads are rejected before they are fully received
+        boundary = request.mimetype_params.get('boundary')
+        if request.mimetype != 'multipart/form-data' or not boundary:
             return jsonify({'error': 'No file uploaded'}), 400
+        try:
+            upload = receive_pdf_upload(request.stream, boundary.encode('latin-1'), 'resume',
+                                        app.config['MAX_CONTENT_LENGTH'])
+        except RequestEntityTooLarge as e:
+            # Declared Content-Length above MAX_CONTENT_LENGTH: nothing was read
+            return too_large(e)
+        except UploadError as e:
+            return jsonify({'error': str(e)}), e.status_code
         
-        file = request.files['resume']
-        if file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
+        with upload:
+            logger.info(f"Processing resume: {upload.filename}")
+            # A file uploaded before is answered from its stored text, without parsing the PDF again
+            stored = services.resume_store.get_by_upload(upload.digest)
+            if stored is not None:
+                text_content = stored['text']
+            else:
+                text_content = services.pdf_processor.extract_text_from_stream(upload.file)
         
-        # Check file type
-        if not file.filename.lower().endswith('.pdf'):
-            return jsonify({'error': 'Only PDF files are supported'}), 400
+        if not text_content or len(text_content.strip()) < 50:
+            return jsonify({
+                'error': 'Unable to extract sufficient text from PDF. Please ensure the resume contains readable text.'
+            }), 400
         
-        # Save file temporarily
-        temp_dir = tempfile.mkdtemp()
-        file_path = os.path.join(temp_dir, file.filename)
-        file.save(file_path)
+        # Analyze resume using NLP
+        analysis_result = services.resume_analyzer.analyze(text_content)
         
-        try:
-            # Extract text from PDF
-            logger.info(f"Processing resume: {file.filename}")
-            text_content = pdf_processor.extract_text(file_path)
-            
-            if not text_content or len(text_content.strip()) < 50:
-                return jsonify({
-                    'error': 'Unable to extract sufficient text from PDF. Please ensure the resume contains readable text.'
-                }), 400
-            
-            # Analyze resume using NLP
-            analysis_result = resume_analyzer.analyze(text_content)
-            
-            # Clean up temporary file
-            os.remove(file_path)
-            os.rmdir(temp_dir)
-            
-            return jsonify({
-                'success': True,
-                'analysis': analysis_result,
-                'filename': file.filename
-            })
-            
-        except Exception as e:
-            # Clean up on error
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            if os.path.exists(temp_dir):
-                os.rmdir(temp_dir)
-            raise e
+        # Keep the resume server-side so follow-up requests can send its id
+        resume_id = None
+        if 'error' not in analysis_result:
+            resume_id = services.resume_store.save(text_content, analysis_result)
+            services.resume_store.remember_upload(upload.digest, resume_id)
+            services.candidate_ranker.add_stored(services.resume_store, {resume_id: analysis_result['basic_skills']})
+            services.resume_index.add_resume(resume_id, analysis_result['basic_skills'], analysis_result['experience_analysis'])
+            analysis_result['resume_id'] = resume_id
+        
+        return jsonify({
+            'success': True,
+            'analysis': analysis_result,
+            'resume_id': resume_id,
+            'filename': upload.filename
+        })
             
     except Exception as e:
         logger.error(f"Error analyzing resume: {str(e)}")
@@ -119,25 +303,35 @@ def analyze_resume():
         }), 500
 
 @app.route('/api/compare-job', methods=['POST'])
+@admission_controlled
 def compare_with_job():
     """
     Compare resume with job description
-    Expects: JSON with 'resume_text' and 'job_description'
+    Expects: JSON with 'resume_id' (or 'resume_text') and 'job_description'
     """
     try:
         data = request.get_json()
         
-        if not data or 'resume_text' not in data or 'job_description' not in data:
-            return jsonify({'error': 'Missing required fields: resume_text, job_description'}), 400
+        if not data or 'job_description' not in data or not ('resume_id' in data or 'resume_text' in data):
+            return jsonify({'error': 'Missing required fields: resume_id or resume_text, job_description'}), 400
         
-        resume_text = data['resume_text']
         job_description = data['job_description']
+        resume_skills = None
+        
+        if data.get('resume_id'):
+            record = services.resume_store.get(data['resume_id'])
+            if record is None:
+                return jsonify({'error': 'Unknown resume_id. Please analyze the resume again.'}), 404
+            resume_text = record['text']
+            resume_skills = record['basic_skills']
+        else:
+            resume_text = data.get('resume_text') or ''
         
         if not resume_text.strip() or not job_description.strip():
             return jsonify({'error': 'Resume text and job description cannot be empty'}), 400
         
         # Perform comparison analysis
-        comparison_result = resume_analyzer.compare_with_job(resume_text, job_description)
+        comparison_result = services.resume_analyzer.compare_with_job(resume_text, job_description, resume_skills)
         
         return jsonify({
             'success': True,
@@ -150,23 +344,209 @@ def compare_with_job():
             'error': f'Internal server error: {str(e)}'
         }), 500
 
+@app.route('/api/compare-jobs', methods=['POST'])
+@admission_controlled
+def compare_with_jobs():
+    """
+    Compare one resume with many job descriptions
+    Expects: JSON with 'resume_id' (or 'resume_text'), 'job_descriptions' list and optional 'top_k'
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or 'job_descriptions' not in data or not ('resume_id' in data or 'resume_text' in data):
+            return jsonify({'error': 'Missing required fields: resume_id or resume_text, job_descriptions'}), 400
+        
+        job_descriptions = data['job_descriptions']
+        if not isinstance(job_descriptions, list) or not job_descriptions:
+            return jsonify({'error': 'job_descriptions must be a non-empty list'}), 400
+        if len(job_descriptions) > app.config['MAX_BATCH_JOBS']:
+            return jsonify({'error': f"At most {app.config['MAX_BATCH_JOBS']} job descriptions per request"}), 400
+        if not all(isinstance(job, str) and job.strip() for job in job_descriptions):
+            return jsonify({'error': 'Job descriptions cannot be empty'}), 400
+        
+        resume_skills = None
+        if data.get('resume_id'):
+            record = services.resume_store.get(data['resume_id'])
+            if record is None:
+                return jsonify({'error': 'Unknown resume_id. Please analyze the resume again.'}), 404
+            resume_text = record['text']
+            resume_skills = record['basic_skills']
+        else:
+            resume_text = data.get('resume_text') or ''
+        
+        if not resume_text.strip():
+            return jsonify({'error': 'Resume text cannot be empty'}), 400
+        
+        try:
+            top_k = int(data.get('top_k', 3))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'top_k must be an integer'}), 400
+        if top_k > app.config['MAX_DETAILED_COMPARISONS']:
+            return jsonify({'error': f"top_k must be at most {app.config['MAX_DETAILED_COMPARISONS']}"}), 400
+        
+        comparison_result = services.resume_analyzer.compare_with_jobs(resume_text, job_descriptions, top_k, resume_skills)
+        
+        return jsonify({
+            'success': True,
+            'comparison': comparison_result
+        })
+    
+    except Exception as e:
+        logger.error(f"Error comparing with jobs: {str(e)}")
+        return jsonify({
+            'error': f'Internal server error: {str(e)}'
+        }), 500
+
+@app.route('/api/candidates', methods=['POST'])
+@admission_controlled
+def add_candidates():
+    """
+    Add resumes to the candidate pool used for ranking
+    Expects: JSON with 'resumes', a list of resume texts
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or not isinstance(data.get('resumes'), list) or not data['resumes']:
+            return jsonify({'error': 'Missing required field: resumes (non-empty list of resume texts)'}), 400
+        
+        resumes = data['resumes']
+        if len(resumes) > app.config['MAX_BATCH_RESUMES']:
+            return jsonify({'error': f"At most {app.config['MAX_BATCH_RESUMES']} resumes per request"}), 400
+        if not all(isinstance(text, str) and text.strip() for text in resumes):
+            return jsonify({'error': 'Resume texts cannot be empty'}), 400
+        
+        # Local feature extraction only; no LLM calls while ingesting
+        resume_ids = []
+        index_entries = []
+        stored_skills = {}
+        for resume_text in resumes:
+            features = services.resume_analyzer.extract_resume_features(resume_text)
+            resume_id = services.resume_store.save(resume_text, features)
+            resume_ids.append(resume_id)
+            index_entries.append(dict(features, resume_id=resume_id))
+            stored_skills[resume_id] = features['basic_skills']
+        services.resume_index.add_many(index_entries)
+        services.candidate_ranker.add_stored(services.resume_store, stored_skills)
+        
+        return jsonify({
+            'success': True,
+            'resume_ids': resume_ids,
+            'total_candidates': len(services.candidate_ranker)
+        })
+    
+    except Exception as e:
+        logger.error(f"Error adding candidates: {str(e)}")
+        return jsonify({
+            'error': f'Internal server error: {str(e)}'
+        }), 500
+
+@app.route('/api/rank-candidates', methods=['POST'])
+@admission_controlled
+def rank_candidates():
+    """
+    Rank all known candidates against a job description
+    Expects: JSON with 'job_description' and optional 'page', 'page_size', 'llm_review_top'
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or not isinstance(data.get('job_description'), str) or not data['job_description'].strip():
+            return jsonify({'error': 'Missing required field: job_description'}), 400
+        
+        try:
+            page = int(data.get('page', 1))
+            page_size = min(int(data.get('page_size', 50)), 500)
+            llm_review_top = int(data.get('llm_review_top', 0))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'page, page_size and llm_review_top must be integers'}), 400
+        if llm_review_top < 0:
+            return jsonify({'error': 'llm_review_top cannot be negative'}), 400
+        # Each review is an LLM call, capped like compare-jobs' top_k
+        llm_review_top = min(llm_review_top, app.config['MAX_DETAILED_COMPARISONS'])
+        
+        def lookup_text(resume_id):
+            record = services.resume_store.get(resume_id)
+            return record['text'] if record else None
+        
+        # Other workers may have stored candidates since this one last ranked
+        services.candidate_ranker.sync_from(services.resume_store)
+        ranking = services.candidate_ranker.rank(
+            data['job_description'], page, page_size, llm_review_top, lookup_text
+        )
+        
+        return jsonify({
+            'success': True,
+            'ranking': ranking
+        })
+    
+    except Exception as e:
+        logger.error(f"Error ranking candidates: {str(e)}")
+        return jsonify({
+            'error': f'Internal server error: {str(e)}'
+        }), 500
+
+@app.route('/api/search')
+def search_resumes():
+    """
+    Search analyzed resumes
+    Query parameters: 'q' boolean skill query, optional 'level', 'min_years', 'offset', 'limit'
+    """
+    try:
+        try:
+            min_years = request.args.get('min_years', type=int)
+            offset = max(0, request.args.get('offset', 0, type=int))
+            limit = min(max(1, request.args.get('limit', 50, type=int)), 500)
+            results = services.resume_index.search(
+                request.args.get('q', ''),
+                level=request.args.get('level'),
+                min_years=min_years,
+                offset=offset,
+                limit=limit
+            )
+        except QuerySyntaxError as e:
+            return jsonify({'error': f'Invalid query: {str(e)}'}), 400
+        
+        return jsonify({
+            'success': True,
+            'search': results
+        })
+    
+    except Exception as e:
+        logger.error(f"Error searching resumes: {str(e)}")
+        return jsonify({
+            'error': f'Internal server error: {str(e)}'
+        }), 500
+
 @app.route('/api/career-suggestions', methods=['POST'])
+@admission_controlled
 def get_career_suggestions():
     """
     Get career path suggestions based on resume analysis
-    Expects: JSON with 'resume_text' and 'skills_analysis'
+    Expects: JSON with 'resume_id' (or 'resume_text' and 'skills_analysis')
     """
     try:
         data = request.get_json()
         
-        if not data or 'resume_text' not in data:
-            return jsonify({'error': 'Missing required field: resume_text'}), 400
+        if not data or not ('resume_id' in data or 'resume_text' in data):
+            return jsonify({'error': 'Missing required field: resume_id or resume_text'}), 400
         
-        resume_text = data['resume_text']
-        skills_analysis = data.get('skills_analysis', {})
+        if data.get('resume_id'):
+            record = services.resume_store.get(data['resume_id'])
+            if record is None:
+                return jsonify({'error': 'Unknown resume_id. Please analyze the resume again.'}), 404
+            resume_text = record['text']
+            skills_analysis = record['skills_analysis']
+        else:
+            resume_text = data.get('resume_text') or ''
+            skills_analysis = data.get('skills_analysis') or {}
+        
+        if not resume_text.strip():
+            return jsonify({'error': 'Resume text cannot be empty'}), 400
         
         # Get career suggestions
-        suggestions = resume_analyzer.generate_career_suggestions(resume_text, skills_analysis)
+        suggestions = services.resume_analyzer.generate_career_suggestions(resume_text, skills_analysis)
         
         return jsonify({
             'success': True,
@@ -179,17 +559,83 @@ def get_career_suggestions():
             'error': f'Internal server error: {str(e)}'
         }), 500
 
+@app.route('/api/learning-gaps', methods=['POST'])
+def get_learning_gaps():
+    """
+    Missing skills per role learning path, computed locally
+    Expects: JSON with 'resume_id' (or 'skills_analysis') and optional 'roles'
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or not ('resume_id' in data or 'skills_analysis' in data):
+            return jsonify({'error': 'Missing required field: resume_id or skills_analysis'}), 400
+        
+        if data.get('resume_id'):
+            record = services.resume_store.get(data['resume_id'])
+            if record is None:
+                return jsonify({'error': 'Unknown resume_id. Please analyze the resume again.'}), 404
+            skill_analyses = [record['skills_analysis'], record['basic_skills']]
+        else:
+            if not isinstance(data.get('skills_analysis'), dict):
+                return jsonify({'error': 'skills_analysis must be an object of skill categories'}), 400
+            skill_analyses = [data['skills_analysis']]
+        
+        roles = data.get('roles')
+        if roles is not None and not isinstance(roles, list):
+            return jsonify({'error': 'roles must be a list of role names'}), 400
+        if roles is not None:
+            roles = [str(role).lower().replace(' ', '_') for role in roles]
+        
+        graph = services.skill_database.learning_graph
+        known = graph.skills_mask(*skill_analyses)
+        
+        return jsonify({
+            'success': True,
+            'roles': graph.role_gaps(known, roles),
+            'learning_priorities': graph.learning_priorities(known)
+        })
+    
+    except Exception as e:
+        logger.error(f"Error computing learning gaps: {str(e)}")
+        return jsonify({
+            'error': f'Internal server error: {str(e)}'
+        }), 500
+
 @app.route('/api/skills-database')
 def get_skills_database():
-    """Get the skills database for frontend display"""
+    """
+    Get the skills database for frontend display
+    Served from pre-serialized (and gzip/brotli-compressed) bytes with an ETag;
+    conditional requests for an unchanged taxonomy get 304 Not Modified
+    """
+    try:
+        prepared = skills_database_response.get(services.skill_database.current_version())
+        return prepared.response(request)
+    except Exception as e:
+        logger.error(f"Error retrieving skills database: {str(e)}")
+        return jsonify({
+            'error': f'Internal server error: {str(e)}'
+        }), 500
+
+@app.route('/api/skills/search')
+def search_skills():
+    """
+    Autocomplete and typo-tolerant skill search
+    Query parameters: 'q' search text, optional 'limit' (default 10, max 50)
+    """
     try:
-        skills_data = skill_database.get_all_skills()
+        query = request.args.get('q', '').strip()
+        limit = min(max(1, request.args.get('limit', 10, type=int)), 50)
+        
         return jsonify({
             'success': True,
-            'skills': skills_data
+            'query': query,
+            'results': services.skill_database.suggest(query, limit) if query else []
         })
+    
     except Exception as e:
-        logger.error(f"Error retrieving skills database: {str(e)}")
+        logger.error(f"Error searching skills: {str(e)}")
         return jsonify({
             'error': f'Internal server error: {str(e)}'
         }), 500
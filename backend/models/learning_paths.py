@@ -0,0 +1,283 @@
+"""
+Learning path graph for RealiZe
+Role learning paths and skill prerequisites resolved to canonical ids, with bitset gap computation
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from backend.models.skill_aliases import SKILL_CANONICALIZER
+
+# Role -> skills by tier; tiers are learned in this order
+ROLE_PATHS = {
+    "full_stack_developer": {
+        "essential": ["JavaScript", "React", "Node.js", "MongoDB", "Git"],
+        "recommended": ["TypeScript", "Docker", "AWS", "PostgreSQL", "GraphQL"],
+        "advanced": ["Kubernetes", "Microservices", "System Design", "Performance Optimization"]
+    },
+    "backend_developer": {
+        "essential": ["Python", "SQL", "Git", "REST APIs", "Linux"],
+        "recommended": ["Docker", "Redis", "PostgreSQL", "Message Queues", "Testing"],
+        "advanced": ["Kubernetes", "System Design", "Distributed Systems", "Performance Tuning"]
+    },
+    "frontend_developer": {
+        "essential": ["JavaScript", "HTML", "CSS", "React", "Git"],
+        "recommended": ["TypeScript", "Webpack", "Testing", "Accessibility", "Performance"],
+        "advanced": ["Advanced React", "WebAssembly", "Progressive Web Apps", "Micro-frontends"]
+    },
+    "devops_engineer": {
+        "essential": ["Linux", "Git", "Docker", "AWS", "Jenkins"],
+        "recommended": ["Kubernetes", "Terraform", "Monitoring", "Security", "CI/CD"],
+        "advanced": ["Service Mesh", "GitOps", "Cloud Architecture", "Site Reliability Engineering"]
+    },
+    "data_scientist": {
+        "essential": ["Python", "R", "SQL", "Statistics", "Machine Learning"],
+        "recommended": ["TensorFlow", "Pandas", "Data Visualization", "Big Data", "Cloud Platforms"],
+        "advanced": ["Deep Learning", "MLOps", "Advanced Statistics", "Research Methods"]
+    },
+    "mobile_developer": {
+        "essential": ["Swift", "Android Development", "iOS", "Java/Kotlin", "Git"],
+        "recommended": ["React Native", "Flutter", "Mobile UI/UX", "App Store Optimization"],
+        "advanced": ["Advanced Mobile Patterns", "Performance Optimization", "App Security"]
+    }
+}
+
+TIERS = ('essential', 'recommended', 'advanced')
+TIER_PRIORITIES = {'essential': 'High', 'recommended': 'Medium', 'advanced': 'Low'}
+TIER_WEIGHTS = {'essential': 3.0, 'recommended': 2.0, 'advanced': 1.0}
+DEMAND_RANKS = {'high': 0, 'medium': 1, 'low': 2}
+
+# Skill -> skills to learn first; knowing a skill implies knowing its prerequisites
+SKILL_PREREQUISITES = {
+    'TypeScript': ['JavaScript'],
+    'React': ['JavaScript', 'HTML', 'CSS'],
+    'Angular': ['TypeScript', 'HTML', 'CSS'],
+    'Vue.js': ['JavaScript', 'HTML', 'CSS'],
+    'Node.js': ['JavaScript'],
+    'Express.js': ['Node.js'],
+    'GraphQL': ['REST APIs'],
+    'Webpack': ['JavaScript'],
+    'Advanced React': ['React'],
+    'Progressive Web Apps': ['JavaScript'],
+    'Micro-frontends': ['React'],
+    'React Native': ['React'],
+    'Flutter': ['Dart'],
+    'Django': ['Python'],
+    'Flask': ['Python'],
+    'Spring': ['Java'],
+    'Ruby on Rails': ['Ruby'],
+    'Laravel': ['PHP'],
+    'ASP.NET': ['C#'],
+    'PostgreSQL': ['SQL'],
+    'MySQL': ['SQL'],
+    'Pandas': ['Python'],
+    'NumPy': ['Python'],
+    'Machine Learning': ['Python', 'Statistics'],
+    'TensorFlow': ['Machine Learning'],
+    'PyTorch': ['Machine Learning'],
+    'Deep Learning': ['Machine Learning'],
+    'Advanced Statistics': ['Statistics'],
+    'MLOps': ['Machine Learning', 'Docker'],
+    'Docker': ['Linux'],
+    'Kubernetes': ['Docker'],
+    'Jenkins': ['Git'],
+    'CI/CD': ['Git'],
+    'GitOps': ['Kubernetes', 'Git'],
+    'Service Mesh': ['Kubernetes'],
+    'Terraform': ['Cloud Platforms'],
+    'Cloud Architecture': ['Cloud Platforms'],
+    'AWS': ['Linux'],
+    'Microservices': ['REST APIs', 'Docker'],
+    'Distributed Systems': ['System Design'],
+    'Site Reliability Engineering': ['Monitoring', 'Linux']
+}
+
+class RolePath(NamedTuple):
+    """One role resolved to bitsets over the graph's skills"""
+    key: str
+    title: str
+    tier_masks: Tuple[int, ...]
+    required: int
+    order: Tuple[Tuple[int, str], ...]
+
+class LearningPathGraph:
+    """
+    Skill prerequisite graph and role learning paths, built once
+    
+    Every skill named in a path or prerequisite gets one bit, keyed by its
+    canonical id. A role is a bitmask per tier (including the prerequisites
+    of its skills) and a candidate is the bitmask of their skills plus
+    everything those skills imply, so a gap is a single `required & ~known`.
+    """
+    
+    def __init__(self, role_paths: Optional[Dict[str, Dict[str, List[str]]]] = None,
+                 prerequisites: Optional[Dict[str, List[str]]] = None,
+                 demand_levels: Optional[Dict[str, str]] = None):
+        role_paths = ROLE_PATHS if role_paths is None else role_paths
+        prerequisites = SKILL_PREREQUISITES if prerequisites is None else prerequisites
+        self.skill_ids = []
+        self._bits = {}
+        
+        edges = {}
+        for skill, required in prerequisites.items():
+            edges[self._bit(skill)] = [self._bit(name) for name in required]
+        for path in role_paths.values():
+            for tier in TIERS:
+                for skill in path.get(tier, []):
+                    self._bit(skill)
+        
+        self.names = [SKILL_CANONICALIZER.canonical_name(skill_id) for skill_id in self.skill_ids]
+        self.demand_ranks = [3] * len(self.skill_ids)
+        for name, level in (demand_levels or {}).items():
+            skill_id = SKILL_CANONICALIZER.lookup(name)
+            if skill_id in self._bits:
+                self.demand_ranks[self._bits[skill_id]] = DEMAND_RANKS.get(str(level).lower(), 3)
+        
+        self.closures, self.depths = self._close(edges)
+        self.roles = {key: self._resolve_role(key, path) for key, path in role_paths.items()}
+    
+    def _bit(self, name: str) -> int:
+        skill_id = SKILL_CANONICALIZER.canonical_id(name)
+        bit = self._bits.get(skill_id)
+        if bit is None:
+            bit = self._bits[skill_id] = len(self.skill_ids)
+            self.skill_ids.append(skill_id)
+        return bit
+    
+    def _close(self, edges: Dict[int, List[int]]) -> Tuple[List[int], List[int]]:
+        """Transitive prerequisite mask and depth (longest chain below) of every skill"""
+        closures = [None] * len(self.skill_ids)
+        depths = [0] * len(self.skill_ids)
+        visiting = set()
+        
+        def visit(bit: int):
+            if closures[bit] is not None:
+                return
+            if bit in visiting:
+                raise ValueError(f"Prerequisite cycle through '{self.names[bit]}'")
+            visiting.add(bit)
+            mask = 0
+            for required in edges.get(bit, []):
+                visit(required)
+                mask |= (1 << required) | closures[required]
+                depths[bit] = max(depths[bit], depths[required] + 1)
+            visiting.discard(bit)
+            closures[bit] = mask
+        
+        for bit in range(len(self.skill_ids)):
+            visit(bit)
+        return closures, depths
+    
+    def _resolve_role(self, key: str, path: Dict[str, List[str]]) -> RolePath:
+        tier_masks = []
+        covered = 0
+        for tier in TIERS:
+            mask = 0
+            for skill in path.get(tier, []):
+                bit = self._bits[SKILL_CANONICALIZER.canonical_id(skill)]
+                mask |= (1 << bit) | self.closures[bit]
+            # A prerequisite belongs to the earliest tier that needs it
+            mask &= ~covered
+            covered |= mask
+            tier_masks.append(mask)
+        
+        order = []
+        for tier, mask in zip(TIERS, tier_masks):
+            bits = [bit for bit in range(len(self.skill_ids)) if mask >> bit & 1]
+            bits.sort(key=lambda bit: (self.depths[bit], self.demand_ranks[bit], self.names[bit].lower()))
+            order.extend((bit, tier) for bit in bits)
+        return RolePath(key, key.replace('_', ' ').title(), tuple(tier_masks), covered, tuple(order))
+    
+    def known_mask(self, names: Iterable[str]) -> int:
+        """Bitmask of the given skills and everything they imply; unknown names are ignored"""
+        mask = 0
+        for name in names:
+            bit = self._bits.get(SKILL_CANONICALIZER.lookup(name))
+            if bit is not None:
+                mask |= (1 << bit) | self.closures[bit]
+        return mask
+    
+    def skills_mask(self, *skill_analyses: Dict[str, Any]) -> int:
+        """known_mask of one or more extracted skills dictionaries (category -> list of skills)"""
+        return self.known_mask(
+            skill['name'] if isinstance(skill, dict) else skill
+            for analysis in skill_analyses
+            for skill_list in analysis.values() if isinstance(skill_list, list)
+            for skill in skill_list
+            if isinstance(skill, str) or (isinstance(skill, dict) and isinstance(skill.get('name'), str))
+        )
+    
+    def gaps(self, role: str, known: int) -> List[Dict[str, Any]]:
+        """
+        Missing skills of one role, in learning order
+        
+        Args:
+            role: Role key, e.g. 'devops_engineer'
+            known: Bitmask from known_mask / skills_mask
+        
+        Returns:
+            Skills by tier, prerequisites before the skills that need them
+        """
+        path = self.roles[role]
+        missing = path.required & ~known
+        return [
+            {
+                'skill': self.names[bit],
+                'tier': tier,
+                'priority': TIER_PRIORITIES[tier],
+                'missing_prerequisites': [
+                    self.names[required] for required, _ in path.order
+                    if (missing & self.closures[bit]) >> required & 1
+                ]
+            }
+            for bit, tier in path.order if missing >> bit & 1
+        ]
+    
+    def coverage(self, role: str, known: int) -> float:
+        """Share (0-100) of a role's skills, prerequisites included, that are known"""
+        required = self.roles[role].required
+        # bin().count rather than int.bit_count, which needs Python 3.10
+        return 100.0 * bin(required & known).count('1') / bin(required).count('1') if required else 0.0
+    
+    def role_gaps(self, known: int, roles: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Coverage and gaps for many roles at once (all roles by default)"""
+        return {
+            role: {
+                'title': self.roles[role].title,
+                'coverage': round(self.coverage(role, known), 1),
+                'gaps': self.gaps(role, known)
+            }
+            for role in (self.roles if roles is None else roles) if role in self.roles
+        }
+    
+    def learning_priorities(self, known: int, limit: int = 5) -> List[Dict[str, str]]:
+        """
+        Missing skills ranked across every role
+        
+        A skill scores by how many roles need it and at which tier; market
+        demand and prerequisite depth break ties.
+        """
+        scores = {}
+        needed_by = {}
+        for path in self.roles.values():
+            for tier, mask in zip(TIERS, path.tier_masks):
+                missing = mask & ~known
+                while missing:
+                    low = missing & -missing
+                    bit = low.bit_length() - 1
+                    missing ^= low
+                    scores[bit] = scores.get(bit, 0.0) + TIER_WEIGHTS[tier]
+                    needed_by.setdefault(bit, []).append(path.title)
+        
+        ranked = sorted(scores, key=lambda bit: (-scores[bit], self.demand_ranks[bit], self.depths[bit],
+                                                  self.names[bit].lower()))
+        priorities = []
+        for bit in ranked[:limit]:
+            roles = needed_by[bit]
+            score = scores[bit]
+            priority = 'High' if score >= 6 else 'Medium' if score >= 3 else 'Low'
+            reason = f"Needed for {', '.join(roles[:3])}" + (f" and {len(roles) - 3} more roles" if len(roles) > 3 else '')
+            if self.demand_ranks[bit] == 0:
+                reason += '; high market demand'
+            priorities.append({'area': self.names[bit], 'priority': priority, 'reason': reason})
+        return priorities
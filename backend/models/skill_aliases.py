@@ -0,0 +1,170 @@
+"""
+Skill name canonicalization for RealiZe
+Alias table and surface form -> canonical skill id map shared by extractors and comparators
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+# Canonical skill name (as in the SkillDatabase) -> other names used for it
+SKILL_ALIASES = {
+    'JavaScript': ['JS', 'ECMAScript', 'ES6'],
+    'TypeScript': ['TS'],
+    'C#': ['CSharp', 'C Sharp'],
+    'C++': ['CPP'],
+    'Go': ['Golang'],
+    'Vue.js': ['Vue', 'VueJS', 'Vue JS'],
+    'React': ['ReactJS', 'React.js'],
+    'Angular': ['AngularJS', 'Angular.js'],
+    'Express.js': ['Express', 'ExpressJS'],
+    'Node.js': ['Node', 'NodeJS', 'Node JS'],
+    'ASP.NET': ['.NET', 'ASPNET', 'ASP.NET Core', '.NET Core', 'DotNet'],
+    'Spring': ['Spring Boot', 'SpringBoot'],
+    'Ruby on Rails': ['Rails', 'RoR'],
+    'Tailwind CSS': ['Tailwind', 'TailwindCSS'],
+    'PostgreSQL': ['Postgres', 'Postgre'],
+    'Microsoft SQL Server': ['SQL Server', 'MSSQL', 'MS SQL'],
+    'MongoDB': ['Mongo'],
+    'Elasticsearch': ['Elastic Search'],
+    'AWS': ['Amazon Web Services'],
+    'Microsoft Azure': ['Azure', 'MS Azure'],
+    'Google Cloud Platform': ['GCP', 'Google Cloud'],
+    'Kubernetes': ['K8s', 'Kube'],
+    'GitLab CI/CD': ['GitLab CI'],
+    'VS Code': ['Visual Studio Code', 'VSCode'],
+    'IntelliJ IDEA': ['IntelliJ'],
+    'Swagger/OpenAPI': ['Swagger', 'OpenAPI'],
+    'scikit-learn': ['sklearn', 'scikit learn'],
+    'Project Management Professional (PMP)': ['PMP'],
+    'Certified Information Systems Security Professional (CISSP)': ['CISSP'],
+    'Certified Business Analysis Professional (CBAP)': ['CBAP'],
+    'Certified Kubernetes Administrator': ['CKA'],
+    'Problem Solving': ['Problem-Solving'],
+    'Teamwork': ['Team Work']
+}
+
+_SEPARATOR_PATTERN = re.compile(r'[\s_]+')
+
+def normalize_skill_name(name: str) -> str:
+    """Lookup form of a skill name: lowercased, trimmed, whitespace collapsed"""
+    return _SEPARATOR_PATTERN.sub(' ', name.strip().lower())
+
+class SkillCanonicalizer:
+    """
+    Maps any surface form of a skill to a small integer id
+    
+    Aliases resolve to the id of their canonical name. Only the alias table
+    and taxonomy / keyword names are registered (canonical_id); request data
+    such as skill names from the LLM is only looked up, so the registry stays
+    bounded and the same in every worker. Ids are not meant to be persisted.
+    """
+    
+    def __init__(self, aliases: Optional[Dict[str, List[str]]] = None):
+        self._names = []
+        self._ids = {}
+        self._lock = threading.Lock()
+        for canonical, alias_names in (SKILL_ALIASES if aliases is None else aliases).items():
+            skill_id = self.canonical_id(canonical)
+            for alias in alias_names:
+                self._ids.setdefault(normalize_skill_name(alias), skill_id)
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def lookup(self, name: str) -> Optional[int]:
+        """Canonical id of a known surface form, without registering new names"""
+        skill_id = self._ids.get(name)
+        if skill_id is None:
+            skill_id = self._ids.get(normalize_skill_name(name))
+        return skill_id
+    
+    def canonical_id(self, name: str) -> int:
+        """Canonical id of a surface form, registering it if it is new (taxonomy and keyword names only)"""
+        skill_id = self.lookup(name)
+        if skill_id is None:
+            key = normalize_skill_name(name)
+            with self._lock:
+                skill_id = self._ids.get(key)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    self._names.append(name.strip())
+                    self._ids[key] = skill_id
+            # Exact surface forms skip normalization on the next lookup
+            self._ids.setdefault(name, skill_id)
+        return skill_id
+    
+    def canonical_name(self, name_or_id) -> str:
+        """Display name of the canonical skill for an id or any surface form; unknown names are returned trimmed"""
+        skill_id = name_or_id if isinstance(name_or_id, int) else self.lookup(name_or_id)
+        if skill_id is None:
+            return name_or_id.strip()
+        return self._names[skill_id]
+    
+    def ids(self, names: Iterable[str]) -> List[int]:
+        return [self.canonical_id(name) for name in names]
+    
+    def skill_mentions(self, skills: Dict[str, Any]) -> Dict[Union[int, str], int]:
+        """
+        Canonical id (or normalized name, for unregistered skills) -> mentions for an extracted skills dictionary
+        
+        Args:
+            skills: Category -> list of {'name', 'mentions', ...} dictionaries
+        
+        Returns:
+            Mentions per skill; aliases of one skill keep the highest count
+        """
+        mentions = {}
+        for skill_list in skills.values():
+            if not isinstance(skill_list, list):
+                continue
+            for skill in skill_list:
+                if isinstance(skill, dict) and isinstance(skill.get('name'), str):
+                    skill_id = self.lookup(skill['name'])
+                    if skill_id is None:
+                        skill_id = normalize_skill_name(skill['name'])
+                    count = skill.get('mentions', 1)
+                    if skill_id not in mentions or count > mentions[skill_id]:
+                        mentions[skill_id] = count
+        return mentions
+    
+    def canonicalize_skills(self, skills: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy of a skill analysis with every skill under its canonical name
+        
+        Entries that turn out to be aliases of one skill within a category are
+        merged, keeping the first entry and the highest mention count. Names
+        not in the registry are kept as they are (and not registered).
+        Non-list values (scores, notes) are copied unchanged.
+        """
+        result = {}
+        for category, skill_list in skills.items():
+            if not isinstance(skill_list, list):
+                result[category] = skill_list
+                continue
+            merged = {}
+            for skill in skill_list:
+                if isinstance(skill, dict) and isinstance(skill.get('name'), str):
+                    name = skill['name']
+                elif isinstance(skill, str):
+                    name = skill
+                else:
+                    merged[('raw', len(merged))] = skill
+                    continue
+                skill_id = self.lookup(name)
+                if skill_id is None:
+                    key = ('name', normalize_skill_name(name))
+                else:
+                    key, name = skill_id, self._names[skill_id]
+                entry = dict(skill, name=name) if isinstance(skill, dict) else name
+                previous = merged.get(key)
+                if previous is None:
+                    merged[key] = entry
+                elif isinstance(previous, dict) and isinstance(entry, dict):
+                    previous['mentions'] = max(previous.get('mentions', 1), entry.get('mentions', 1))
+            result[category] = list(merged.values())
+        return result
+
+# Shared instance: every extractor and comparator has to agree on the ids
+SKILL_CANONICALIZER = SkillCanonicalizer()
@@ -4,15 +4,265 @@ Contains comprehensive IT skills categories and proficiency levels
 Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
 """
 
-from typing import Dict, List, Any
-import json
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Callable, Dict, List, Any, NamedTuple, Optional, Tuple
+import logging
 import os
+import threading
+import time
+
+from backend.models.learning_paths import ROLE_PATHS, LearningPathGraph
+from backend.models.skill_aliases import SKILL_CANONICALIZER
+from backend.models.skill_search import SkillSearchEngine
+from backend.models.skill_taxonomy import TaxonomyError, file_signature, load_taxonomy, save_taxonomy, validate_skills_data
+from backend.utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+class SkillRecord(NamedTuple):
+    """Immutable entry of the skills database"""
+    name: str
+    group: str
+    category: str
+    demand: Optional[str]
+    learning_difficulty: Optional[str]
+    
+    def to_dict(self) -> Dict[str, str]:
+        """The skill in the shape used by the JSON database"""
+        skill = {'name': self.name, 'category': self.category}
+        if self.demand is not None:
+            skill['demand'] = self.demand
+        if self.learning_difficulty is not None:
+            skill['learning_difficulty'] = self.learning_difficulty
+        return skill
+
+class SkillIndex:
+    """
+    Immutable snapshot of one loaded taxonomy and its lookup indexes
+    
+    Name, lowercased name, canonical skill id, group, category, demand and
+    difficulty lookups become dict hits; substring search runs str.find over
+    one packed string instead of looping over every skill in Python. A reload
+    builds a new snapshot and swaps it in, so readers never see a mix of two.
+    """
+    
+    def __init__(self, skills_data: Dict[str, Any], version: int = 0):
+        self.skills_data = skills_data
+        self.version = version
+        records = []
+        by_name = {}
+        by_lower_name = defaultdict(list)
+        by_canonical_id = {}
+        by_group = defaultdict(list)
+        by_category = defaultdict(list)
+        by_demand = defaultdict(list)
+        by_difficulty = defaultdict(list)
+        for group, category_data in skills_data.items():
+            group_records = by_group[group]
+            for skill in category_data.get('skills', []):
+                name = skill['name']
+                category = skill.get('category', '')
+                demand = skill.get('demand')
+                difficulty = skill.get('learning_difficulty')
+                record = SkillRecord(name, group, category, demand, difficulty)
+                records.append(record)
+                group_records.append(record)
+                by_name.setdefault(name, record)
+                by_lower_name[name.lower()].append(record)
+                by_canonical_id.setdefault(SKILL_CANONICALIZER.canonical_id(name), record)
+                by_category[category.lower()].append(record)
+                if demand:
+                    by_demand[demand.lower()].append(record)
+                if difficulty:
+                    by_difficulty[difficulty.lower()].append(record)
+        
+        freeze = lambda index: {key: tuple(values) for key, values in index.items()}
+        self.records = tuple(records)
+        self.by_name = by_name
+        self.by_lower_name = freeze(by_lower_name)
+        self.by_canonical_id = by_canonical_id
+        self.by_group = freeze(by_group)
+        self.by_category = freeze(by_category)
+        self.by_demand = freeze(by_demand)
+        self.by_difficulty = freeze(by_difficulty)
+        
+        # One line per record: "name\tcategory\n"; line starts map a hit back to its record
+        lines = [f"{record.name.lower()}\t{record.category.lower()}\n" for record in records]
+        offsets = []
+        position = 0
+        for line in lines:
+            offsets.append(position)
+            position += len(line)
+        self.search_text = ''.join(lines)
+        self.search_offsets = offsets
+        self.search_cache = LRUCache(256)
+        self._search_engine = None
+        self._learning_graph = None
+        self._engine_lock = threading.Lock()
+    
+    @property
+    def search_engine(self) -> SkillSearchEngine:
+        """Autocomplete / fuzzy search engine, built on first use"""
+        engine = self._search_engine
+        if engine is None:
+            with self._engine_lock:
+                if self._search_engine is None:
+                    self._search_engine = SkillSearchEngine(
+                        [record.name for record in self.records],
+                        [record.demand for record in self.records]
+                    )
+                engine = self._search_engine
+        return engine
+    
+    @property
+    def learning_graph(self) -> LearningPathGraph:
+        """Role learning paths ranked with this snapshot's demand levels, built on first use"""
+        graph = self._learning_graph
+        if graph is None:
+            with self._engine_lock:
+                if self._learning_graph is None:
+                    self._learning_graph = LearningPathGraph(demand_levels={
+                        record.name: record.demand for record in self.records if record.demand is not None
+                    })
+                graph = self._learning_graph
+        return graph
 
 class SkillDatabase:
-    """Manages comprehensive skills database for IT professionals"""
+    """
+    Manages comprehensive skills database for IT professionals
+    
+    The taxonomy comes from the built-in database, a skills_data dict, or a
+    JSON / SQLite file (SKILL_TAXONOMY_PATH). It is loaded on first use; a
+    file source is checked for changes at most every reload_interval seconds
+    and reloaded in a background thread, and the rebuilt SkillIndex is
+    swapped in atomically. `version` counts the swaps.
+    """
+    
+    def __init__(self, skills_data: Optional[Dict[str, Any]] = None, path: Optional[str] = None,
+                 reload_interval: Optional[float] = None):
+        if path is None and skills_data is None:
+            path = os.environ.get('SKILL_TAXONOMY_PATH') or None
+        if reload_interval is None:
+            reload_interval = float(os.environ.get('SKILL_TAXONOMY_RELOAD_INTERVAL', 5))
+        if skills_data is not None:
+            validate_skills_data(skills_data)
+        self.path = path
+        self.reload_interval = reload_interval
+        self.version = 0
+        self._source_data = skills_data
+        self._current = None
+        self._signature = None
+        self._next_check = 0.0
+        self._load_lock = threading.RLock()
+        self._reload_thread = None
+        self._listeners = []
+    
+    @property
+    def _index(self) -> SkillIndex:
+        """The current snapshot, loading it on first use and polling the file source"""
+        index = self._current
+        if index is None:
+            with self._load_lock:
+                if self._current is None:
+                    self._install(self._build_index())
+                index = self._current
+        elif self.path and self.reload_interval > 0 and time.monotonic() >= self._next_check:
+            self.check_for_updates()
+        return index
+    
+    @property
+    def skills_data(self) -> Dict[str, Any]:
+        return self._index.skills_data
+    
+    def _read_source(self) -> Tuple[Dict[str, Any], Optional[Tuple[int, int]]]:
+        """Taxonomy data and file signature of the configured source"""
+        if self.path:
+            signature = file_signature(self.path)
+            try:
+                return load_taxonomy(self.path), signature
+            except TaxonomyError as e:
+                if self._current is not None:
+                    raise
+                # Nothing loaded yet: serve the built-in database rather than nothing
+                logger.error(f"{e}; using the built-in skills database")
+                return self._initialize_skills_database(), signature
+        if self._source_data is not None:
+            return self._source_data, None
+        return self._initialize_skills_database(), None
+    
+    def _build_index(self) -> Tuple[SkillIndex, Optional[Tuple[int, int]]]:
+        data, signature = self._read_source()
+        return SkillIndex(data), signature
+    
+    def _install(self, built: Tuple[SkillIndex, Optional[Tuple[int, int]]]):
+        """Swap in a new snapshot (caller holds _load_lock) and notify listeners"""
+        index, signature = built
+        self.version += 1
+        index.version = self.version
+        self._signature = signature
+        self._next_check = time.monotonic() + self.reload_interval
+        self._current = index
+        for listener in list(self._listeners):
+            try:
+                listener(self)
+            except Exception as e:
+                logger.error(f"Skills database reload listener failed: {str(e)}")
+    
+    def add_reload_listener(self, listener: Callable[['SkillDatabase'], None]):
+        """Call listener(database) after every load or reload of the taxonomy"""
+        self._listeners.append(listener)
+    
+    def reload(self, wait: bool = True) -> bool:
+        """
+        Rebuild the indexes from the source and swap them in
+        
+        Args:
+            wait: Rebuild in the calling thread; otherwise start a background
+                  rebuild (at most one at a time) and return immediately
+        
+        Returns:
+            False if the source was invalid (the previous snapshot stays active)
+            or a background reload is already running
+        """
+        if not wait:
+            with self._load_lock:
+                if self._reload_thread is not None and self._reload_thread.is_alive():
+                    return False
+                self._reload_thread = threading.Thread(target=self.reload, name='skill-taxonomy-reload', daemon=True)
+                self._reload_thread.start()
+            return True
+        
+        try:
+            index, signature = self._build_index()
+        except TaxonomyError as e:
+            logger.error(f"Skills database reload failed: {e}")
+            # Do not retry the same broken file on every poll
+            self._signature = file_signature(self.path)
+            return False
+        
+        previous = self._current
+        if previous is not None and previous._search_engine is not None:
+            # Warm the replacement so no request pays for building it
+            index.search_engine
+        with self._load_lock:
+            self._install((index, signature))
+        logger.info(f"Skills database reloaded: {len(index.records)} skills (version {self.version})")
+        return True
+    
+    def check_for_updates(self) -> bool:
+        """Start a background reload if the taxonomy file changed; True if one was started"""
+        self._next_check = time.monotonic() + self.reload_interval
+        if not self.path or file_signature(self.path) == self._signature:
+            return False
+        return self.reload(wait=False)
+    
+    def current_version(self) -> int:
+        """Version of the active snapshot (loads it, and polls the file source, if due)"""
+        return self._index.version
     
-    def __init__(self):
-        self.skills_data = self._initialize_skills_database()
+    def __len__(self) -> int:
+        return len(self._index.records)
     
     def _initialize_skills_database(self) -> Dict[str, Any]:
         """Initialize the comprehensive skills database"""
@@ -169,96 +419,168 @@ class SkillDatabase:
         """Get all skills data"""
         return self.skills_data
     
-    def get_skills_by_category(self, category: str) -> List[Dict[str, str]]:
+    def get_records(self) -> Tuple[SkillRecord, ...]:
+        """All skills as immutable records, in database order"""
+        return self._index.records
+    
+    def get_skill(self, name: str) -> Optional[SkillRecord]:
+        """Look up one skill by exact or case-insensitive name, or by an alias ('Vue', 'K8s')"""
+        index = self._index
+        record = index.by_name.get(name)
+        if record is None:
+            matches = index.by_lower_name.get(name.lower())
+            record = matches[0] if matches else index.by_canonical_id.get(SKILL_CANONICALIZER.lookup(name))
+        return record
+    
+    def get_skills_by_category(self, category: str) -> Tuple[SkillRecord, ...]:
         """Get skills for a specific category"""
-        if category in self.skills_data:
-            return self.skills_data[category]['skills']
-        return []
+        return self._index.by_group.get(category, ())
+    
+    def get_skills_by_subcategory(self, category: str) -> Tuple[SkillRecord, ...]:
+        """Get skills by their category label (e.g. Backend, Cloud)"""
+        return self._index.by_category.get(category.lower(), ())
+    
+    def get_skills_by_difficulty(self, difficulty: str) -> Tuple[SkillRecord, ...]:
+        """Get skills by learning difficulty (Easy, Medium, Hard)"""
+        return self._index.by_difficulty.get(difficulty.lower(), ())
     
-    def search_skills(self, query: str) -> List[Dict[str, str]]:
-        """Search skills by name or category"""
-        results = []
+    def search_skills(self, query: str) -> Tuple[SkillRecord, ...]:
+        """Search skills by name or category (substring match, database order)"""
         query_lower = query.lower()
+        if '\t' in query_lower or '\n' in query_lower:
+            return ()
         
-        for category_data in self.skills_data.values():
-            for skill in category_data['skills']:
-                if (query_lower in skill['name'].lower() or 
-                    query_lower in skill.get('category', '').lower()):
-                    results.append(skill)
+        index = self._index
+        cached = index.search_cache.get(query_lower)
+        if cached is not None:
+            return cached
         
-        return results
+        hits = []
+        last_row = -1
+        text = index.search_text
+        offsets = index.search_offsets
+        position = text.find(query_lower)
+        while position != -1:
+            row = bisect_right(offsets, position) - 1
+            if row != last_row:
+                hits.append(index.records[row])
+                last_row = row
+            # Continue after this record's line
+            next_row = row + 1
+            position = text.find(query_lower, offsets[next_row]) if next_row < len(index.records) else -1
+        
+        result = tuple(hits)
+        index.search_cache.set(query_lower, result)
+        return result
     
-    def get_skills_by_demand(self, demand_level: str) -> List[Dict[str, str]]:
-        """Get skills by demand level (High, Medium, Low)"""
-        results = []
+    @property
+    def search_engine(self) -> SkillSearchEngine:
+        """Autocomplete / fuzzy search engine of the current snapshot"""
+        return self._index.search_engine
+    
+    def autocomplete(self, prefix: str, limit: int = 10) -> Tuple[SkillRecord, ...]:
+        """Skills whose name, or a word in it, starts with the prefix (ranked)"""
+        index = self._index
+        return tuple(index.records[record_id] for record_id in index.search_engine.autocomplete(prefix, limit))
+    
+    def fuzzy_search(self, query: str, limit: int = 10,
+                     max_distance: Optional[int] = None) -> List[Tuple[SkillRecord, int]]:
+        """Typo-tolerant search returning (record, edit distance) pairs, best first"""
+        index = self._index
+        return [
+            (index.records[record_id], distance)
+            for record_id, distance in index.search_engine.fuzzy(query, limit, max_distance)
+        ]
+    
+    def suggest(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Ranked top-K suggestions for a search box
         
-        for category_data in self.skills_data.values():
-            for skill in category_data['skills']:
-                if skill.get('demand', '').lower() == demand_level.lower():
-                    results.append(skill)
+        Prefix matches come first; typo-tolerant matches fill the remaining
+        slots, so 'kube' and 'kubernets' both find Kubernetes.
         
-        return results
+        Returns:
+            Skill dictionaries with 'match' ('prefix' or 'fuzzy') and 'distance'
+        """
+        suggestions = []
+        seen = set()
+        for record in self.autocomplete(query, limit):
+            seen.add(record)
+            suggestions.append(dict(record.to_dict(), match='prefix', distance=0))
+        if len(suggestions) < limit:
+            for record, distance in self.fuzzy_search(query, limit):
+                if record not in seen and len(suggestions) < limit:
+                    seen.add(record)
+                    suggestions.append(dict(record.to_dict(), match='fuzzy', distance=distance))
+        return suggestions
+    
+    def get_skills_by_demand(self, demand_level: str) -> Tuple[SkillRecord, ...]:
+        """Get skills by demand level (High, Medium, Low)"""
+        return self._index.by_demand.get(demand_level.lower(), ())
     
-    def get_popular_skills(self, limit: int = 20) -> List[Dict[str, str]]:
+    def get_popular_skills(self, limit: int = 20) -> Tuple[SkillRecord, ...]:
         """Get most popular skills (high demand)"""
-        high_demand_skills = self.get_skills_by_demand('High')
-        return high_demand_skills[:limit]
+        return self._index.by_demand.get('high', ())[:limit]
     
-    def get_learning_path(self, target_role: str) -> Dict[str, Any]:
-        """Get recommended learning path for a target role"""
-        learning_paths = {
-            "full_stack_developer": {
-                "essential": ["JavaScript", "React", "Node.js", "MongoDB", "Git"],
-                "recommended": ["TypeScript", "Docker", "AWS", "PostgreSQL", "GraphQL"],
-                "advanced": ["Kubernetes", "Microservices", "System Design", "Performance Optimization"]
-            },
-            "backend_developer": {
-                "essential": ["Python", "SQL", "Git", "REST APIs", "Linux"],
-                "recommended": ["Docker", "Redis", "PostgreSQL", "Message Queues", "Testing"],
-                "advanced": ["Kubernetes", "System Design", "Distributed Systems", "Performance Tuning"]
-            },
-            "frontend_developer": {
-                "essential": ["JavaScript", "HTML", "CSS", "React", "Git"],
-                "recommended": ["TypeScript", "Webpack", "Testing", "Accessibility", "Performance"],
-                "advanced": ["Advanced React", "WebAssembly", "Progressive Web Apps", "Micro-frontends"]
-            },
-            "devops_engineer": {
-                "essential": ["Linux", "Git", "Docker", "AWS", "Jenkins"],
-                "recommended": ["Kubernetes", "Terraform", "Monitoring", "Security", "CI/CD"],
-                "advanced": ["Service Mesh", "GitOps", "Cloud Architecture", "Site Reliability Engineering"]
-            },
-            "data_scientist": {
-                "essential": ["Python", "R", "SQL", "Statistics", "Machine Learning"],
-                "recommended": ["TensorFlow", "Pandas", "Data Visualization", "Big Data", "Cloud Platforms"],
-                "advanced": ["Deep Learning", "MLOps", "Advanced Statistics", "Research Methods"]
-            },
-            "mobile_developer": {
-                "essential": ["Swift", "Android Development", "iOS", "Java/Kotlin", "Git"],
-                "recommended": ["React Native", "Flutter", "Mobile UI/UX", "App Store Optimization"],
-                "advanced": ["Advanced Mobile Patterns", "Performance Optimization", "App Security"]
-            }
+    def get_demand_levels(self) -> Dict[str, str]:
+        """Get a mapping of skill name to demand level"""
+        return {
+            record.name: record.demand
+            for record in self._index.records
+            if record.demand is not None
         }
+    
+    def get_learning_path(self, target_role: str) -> Dict[str, Any]:
+        """Get recommended learning path for a target role (a copy; ROLE_PATHS is shared)"""
+        path = ROLE_PATHS.get(target_role.lower().replace(" ", "_"), {})
+        return {tier: list(skills) for tier, skills in path.items()}
+    
+    @property
+    def learning_graph(self) -> LearningPathGraph:
+        """Prerequisite graph and role paths of the current snapshot"""
+        return self._index.learning_graph
+    
+    def get_learning_gaps(self, *skill_analyses: Dict[str, Any],
+                          roles: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Missing skills per role for a candidate
         
-        return learning_paths.get(target_role.lower().replace(" ", "_"), {})
+        Args:
+            skill_analyses: Extracted skills dictionaries (category -> list of skills)
+            roles: Role keys such as 'devops_engineer' (default: every role)
+        
+        Returns:
+            Role -> title, coverage (0-100) and gaps in learning order
+        """
+        graph = self.learning_graph
+        return graph.role_gaps(graph.skills_mask(*skill_analyses), roles)
     
     def save_skills_to_file(self, filename: str):
-        """Save skills database to JSON file"""
+        """Save skills database to a JSON or SQLite (.db) file"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.skills_data, f, indent=2, ensure_ascii=False)
+            save_taxonomy(self.skills_data, filename)
             return True
         except Exception as e:
             print(f"Error saving skills to file: {e}")
             return False
     
     def load_skills_from_file(self, filename: str):
-        """Load skills database from JSON file"""
-        try:
-            if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as f:
-                    self.skills_data = json.load(f)
-                return True
+        """
+        Load skills database from a JSON or SQLite (.db) file
+        
+        The file is validated first; on success it becomes the source watched
+        for hot reloads, on failure the current database stays active.
+        """
+        if not os.path.exists(filename):
             return False
-        except Exception as e:
+        try:
+            data = load_taxonomy(filename)
+        except TaxonomyError as e:
             print(f"Error loading skills from file: {e}")
-            return False
\ No newline at end of file
+            return False
+        
+        index = SkillIndex(data)
+        with self._load_lock:
+            self.path = filename
+            self._install((index, file_signature(filename)))
+        return True
@@ -0,0 +1,268 @@
+"""
+Skill search engine for RealiZe
+Prefix trie for autocomplete and a trigram index with edit-distance ranking for typos
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import heapq
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Ranked results cached on every trie node; larger limits walk the subtree
+NODE_TOP_K = 10
+
+DEMAND_RANKS = {'high': 0, 'medium': 1, 'low': 2}
+
+WORD_START_PATTERN = re.compile(r'(?<![a-z0-9])[a-z0-9]')
+
+WORD_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*')
+
+class _TrieNode:
+    """Trie node with the best-ranked entries of its subtree"""
+    
+    __slots__ = ('children', 'entries', 'top')
+    
+    def __init__(self):
+        self.children = {}
+        self.entries = []
+        self.top = ()
+
+def trigrams(text: str) -> List[str]:
+    """Character trigrams of a lowercased term, padded so short words still produce some"""
+    padded = f'  {text} '
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> Optional[int]:
+    """
+    Levenshtein distance between a and b, or None if it exceeds limit
+    
+    Only the diagonal band of width 2 * limit + 1 is computed and the scan
+    stops as soon as every cell of a row is over the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return None
+    if a == b:
+        return 0
+    
+    over = limit + 1
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [over] * len(b)
+        low = max(1, i - limit)
+        high = min(len(b), i + limit)
+        row_min = current[0] if low == 1 else over
+        for j in range(low, high + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return None
+        previous = current
+    return previous[len(b)] if previous[len(b)] <= limit else None
+
+class SkillSearchEngine:
+    """
+    Autocomplete and typo-tolerant search over skill names
+    
+    Every name is inserted into a prefix trie under the full name and under
+    each word start ("web services" for "Amazon Web Services"), and every node
+    keeps its top results, so autocomplete costs one walk down the prefix.
+    
+    Fuzzy search works on the vocabulary of words used in names, which stays
+    small even for large taxonomies: each query word is matched against the
+    vocabulary through a trigram index and bounded edit distance, then the
+    posting lists of the matched words give the skills.
+    """
+    
+    def __init__(self, names: Sequence[str], demands: Sequence[Optional[str]]):
+        self.names = list(names)
+        self.lower_names = [name.lower() for name in self.names]
+        self.demand_ranks = [DEMAND_RANKS.get((demand or '').lower(), 3) for demand in demands]
+        self.root = _TrieNode()
+        self.word_postings = {}
+        
+        for record_id, name in enumerate(self.lower_names):
+            for match in WORD_START_PATTERN.finditer(name):
+                self._insert(name[match.start():], record_id, full_name=match.start() == 0)
+            for word in set(WORD_PATTERN.findall(name)):
+                self.word_postings.setdefault(word, []).append(record_id)
+        
+        self.vocabulary = sorted(self.word_postings)
+        self.trigram_index = {}
+        for word_id, word in enumerate(self.vocabulary):
+            for gram in set(trigrams(word)):
+                self.trigram_index.setdefault(gram, []).append(word_id)
+        
+        self._rank_subtree(self.root)
+    
+    def _entry_key(self, entry: Tuple[int, bool]) -> tuple:
+        record_id, full_name = entry
+        return (not full_name, self.demand_ranks[record_id], len(self.names[record_id]), self.lower_names[record_id])
+    
+    def _insert(self, key: str, record_id: int, full_name: bool):
+        node = self.root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+        node.entries.append((record_id, full_name))
+    
+    def _rank_subtree(self, root: _TrieNode):
+        """Fill node.top bottom-up (iteratively, names can be long)"""
+        order = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+        
+        for node in reversed(order):
+            candidates = [(self._entry_key(entry), entry[0]) for entry in node.entries]
+            for child in node.children.values():
+                candidates.extend(child.top)
+            candidates.sort()
+            top = []
+            seen = set()
+            for key, record_id in candidates:
+                if record_id not in seen:
+                    seen.add(record_id)
+                    top.append((key, record_id))
+                    if len(top) == NODE_TOP_K:
+                        break
+            node.top = tuple(top)
+    
+    def _find_node(self, prefix: str) -> Optional[_TrieNode]:
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+    
+    def autocomplete(self, prefix: str, limit: int = NODE_TOP_K) -> List[int]:
+        """
+        Record ids whose name (or a word in it) starts with prefix
+        
+        Ranked: exact name first, then full-name prefixes before word
+        prefixes, then demand, then shorter names.
+        """
+        prefix = prefix.lower().strip()
+        node = self._find_node(prefix) if prefix else None
+        if node is None or limit <= 0:
+            return []
+        
+        if limit <= NODE_TOP_K:
+            ranked = [record_id for _, record_id in node.top]
+        else:
+            ranked = self._collect(node)
+        
+        exact = [record_id for record_id, full_name in node.entries if full_name]
+        if exact:
+            ranked = exact + [record_id for record_id in ranked if record_id not in exact]
+        return ranked[:limit]
+    
+    def _collect(self, node: _TrieNode) -> List[int]:
+        """Every record id below a node, ranked"""
+        best = {}
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for entry in current.entries:
+                key = self._entry_key(entry)
+                if entry[0] not in best or key < best[entry[0]]:
+                    best[entry[0]] = key
+            stack.extend(current.children.values())
+        return sorted(best, key=best.get)
+    
+    def fuzzy(self, query: str, limit: int = 10, max_distance: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Typo-tolerant search
+        
+        Every query word must match a word of the skill name within the edit
+        distance bound; the last query word may also be a (misspelled) prefix
+        of a longer word, at a cost of one extra edit.
+        
+        Args:
+            query: Search text, e.g. 'kubernets' or 'googel cloud'
+            limit: Number of results
+            max_distance: Largest edit distance per word (default scales with word length)
+        
+        Returns:
+            (record id, total edit distance) pairs, best first
+        """
+        words = WORD_PATTERN.findall(query.lower())
+        if not words or limit <= 0:
+            return []
+        
+        scores = None
+        for position, word in enumerate(words):
+            bound = max_distance
+            if bound is None:
+                bound = 0 if len(word) <= 2 else 1 if len(word) <= 5 else 2
+            matches = self._match_word(word, bound, allow_prefix=position == len(words) - 1)
+            
+            word_scores = {}
+            for vocabulary_word, distance in matches.items():
+                for record_id in self.word_postings[vocabulary_word]:
+                    if distance < word_scores.get(record_id, bound + 2):
+                        word_scores[record_id] = distance
+            
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {
+                    record_id: total + word_scores[record_id]
+                    for record_id, total in scores.items() if record_id in word_scores
+                }
+            if not scores:
+                return []
+        
+        ranked = heapq.nsmallest(limit, scores, key=lambda record_id: (
+            scores[record_id], self.demand_ranks[record_id], len(self.names[record_id]), self.lower_names[record_id]
+        ))
+        return [(record_id, scores[record_id]) for record_id in ranked]
+    
+    def _match_word(self, word: str, bound: int, allow_prefix: bool) -> Dict[str, int]:
+        """
+        Vocabulary words within the edit bound of one query word
+        
+        Each edit destroys at most three of a word's padded trigrams, so only
+        vocabulary words sharing enough trigrams with the query word are
+        checked with the (banded) edit distance.
+        """
+        matches = {}
+        if word in self.word_postings:
+            matches[word] = 0
+        
+        query_grams = set(trigrams(word))
+        needed = max(1, len(query_grams) - 3 * bound - (1 if allow_prefix else 0))
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self.trigram_index.get(gram, ()))
+        
+        for word_id, count in shared.items():
+            if count < needed:
+                continue
+            candidate = self.vocabulary[word_id]
+            if candidate in matches:
+                continue
+            distance = bounded_edit_distance(word, candidate, bound)
+            if distance is None and allow_prefix and len(candidate) > len(word):
+                distance = bounded_edit_distance(word, candidate[:len(word)], bound)
+                distance = None if distance is None else distance + 1
+            if distance is not None:
+                matches[candidate] = distance
+        
+        if allow_prefix:
+            # Exact prefixes ("eng" for "engineer") are cheap to add from the sorted vocabulary
+            start = bisect_left(self.vocabulary, word)
+            for candidate in self.vocabulary[start:start + 50]:
+                if not candidate.startswith(word):
+                    break
+                matches.setdefault(candidate, 1)
+        return matches
@@ -0,0 +1,154 @@
+"""
+Skill taxonomy storage for RealiZe
+Validated JSON and compact SQLite files for large, externally maintained skills databases
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Optional, Tuple
+
+DEMAND_LEVELS = ('high', 'medium', 'low')
+DIFFICULTY_LEVELS = ('easy', 'medium', 'hard')
+
+SQLITE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+SCHEMA_VERSION = '1'
+
+class TaxonomyError(ValueError):
+    """Raised when a skills taxonomy is malformed"""
+
+def validate_skills_data(data: Any):
+    """
+    Check the shape of a skills taxonomy
+    
+    Expected: {group_key: {'name': str, 'skills': [{'name': str, 'category': str,
+    'demand': 'High|Medium|Low', 'learning_difficulty': 'Easy|Medium|Hard'}]}};
+    demand and learning_difficulty are optional.
+    
+    Raises:
+        TaxonomyError: Naming the first offending group or skill
+    """
+    if not isinstance(data, dict):
+        raise TaxonomyError("Taxonomy must be an object of skill groups")
+    for group, group_data in data.items():
+        if not isinstance(group_data, dict) or not isinstance(group_data.get('skills'), list):
+            raise TaxonomyError(f"Group '{group}' must have a 'skills' list")
+        if not isinstance(group_data.get('name', ''), str):
+            raise TaxonomyError(f"Group '{group}' name must be a string")
+        for position, skill in enumerate(group_data['skills']):
+            where = f"{group}[{position}]"
+            if not isinstance(skill, dict) or not isinstance(skill.get('name'), str) or not skill['name'].strip():
+                raise TaxonomyError(f"Skill {where} must have a non-empty 'name'")
+            if not isinstance(skill.get('category', ''), str):
+                raise TaxonomyError(f"Skill {where} category must be a string")
+            demand = skill.get('demand')
+            if demand is not None and str(demand).lower() not in DEMAND_LEVELS:
+                raise TaxonomyError(f"Skill {where} has unknown demand '{demand}'")
+            difficulty = skill.get('learning_difficulty')
+            if difficulty is not None and str(difficulty).lower() not in DIFFICULTY_LEVELS:
+                raise TaxonomyError(f"Skill {where} has unknown learning_difficulty '{difficulty}'")
+
+def is_sqlite_path(path: str) -> bool:
+    return path.lower().endswith(SQLITE_EXTENSIONS)
+
+def file_signature(path: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Modification time and size of a taxonomy file, None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def load_taxonomy(path: str) -> Dict[str, Any]:
+    """
+    Read and validate a taxonomy from a JSON or SQLite file
+    
+    Raises:
+        TaxonomyError: If the file cannot be read or is malformed
+    """
+    try:
+        if is_sqlite_path(path):
+            data = _read_sqlite(path)
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+    except (OSError, sqlite3.Error, json.JSONDecodeError) as e:
+        raise TaxonomyError(f"Cannot read taxonomy '{path}': {e}") from e
+    validate_skills_data(data)
+    return data
+
+def save_taxonomy(data: Dict[str, Any], path: str):
+    """
+    Validate a taxonomy and write it as JSON or SQLite (chosen by extension)
+    
+    The file is written next to its destination and renamed into place, so a
+    reloading server never reads a half-written taxonomy.
+    """
+    validate_skills_data(data)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    temp_path = f'{path}.tmp'
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    if is_sqlite_path(path):
+        _write_sqlite(data, temp_path)
+    else:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+def _write_sqlite(data: Dict[str, Any], path: str):
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(
+            'CREATE TABLE taxonomy_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);'
+            'CREATE TABLE taxonomy_groups (position INTEGER PRIMARY KEY, key TEXT NOT NULL, name TEXT NOT NULL);'
+            'CREATE TABLE taxonomy_skills (position INTEGER PRIMARY KEY, group_position INTEGER NOT NULL, '
+            'name TEXT NOT NULL, category TEXT NOT NULL, demand TEXT, learning_difficulty TEXT);'
+        )
+        conn.execute('INSERT INTO taxonomy_meta VALUES (?, ?)', ('schema_version', SCHEMA_VERSION))
+        conn.executemany('INSERT INTO taxonomy_groups VALUES (?, ?, ?)', (
+            (position, key, group_data.get('name', key)) for position, (key, group_data) in enumerate(data.items())
+        ))
+        conn.executemany('INSERT INTO taxonomy_skills VALUES (?, ?, ?, ?, ?, ?)', (
+            (None, position, skill['name'], skill.get('category', ''), skill.get('demand'),
+             skill.get('learning_difficulty'))
+            for position, group_data in enumerate(data.values()) for skill in group_data['skills']
+        ))
+        conn.commit()
+    finally:
+        conn.close()
+
+def _read_sqlite(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        raise OSError(f"No such file: '{path}'")
+    conn = sqlite3.connect(path)
+    try:
+        version = conn.execute("SELECT value FROM taxonomy_meta WHERE key = 'schema_version'").fetchone()
+        if not version or version[0] != SCHEMA_VERSION:
+            raise TaxonomyError(f"Unsupported taxonomy schema in '{path}'")
+        data = {}
+        groups = {}
+        for position, key, name in conn.execute('SELECT position, key, name FROM taxonomy_groups ORDER BY position'):
+            skills = []
+            data[key] = {'name': name, 'skills': skills}
+            groups[position] = skills
+        rows = conn.execute(
+            'SELECT group_position, name, category, demand, learning_difficulty FROM taxonomy_skills ORDER BY position'
+        )
+        for group_position, name, category, demand, difficulty in rows:
+            skill = {'name': name, 'category': category}
+            if demand is not None:
+                skill['demand'] = demand
+            if difficulty is not None:
+                skill['learning_difficulty'] = difficulty
+            if group_position not in groups:
+                raise TaxonomyError(f"Skill '{name}' in '{path}' refers to unknown group {group_position}")
+            groups[group_position].append(skill)
+        return data
+    finally:
+        conn.close()
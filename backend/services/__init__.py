@@ -3,6 +3,11 @@ Service modules for RealiZe backend
 Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
 """
 
-from .openrouter_service import OpenRouterService
+__all__ = ['OpenRouterService']
 
-__all__ = ['OpenRouterService']
\ No newline at end of file
+def __getattr__(name):
+    # Imported on first access, so importing one service module does not import them all
+    if name == 'OpenRouterService':
+        from .openrouter_service import OpenRouterService
+        return OpenRouterService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -4,50 +4,204 @@ Combines NLP processing with skill database matching
 Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
 """
 
+import contextvars
+import hashlib
+import json
 import logging
+import os
 import re
-from typing import Dict, Any, List, Optional
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
+from backend.models.skill_aliases import SKILL_ALIASES, SKILL_CANONICALIZER
+from backend.models.skill_database import SkillDatabase
+from backend.services.experience_scanner import scan_experience
+from backend.services.matching import (SkillVectorizer, CorpusStats, JobMatchScorer, MatchDocument, merge_terms,
+                                       score_jobs)
 from backend.services.openrouter_service import OpenRouterService
+from backend.utils.analysis_context import AnalysisContext
+from backend.utils.cache import TieredCache
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the local analysis logic changes in a way that alters results
+ANALYZER_VERSION = "1.4.0"
+
+EXPERIENCE_LEVEL_RANKS = {'Junior': 0, 'Mid-Level': 1, 'Senior': 2}
+
+# Resume sections read by each pass; resumes without recognised headings are used whole
+SKILL_SECTIONS = ('summary', 'experience', 'skills', 'projects', 'certifications', 'education',
+                  'achievements', 'languages')
+EXPERIENCE_SECTIONS = ('header', 'summary', 'experience')
+PROMPT_SECTIONS = {
+    'skill_analysis': SKILL_SECTIONS,
+    'job_comparison': ('summary', 'experience', 'skills', 'projects', 'certifications', 'education'),
+    'career_suggestions': ('summary', 'experience', 'skills', 'projects', 'certifications', 'education'),
+    'ai_recommendations': ('summary', 'experience', 'skills', 'projects', 'certifications', 'education'),
+    'ai_summary': ('header',) + SKILL_SECTIONS
+}
+
+# Keyword patterns of the form \bword\b can be answered from token counts
+WORD_PATTERN = re.compile(r'\\b(\w+)\\b')
+
+def normalize_resume_text(text: str) -> str:
+    """Normalize resume text so trivially different extractions share a cache key"""
+    text = unicodedata.normalize('NFC', text or '')
+    return re.sub(r'\s+', ' ', text).strip()
+
+def update_normalized_digest(digest, text: str):
+    """
+    Feed normalize_resume_text(text) into a hash object word by word
+    
+    Produces the same digest as hashing the normalized string, without
+    building the intermediate pieces of a full re.sub over a long resume.
+    """
+    separator = b''
+    for match in re.finditer(r'\S+', unicodedata.normalize('NFC', text or '')):
+        digest.update(separator)
+        digest.update(match.group().encode('utf-8'))
+        separator = b' '
+
 class ResumeAnalyzer:
     """Main analyzer for resume content analysis"""
     
-    def __init__(self):
+    def __init__(self, result_cache: Optional[TieredCache] = None, skill_database: Optional[SkillDatabase] = None):
         self.openrouter_service = OpenRouterService()
         self.skill_keywords = self._initialize_skill_keywords()
+        self.skill_matchers = self._compile_skill_matchers()
+        self.skill_vectorizer = SkillVectorizer(self.skill_keywords)
+        self.skill_database = skill_database or SkillDatabase()
+        self.job_matcher = JobMatchScorer(self.skill_database.get_demand_levels(), self._load_match_corpus())
+        # Demand weights follow hot reloads of the skills taxonomy
+        self.skill_database.add_reload_listener(
+            lambda database: self.job_matcher.set_demand_levels(database.get_demand_levels()))
+        self.llm_max_concurrency = int(os.environ.get('LLM_MAX_CONCURRENCY', 4))
+        self.result_cache = result_cache or self._create_result_cache()
+        
+    @staticmethod
+    def _load_match_corpus() -> Optional[CorpusStats]:
+        """BM25 corpus snapshot from MATCH_CORPUS_PATH (see `flask build-match-corpus`), if there is one"""
+        path = os.environ.get('MATCH_CORPUS_PATH', os.path.join('cache', 'match_corpus.json'))
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            corpus = CorpusStats.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable match corpus {path}: {str(e)}")
+            return None
+        logger.info(f"Loaded match corpus {corpus.version} ({corpus.document_count} resumes)")
+        return corpus
+    
+    def _create_result_cache(self) -> TieredCache:
+        """Create the analysis result cache from environment configuration"""
+        return TieredCache(
+            namespace=self.cache_fingerprint(),
+            max_size=int(os.environ.get('ANALYSIS_CACHE_SIZE', 128)),
+            path=os.environ.get('ANALYSIS_CACHE_PATH', os.path.join('cache', 'analysis_cache.db')),
+            table='analysis_results',
+            max_rows=int(os.environ.get('ANALYSIS_CACHE_MAX_ROWS', 10000)),
+            max_age=float(os.environ.get('ANALYSIS_CACHE_MAX_AGE_DAYS', 30)) * 86400
+        )
+    
+    def cache_fingerprint(self) -> str:
+        """Fingerprint of analyzer version, skill keyword set, skill aliases and prompts"""
+        payload = json.dumps({
+            'analyzer_version': ANALYZER_VERSION,
+            'skill_keywords': self.skill_keywords,
+            'skill_aliases': SKILL_ALIASES,
+            'prompts': self.openrouter_service.prompt_fingerprint()
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def cache_key(self, resume_text: str) -> str:
+        """Cache key for a resume: normalized text hash plus the current fingerprint"""
+        digest = hashlib.sha256()
+        digest.update(self.result_cache.namespace.encode('utf-8'))
+        digest.update(b'\0')
+        update_normalized_digest(digest, resume_text)
+        return digest.hexdigest()
+    
+    def prompt_text(self, resume_text: Union[str, AnalysisContext], purpose: str) -> str:
+        """
+        Resume text to send to the LLM for a given prompt
+        
+        Only the sections the prompt needs are included (e.g. no contact
+        header, hobbies or references), which keeps prompts short.
         
+        Args:
+            resume_text: Resume text or its analysis context
+            purpose: Key of PROMPT_SECTIONS
+        
+        Returns:
+            The relevant section slices, or the whole text without headings
+        """
+        return AnalysisContext.of(resume_text).section_text(PROMPT_SECTIONS[purpose])
+    
     def analyze(self, resume_text: str) -> Dict[str, Any]:
         """
         Perform comprehensive analysis of resume text
         
+        Results are served from the result cache when the same normalized
+        text was analyzed before with the same skill keywords and prompts.
+        
         Args:
             resume_text: Raw text content from resume
             
         Returns:
-            Complete analysis results
+            Complete analysis results, marked with 'cached'
         """
+        key = self.cache_key(resume_text)
+        cached_result = self.result_cache.get(key)
+        if cached_result is not None:
+            logger.info("Serving resume analysis from cache")
+            cached_result['cached'] = True
+            return cached_result
+        
+        analysis_result = self._run_analysis(resume_text)
+        if self._is_cacheable(analysis_result):
+            self.result_cache.set(key, analysis_result)
+        
+        analysis_result['cached'] = False
+        return analysis_result
+    
+    def _is_cacheable(self, analysis_result: Dict[str, Any]) -> bool:
+        """Only cache complete results; failed LLM calls should be retried"""
+        if 'error' in analysis_result:
+            return False
+        if self.openrouter_service.api_key and not self.openrouter_service.llm_enabled:
+            # Shed to local-only analysis: a later full analysis should take its place
+            return False
+        for section in ('skills_analysis', 'ai_recommendations', 'ai_summary'):
+            if 'error' in analysis_result.get(section, {}):
+                return False
+        return True
+    
+    def _run_analysis(self, resume_text: str) -> Dict[str, Any]:
+        """Run the full (uncached) analysis pipeline"""
         try:
             logger.info("Starting comprehensive resume analysis")
+            context = AnalysisContext(resume_text)
             
             # Get detailed analysis from OpenRouter
-            openrouter_analysis = self.openrouter_service.analyze_resume_skills(resume_text)
+            openrouter_analysis = self.openrouter_service.analyze_resume_skills(
+                self.prompt_text(context, 'skill_analysis'))
             
             # Get basic skill extraction
-            basic_skills = self._extract_basic_skills(resume_text)
+            basic_skills = self._extract_basic_skills(context.section_context(SKILL_SECTIONS))
             
             # Analyze experience indicators
-            experience_analysis = self._analyze_experience_indicators(resume_text)
+            experience_analysis = self._analyze_experience_indicators(context.section_context(EXPERIENCE_SECTIONS))
             
             # Calculate overall scores
-            scores = self._calculate_scores(openrouter_analysis, basic_skills, experience_analysis, resume_text)
+            scores = self._calculate_scores(openrouter_analysis, basic_skills, experience_analysis, context)
             
             # Generate AI recommendations and summary
-            ai_recommendations = self.openrouter_service.generate_ai_recommendations(resume_text, openrouter_analysis)
-            ai_summary = self.openrouter_service.generate_ai_resume_summary(resume_text, openrouter_analysis)
+            ai_recommendations = self.openrouter_service.generate_ai_recommendations(
+                self.prompt_text(context, 'ai_recommendations'), openrouter_analysis)
+            ai_summary = self.openrouter_service.generate_ai_resume_summary(
+                self.prompt_text(context, 'ai_summary'), openrouter_analysis)
             
             # Generate summary
             summary = self._generate_summary(resume_text, openrouter_analysis, basic_skills, experience_analysis)
@@ -57,8 +211,8 @@ class ResumeAnalyzer:
                 'timestamp': datetime.now().isoformat(),
                 'basic_info': {
                     'text_length': len(resume_text),
-                    'word_count': len(resume_text.split()),
-                    'sections_detected': self._detect_sections(resume_text)
+                    'word_count': context.word_count,
+                    'sections_detected': self._detect_sections(context)
                 },
                 'skills_analysis': openrouter_analysis,
                 'basic_skills': basic_skills,
@@ -80,13 +234,42 @@ class ResumeAnalyzer:
                 'timestamp': datetime.now().isoformat()
             }
     
-    def compare_with_job(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+    def extract_resume_features(self, resume_text: str) -> Dict[str, Any]:
+        """
+        Extract the local (non-LLM) features of a resume
+        
+        Args:
+            resume_text: Text from resume
+        
+        Returns:
+            Basic skills, experience indicators and detected sections, shaped
+            like the matching parts of an analysis result
+        """
+        context = AnalysisContext(resume_text)
+        basic_skills = self._extract_basic_skills(context.section_context(SKILL_SECTIONS))
+        
+        return {
+            'basic_info': {
+                'text_length': len(resume_text),
+                'word_count': context.word_count,
+                'sections_detected': self._detect_sections(context)
+            },
+            'basic_skills': basic_skills,
+            'experience_analysis': self._analyze_experience_indicators(context.section_context(EXPERIENCE_SECTIONS))
+        }
+    
+    def compare_with_job(self, resume_text: str, job_description: str,
+                         resume_skills: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Compare resume with job description
         
+        The local relevance score is always computed; it replaces the LLM
+        comparison when no API key is configured or the API call fails.
+        
         Args:
             resume_text: Text from resume
             job_description: Job description text
+            resume_skills: Previously extracted basic skills for the resume, if known
             
         Returns:
             Comparison analysis results
@@ -94,21 +277,27 @@ class ResumeAnalyzer:
         try:
             logger.info("Starting job comparison analysis")
             
-            comparison_result = self.openrouter_service.compare_with_job(resume_text, job_description)
+            resume_context = AnalysisContext(resume_text)
+            job_context = AnalysisContext(job_description)
+            job_skills = self._extract_basic_skills(job_context)
+            if resume_skills is None:
+                resume_skills = self._extract_basic_skills(resume_context.section_context(SKILL_SECTIONS))
             
-            # Add additional analysis
-            if 'error' not in comparison_result:
-                job_skills = self._extract_basic_skills(job_description)
-                resume_skills = self._extract_basic_skills(resume_text)
-                
-                # Calculate additional metrics
-                additional_metrics = {
-                    'keyword_density_match': self._calculate_keyword_density(resume_skills, job_skills),
-                    'technical_depth_comparison': self._compare_technical_depth(resume_skills, job_skills),
-                    'experience_alignment': self._assess_experience_alignment(resume_text, job_description)
-                }
-                
-                comparison_result['additional_metrics'] = additional_metrics
+            local_match = self.job_matcher.score(
+                MatchDocument.from_context(resume_context, resume_skills),
+                MatchDocument.from_context(job_context, job_skills)
+            )
+            comparison_result = self._detailed_job_comparison(resume_context, job_description, local_match)
+            
+            # Calculate additional metrics
+            additional_metrics = {
+                'keyword_density_match': self._calculate_keyword_density(resume_skills, job_skills),
+                'technical_depth_comparison': self._compare_technical_depth(resume_skills, job_skills),
+                'experience_alignment': self._assess_experience_alignment(resume_context, job_context, local_match)
+            }
+            
+            comparison_result['additional_metrics'] = additional_metrics
+            comparison_result['local_match'] = local_match
             
             logger.info("Job comparison analysis completed")
             return comparison_result
@@ -120,6 +309,138 @@ class ResumeAnalyzer:
                 'timestamp': datetime.now().isoformat()
             }
     
+    def compare_with_jobs(self, resume_text: str, job_descriptions: List[str], top_k: int = 3,
+                          resume_skills: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Compare one resume with many job descriptions
+        
+        Resume features are extracted once, every job is scored locally
+        (skill coverage in a single vectorized pass plus the BM25 relevance
+        score), and only the top-K jobs are sent to the LLM for a detailed
+        assessment, concurrently.
+        
+        Args:
+            resume_text: Text from resume
+            job_descriptions: Job description texts
+            top_k: Number of best local matches to assess with the LLM
+            resume_skills: Previously extracted basic skills for the resume, if known
+        
+        Returns:
+            Jobs ranked by local score, with detailed comparisons for the top-K
+        """
+        try:
+            logger.info(f"Starting batch comparison against {len(job_descriptions)} jobs")
+            
+            resume_context = AnalysisContext(resume_text)
+            if resume_skills is None:
+                resume_skills = self._extract_basic_skills(resume_context.section_context(SKILL_SECTIONS))
+            job_contexts = [AnalysisContext(job) for job in job_descriptions]
+            job_skills = [self._extract_basic_skills(job) for job in job_contexts]
+            
+            resume_vector = self.skill_vectorizer.vectorize(resume_skills)
+            job_matrix = self.skill_vectorizer.vectorize_many(job_skills)
+            coverage = score_jobs(resume_vector, job_matrix)
+            
+            resume_document = MatchDocument.from_context(resume_context, resume_skills)
+            local_matches = [
+                self.job_matcher.score(resume_document, MatchDocument.from_context(job, skills))
+                for job, skills in zip(job_contexts, job_skills)
+            ]
+            
+            # Stable sort keeps submission order among equal scores
+            ranking = sorted(
+                range(len(job_descriptions)),
+                key=lambda i: (-local_matches[i]['score'], -coverage[i])
+            )
+            
+            results = []
+            for rank, job_index in enumerate(ranking, start=1):
+                job_vector = job_matrix[job_index]
+                results.append({
+                    'job_index': job_index,
+                    'rank': rank,
+                    'local_score': local_matches[job_index]['score'],
+                    'skill_coverage': round(float(coverage[job_index]), 1),
+                    'matched_skills': self.skill_vectorizer.names_for(job_vector * resume_vector),
+                    'missing_skills': self.skill_vectorizer.names_for(job_vector * (1 - resume_vector)),
+                    'detailed_comparison': None
+                })
+            
+            top = results[:max(0, top_k)]
+            if top:
+                with ThreadPoolExecutor(max_workers=max(1, min(len(top), self.llm_max_concurrency))) as executor:
+                    # Each comparison runs in a copy of this request's context (e.g. local-only mode)
+                    detailed = executor.map(
+                        lambda result, context: context.run(
+                            self._detailed_job_comparison,
+                            resume_context, job_descriptions[result['job_index']], local_matches[result['job_index']]
+                        ),
+                        top, [contextvars.copy_context() for _ in top]
+                    )
+                    for result, comparison in zip(top, detailed):
+                        result['detailed_comparison'] = comparison
+            
+            logger.info("Batch job comparison completed")
+            return {
+                'total_jobs': len(job_descriptions),
+                'top_k': len(top),
+                'results': results,
+                'timestamp': datetime.now().isoformat()
+            }
+        
+        except Exception as e:
+            logger.error(f"Error in batch job comparison: {str(e)}")
+            return {
+                'error': f'Batch comparison failed: {str(e)}',
+                'timestamp': datetime.now().isoformat()
+            }
+    
+    def _detailed_job_comparison(self, resume_text: Union[str, AnalysisContext], job_description: str,
+                                 local_match: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """LLM comparison, falling back to the local relevance score without API access"""
+        resume_context = AnalysisContext.of(resume_text)
+        if self.openrouter_service.llm_enabled:
+            comparison_result = self.openrouter_service.compare_with_job(
+                self.prompt_text(resume_context, 'job_comparison'), job_description)
+            if 'error' not in comparison_result:
+                return comparison_result
+            logger.warning(f"LLM job comparison failed, using local score: {comparison_result['error']}")
+        
+        if local_match is None:
+            job_context = AnalysisContext(job_description)
+            local_match = self.job_matcher.score(
+                MatchDocument.from_context(
+                    resume_context, self._extract_basic_skills(resume_context.section_context(SKILL_SECTIONS))),
+                MatchDocument.from_context(job_context, self._extract_basic_skills(job_context))
+            )
+        return self._local_job_comparison(local_match)
+    
+    def _local_job_comparison(self, local_match: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a job comparison from the local relevance score"""
+        score = int(round(local_match['score']))
+        strong_matches = merge_terms(local_match['matched_skills'], local_match['top_matching_terms'])
+        missing = merge_terms(local_match['missing_skills'], local_match['missing_terms'][:5])
+        priority_gaps = local_match['missing_skills'][:3] or local_match['missing_terms'][:3]
+        
+        if score >= 75:
+            assessment = "Strong fit - the resume covers most of the job's key skills and terms"
+        elif score >= 50:
+            assessment = "Good fit with some skill gaps that can be addressed"
+        elif score >= 25:
+            assessment = "Partial fit - several key requirements are not reflected in the resume"
+        else:
+            assessment = "Weak fit - few of the job's requirements appear in the resume"
+        
+        return {
+            'match_score': score,
+            'strong_matches': strong_matches[:8],
+            'missing_skills': missing[:8],
+            'recommendations': [f"Highlight or gain experience with {gap}" for gap in priority_gaps],
+            'overall_assessment': assessment,
+            'priority_gaps': priority_gaps,
+            'note': 'Local relevance analysis - configure OpenRouter API for detailed analysis'
+        }
+    
     def generate_career_suggestions(self, resume_text: str, skills_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate career path suggestions
@@ -134,12 +455,15 @@ class ResumeAnalyzer:
         try:
             logger.info("Generating career suggestions")
             
-            suggestions = self.openrouter_service.generate_career_suggestions(resume_text, skills_analysis)
+            suggestions = self.openrouter_service.generate_career_suggestions(
+                self.prompt_text(resume_text, 'career_suggestions'), skills_analysis)
             
             if 'error' not in suggestions:
                 # Add market insights
                 suggestions['market_insights'] = self._get_market_insights(skills_analysis)
-                suggestions['learning_priorities'] = self._prioritize_learning_areas(skills_analysis)
+                basic_skills = self._extract_basic_skills(
+                    AnalysisContext.of(resume_text).section_context(SKILL_SECTIONS))
+                suggestions['learning_priorities'] = self._prioritize_learning_areas(skills_analysis, basic_skills)
             
             logger.info("Career suggestions generated")
             return suggestions
@@ -151,9 +475,34 @@ class ResumeAnalyzer:
                 'timestamp': datetime.now().isoformat()
             }
     
-    def _extract_basic_skills(self, text: str) -> Dict[str, List[Dict[str, Any]]]:
+    def _compile_skill_matchers(self) -> Dict[str, List[tuple]]:
+        """
+        Precompile the skill keyword patterns
+        
+        Plain \\bword\\b patterns become token lookups; anything else (c++, .net,
+        multi-word names) is compiled once and run against the lowercased text.
+        Skills are reported under their canonical name ('Vue' as 'Vue.js').
+        """
+        matchers = {}
+        for category, category_skills in self.skill_keywords.items():
+            matchers[category] = []
+            for name, patterns in category_skills.items():
+                compiled = []
+                for pattern in patterns:
+                    word = WORD_PATTERN.fullmatch(pattern)
+                    compiled.append(word.group(1) if word else re.compile(pattern))
+                matchers[category].append((SKILL_CANONICALIZER.canonical_name(name), compiled))
+        return matchers
+    
+    def _count_pattern(self, context: AnalysisContext, matcher) -> int:
+        """Count matches of one compiled keyword pattern"""
+        if isinstance(matcher, str):
+            return context.count_word(matcher)
+        return len(matcher.findall(context.lower))
+    
+    def _extract_basic_skills(self, text: Union[str, AnalysisContext]) -> Dict[str, List[Dict[str, Any]]]:
         """Extract basic skills using keyword matching"""
-        text_lower = text.lower()
+        context = AnalysisContext.of(text)
         skills = {
             'programming_languages': [],
             'frameworks': [],
@@ -164,83 +513,44 @@ class ResumeAnalyzer:
             'soft_skills': []
         }
         
-        # Programming languages
-        for lang, patterns in self.skill_keywords['programming_languages'].items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    count = len(re.findall(pattern, text_lower))
-                    skills['programming_languages'].append({
-                        'name': lang,
-                        'mentions': count,
-                        'confidence': 'high' if count > 1 else 'medium'
-                    })
-                    break
-        
-        # Frameworks
-        for framework, patterns in self.skill_keywords['frameworks'].items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    count = len(re.findall(pattern, text_lower))
-                    skills['frameworks'].append({
-                        'name': framework,
-                        'mentions': count,
-                        'confidence': 'high' if count > 1 else 'medium'
-                    })
-                    break
+        # Programming languages and frameworks; the first matching pattern of a skill counts
+        for category in ('programming_languages', 'frameworks'):
+            for name, matchers in self.skill_matchers.get(category, []):
+                for matcher in matchers:
+                    count = self._count_pattern(context, matcher)
+                    if count:
+                        skills[category].append({
+                            'name': name,
+                            'mentions': count,
+                            'confidence': 'high' if count > 1 else 'medium'
+                        })
+                        break
         
         # Continue for other skill categories...
         # (Similar logic for databases, cloud platforms, tools, etc.)
         
         return skills
     
-    def _analyze_experience_indicators(self, text: str) -> Dict[str, Any]:
+    def _analyze_experience_indicators(self, text: Union[str, AnalysisContext]) -> Dict[str, Any]:
         """Analyze experience level indicators"""
+        scan = scan_experience(AnalysisContext.of(text).lower)
+        term_counts = scan.term_counts()
+        
         experience_indicators = {
-            'years_pattern': None,
-            'senior_level_terms': 0,
-            'leadership_terms': 0,
-            'management_terms': 0,
-            'junior_level_terms': 0,
+            'years_pattern': scan.claimed_years(),
+            'employment_years': scan.employment_years(),
+            'employment_ranges': [employment_range.to_dict() for employment_range in scan.employment_ranges()],
+            'senior_level_terms': term_counts['senior'],
+            'leadership_terms': term_counts['leadership'],
+            'management_terms': term_counts['management'],
+            'junior_level_terms': term_counts['junior'],
             'estimated_level': 'Unknown',
             'confidence': 'low'
         }
         
-        text_lower = text.lower()
-        
-        # Years of experience patterns
-        year_patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)',
-            r'(\d+)\+?\s*years?\s*(?:in|with)',
-            r'over\s*(\d+)\s*years?',
-            r'more\s*than\s*(\d+)\s*years?'
-        ]
-        
-        for pattern in year_patterns:
-            matches = re.findall(pattern, text_lower)
-            if matches:
-                years = max([int(match) for match in matches])
-                experience_indicators['years_pattern'] = years
-                break
-        
-        # Senior level indicators
-        senior_terms = ['senior', 'lead', 'principal', 'architect', 'expert', 'specialist']
-        experience_indicators['senior_level_terms'] = sum(1 for term in senior_terms if term in text_lower)
-        
-        # Leadership indicators
-        leadership_terms = ['lead', 'managed', 'managed team', 'supervised', 'mentored']
-        experience_indicators['leadership_terms'] = sum(1 for term in leadership_terms if term in text_lower)
-        
-        # Management indicators
-        management_terms = ['manager', 'director', 'head of', 'team lead']
-        experience_indicators['management_terms'] = sum(1 for term in management_terms if term in text_lower)
-        
-        # Junior level indicators
-        junior_terms = ['junior', 'entry', 'associate', 'intern', 'graduate']
-        experience_indicators['junior_level_terms'] = sum(1 for term in junior_terms if term in text_lower)
-        
         # Estimate experience level
-        if experience_indicators['years_pattern']:
-            years = experience_indicators['years_pattern']
+        years = experience_indicators['years_pattern'] or experience_indicators['employment_years']
+        if years:
             if years >= 8:
                 experience_indicators['estimated_level'] = 'Senior'
                 experience_indicators['confidence'] = 'high'
@@ -265,7 +575,8 @@ class ResumeAnalyzer:
         
         return experience_indicators
     
-    def _calculate_scores(self, openrouter_analysis: Dict, basic_skills: Dict, experience_analysis: Dict, resume_text: str = "") -> Dict[str, int]:
+    def _calculate_scores(self, openrouter_analysis: Dict, basic_skills: Dict, experience_analysis: Dict,
+                          resume_text: Union[str, AnalysisContext] = "") -> Dict[str, int]:
         """Calculate various scoring metrics"""
         scores = {
             'technical_skills_score': 0,
@@ -296,8 +607,9 @@ class ResumeAnalyzer:
             scores['experience_score'] = 30
         
         # Completeness score (based on resume length and structure)
-        if resume_text:
-            word_count = len(resume_text.split())
+        context = AnalysisContext.of(resume_text)
+        if context.text:
+            word_count = context.word_count
             if word_count >= 500:
                 scores['completeness_score'] = 90
             elif word_count >= 300:
@@ -308,7 +620,7 @@ class ResumeAnalyzer:
                 scores['completeness_score'] = 30
         else:
             # Fallback: use sections detected as a proxy for completeness
-            sections = self._detect_sections(resume_text if resume_text else "")
+            sections = self._detect_sections(context)
             section_count = len(sections)
             if section_count >= 8:
                 scores['completeness_score'] = 90
@@ -411,10 +723,15 @@ class ResumeAnalyzer:
             # Add more categories as needed
         }
     
-    def _detect_sections(self, text: str) -> List[str]:
-        """Detect common resume sections"""
+    def _detect_sections(self, text: Union[str, AnalysisContext]) -> List[str]:
+        """Detect resume sections from the segmented section headings"""
+        context = AnalysisContext.of(text)
+        if context.sections:
+            return [name.title() for name in context.section_names() if name != 'header']
+        
+        # No headings recognised: fall back to looking for section words anywhere
         sections = []
-        text_lower = text.lower()
+        text_lower = context.lower
         
         common_sections = [
             'experience', 'work experience', 'employment history',
@@ -434,42 +751,93 @@ class ResumeAnalyzer:
         return sections
     
     def _calculate_keyword_density(self, resume_skills: Dict, job_skills: Dict) -> float:
-        """Calculate keyword density match between resume and job"""
-        resume_keywords = set()
-        job_keywords = set()
-        
-        for category, skills in resume_skills.items():
-            if isinstance(skills, list):
-                for skill in skills:
-                    if isinstance(skill, dict) and 'name' in skill:
-                        resume_keywords.add(skill['name'].lower())
-        
-        for category, skills in job_skills.items():
-            if isinstance(skills, list):
-                for skill in skills:
-                    if isinstance(skill, dict) and 'name' in skill:
-                        job_keywords.add(skill['name'].lower())
+        """Calculate keyword density match between resume and job (by canonical skill id)"""
+        resume_keywords = SKILL_CANONICALIZER.skill_mentions(resume_skills).keys()
+        job_keywords = SKILL_CANONICALIZER.skill_mentions(job_skills).keys()
         
         if not job_keywords:
             return 0.0
         
-        matches = resume_keywords.intersection(job_keywords)
+        matches = resume_keywords & job_keywords
         return len(matches) / len(job_keywords) * 100
     
     def _compare_technical_depth(self, resume_skills: Dict, job_skills: Dict) -> Dict[str, Any]:
         """Compare technical depth between resume and job requirements"""
+        resume_mentions = SKILL_CANONICALIZER.skill_mentions(resume_skills)
+        required = SKILL_CANONICALIZER.skill_mentions(job_skills)
+        covered = [skill_id for skill_id in required if skill_id in resume_mentions]
+        
+        # Depth of the resume on the required skills: coverage and repeated mentions
+        coverage = len(covered) / len(required) if required else 0.0
+        repeated = sum(1 for skill_id in covered if resume_mentions[skill_id] > 1)
+        if coverage >= 0.75 and repeated >= max(1, len(covered) // 2):
+            resume_depth = 'high'
+        elif coverage >= 0.4:
+            resume_depth = 'medium'
+        else:
+            resume_depth = 'low'
+        
+        if len(required) >= 6:
+            job_depth = 'high'
+        elif len(required) >= 3:
+            job_depth = 'medium'
+        else:
+            job_depth = 'low'
+        
+        depth_ranks = {'low': 0, 'medium': 1, 'high': 2}
+        if not required:
+            assessment = 'No specific technical skills detected in the job description'
+        elif depth_ranks[resume_depth] >= depth_ranks[job_depth]:
+            assessment = f'Resume technical depth ({resume_depth}) meets the job requirement ({job_depth})'
+        else:
+            assessment = f'Resume has {resume_depth} technical depth but the job requires {job_depth} expertise'
+        
         return {
-            'resume_depth': 'medium',  # Placeholder
-            'job_depth_required': 'high',  # Placeholder
-            'assessment': 'Resume has moderate technical depth but job requires advanced expertise'
+            'resume_depth': resume_depth,
+            'job_depth_required': job_depth,
+            'required_skills_covered': f'{len(covered)}/{len(required)}',
+            'assessment': assessment
         }
     
-    def _assess_experience_alignment(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+    def _assess_experience_alignment(self, resume_text: Union[str, AnalysisContext],
+                                     job_description: Union[str, AnalysisContext],
+                                     local_match: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Assess how well experience aligns with job requirements"""
+        resume_context = AnalysisContext.of(resume_text)
+        job_context = AnalysisContext.of(job_description)
+        if local_match is None:
+            local_match = self.job_matcher.score(
+                MatchDocument.from_context(
+                    resume_context, self._extract_basic_skills(resume_context.section_context(SKILL_SECTIONS))),
+                MatchDocument.from_context(job_context, self._extract_basic_skills(job_context))
+            )
+        
+        resume_experience = self._analyze_experience_indicators(resume_context.section_context(EXPERIENCE_SECTIONS))
+        job_experience = self._analyze_experience_indicators(job_context)
+        
+        alignment_score = local_match['score']
+        gaps = list(local_match['missing_skills'][:3])
+        
+        # Penalize a resume whose experience level is below the one the job asks for
+        if job_experience['confidence'] != 'low':
+            resume_rank = EXPERIENCE_LEVEL_RANKS.get(resume_experience['estimated_level'], 1)
+            job_rank = EXPERIENCE_LEVEL_RANKS.get(job_experience['estimated_level'], 1)
+            if job_rank > resume_rank:
+                alignment_score -= 15 * (job_rank - resume_rank)
+                gaps.append(f"{job_experience['estimated_level']} level experience")
+        
+        required_years = job_experience['years_pattern']
+        resume_years = resume_experience['years_pattern'] or resume_experience['employment_years']
+        if required_years and (resume_years or 0) < required_years:
+            gaps.append(f'{required_years}+ years of experience')
+        
+        if len(gaps) < 3:
+            gaps.extend(local_match['missing_terms'][:3 - len(gaps)])
+        
         return {
-            'alignment_score': 75,  # Placeholder
-            'key_alignment_areas': ['Technical Skills', 'Problem Solving'],
-            'gaps': ['Specific domain experience', 'Leadership experience']
+            'alignment_score': int(round(max(0.0, min(100.0, alignment_score)))),
+            'key_alignment_areas': merge_terms(local_match['matched_skills'], local_match['top_matching_terms'])[:5],
+            'gaps': gaps
         }
     
     def _get_market_insights(self, skills_analysis: Dict) -> Dict[str, Any]:
@@ -481,10 +849,8 @@ class ResumeAnalyzer:
             'market_notes': 'Strong demand for these skills in the current market'
         }
     
-    def _prioritize_learning_areas(self, skills_analysis: Dict) -> List[Dict[str, str]]:
-        """Prioritize learning areas based on analysis"""
-        return [
-            {'area': 'Cloud Technologies', 'priority': 'High', 'reason': 'High market demand'},
-            {'area': 'Machine Learning', 'priority': 'Medium', 'reason': 'Growing field'},
-            {'area': 'DevOps', 'priority': 'High', 'reason': 'Industry standard'}
-        ]
\ No newline at end of file
+    def _prioritize_learning_areas(self, skills_analysis: Dict,
+                                   basic_skills: Optional[Dict] = None) -> List[Dict[str, str]]:
+        """Missing skills ranked across every role's learning path (local, no LLM call)"""
+        graph = self.skill_database.learning_graph
+        return graph.learning_priorities(graph.skills_mask(skills_analysis, basic_skills or {}))
\ No newline at end of file
@@ -0,0 +1,222 @@
+"""
+Experience indicator scanner for RealiZe
+Finds seniority terms, year claims and employment date ranges in one regex pass
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import re
+from datetime import date
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Indicator category -> terms; matched on word boundaries with an optional plural 's'
+INDICATOR_TERMS = {
+    'senior': ['senior', 'lead', 'principal', 'architect', 'expert', 'specialist'],
+    'leadership': ['lead', 'managed', 'managed team', 'supervised', 'mentored'],
+    'management': ['manager', 'director', 'head of', 'team lead'],
+    'junior': ['junior', 'entry', 'associate', 'intern', 'internship', 'graduate']
+}
+
+# Claims above this are treated as noise (e.g. "2019 years")
+MAX_PLAUSIBLE_YEARS = 50
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+class Mention(NamedTuple):
+    """One scanner hit: kind ('term', 'years' or 'range'), its value and offsets"""
+    kind: str
+    value: object
+    start: int
+    end: int
+
+class EmploymentRange(NamedTuple):
+    """An employment period as month indices (year * 12 + month - 1), end exclusive"""
+    start: int
+    end: int
+    position: int
+    
+    @property
+    def months(self) -> int:
+        return self.end - self.start
+    
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'start': f'{self.start // 12:04d}-{self.start % 12 + 1:02d}',
+            'end': f'{(self.end - 1) // 12:04d}-{(self.end - 1) % 12 + 1:02d}',
+            'months': self.months,
+            'position': self.position
+        }
+
+def _month_name_pattern(prefix: str) -> str:
+    return (rf'(?P<{prefix}_month>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?'
+            rf'|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?')
+
+def _date_pattern(prefix: str) -> str:
+    return (rf'\b(?:{_month_name_pattern(prefix)}\s*,?\s*(?P<{prefix}_year>(?:19|20)\d\d)'
+            rf'|(?P<{prefix}_num>0?[1-9]|1[0-2])\s*/\s*(?P<{prefix}_numyear>(?:19|20)\d\d)'
+            rf'|(?P<{prefix}_bare>(?:19|20)\d\d))\b')
+
+def _trie_pattern(words: List[str]) -> str:
+    """
+    Regex alternation of words folded into a prefix trie
+    
+    'manager|managed|managed team' becomes 'manage(?:d(?:\\s+team)?|r)', so
+    the engine tests each prefix once instead of once per word.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for token in re.findall(r'\s+|.', word):
+            node = node.setdefault(r'\s+' if token.isspace() else re.escape(token), {})
+        node[''] = {}
+    
+    def build(node: dict) -> str:
+        branches = [key + build(child) for key, child in sorted(node.items()) if key]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+    
+    return build(trie)
+
+def _build_scanner_pattern() -> re.Pattern:
+    terms = sorted({term for group in INDICATOR_TERMS.values() for term in group})
+    term_alternatives = _trie_pattern(terms)
+    # Separators may have been stripped to spaces by PDF text cleaning, so a
+    # space alone separates the dates when a month or 'present' sits next to
+    # it; two bare years ("BSc 2012 2016") are not a range
+    month_ahead = '|'.join(MONTHS) + r'|\d{1,2}\s*/|present|current|now|today|date'
+    range_pattern = (
+        rf'(?P<range>{_date_pattern("from")}\s*'
+        rf'(?:-+|–|—|\bto\b|\buntil\b|\btill\b|(?<=\s)(?(from_bare)(?=\s*(?:{month_ahead}))))\s*'
+        rf'(?:(?P<to_now>present|current|now|today|date)\b|{_date_pattern("to")}))'
+    )
+    years_pattern = (
+        r'(?P<claim>(?P<claim_years>\d+)\+?\s*(?:years?|yrs?)\b\s*'
+        r'(?:(?:of\s*)?(?:experience|exp)\b|in\b|with\b)'
+        r'|\b(?:over|more\s+than)\s*(?P<claim_min>\d+)\+?\s*(?:years?|yrs?)\b)'
+    )
+    # Every alternative starts a word with one of these characters; checking
+    # that first lets the engine skip most positions without trying them all
+    first_characters = ''.join(sorted(set('0123456789om' + ''.join(month[0] for month in MONTHS)
+                                                + ''.join(term[0] for term in terms))))
+    return re.compile(
+        rf'\b(?=[{first_characters}])(?:{range_pattern}|{years_pattern}|(?P<term>\b(?:{term_alternatives})s?\b))'
+    )
+
+SCANNER_PATTERN = _build_scanner_pattern()
+
+def _term_implications() -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Map every term to the (category, term) pairs it stands for
+    
+    The scanner keeps the longest match, so 'team lead' also has to count as
+    the shorter 'lead' it contains.
+    """
+    pairs = [(category, term) for category, terms in INDICATOR_TERMS.items() for term in terms]
+    implications = {}
+    for _, term in pairs:
+        implications[term] = [
+            (category, other) for category, other in pairs
+            if re.search(rf'\b{re.escape(other)}\b', term)
+        ]
+    return implications
+
+TERM_IMPLICATIONS = _term_implications()
+
+class ExperienceScan:
+    """Result of scanning one lowercased text"""
+    
+    def __init__(self, mentions: List[Mention]):
+        self.mentions = mentions
+    
+    def term_counts(self) -> Dict[str, int]:
+        """Number of distinct terms found per indicator category"""
+        found = {category: set() for category in INDICATOR_TERMS}
+        for mention in self.mentions:
+            if mention.kind == 'term':
+                for category, term in TERM_IMPLICATIONS[mention.value]:
+                    found[category].add(term)
+        return {category: len(terms) for category, terms in found.items()}
+    
+    def claimed_years(self) -> Optional[int]:
+        """Largest explicit 'N years of experience' style claim"""
+        claims = [mention.value for mention in self.mentions if mention.kind == 'years']
+        return max(claims) if claims else None
+    
+    def employment_ranges(self) -> List[EmploymentRange]:
+        return [mention.value for mention in self.mentions if mention.kind == 'range']
+    
+    def employment_years(self) -> Optional[float]:
+        """Total years covered by the employment date ranges, overlaps merged"""
+        ranges = sorted((r.start, r.end) for r in self.employment_ranges())
+        if not ranges:
+            return None
+        total = 0
+        current_start, current_end = ranges[0]
+        for start, end in ranges[1:]:
+            if start <= current_end:
+                current_end = max(current_end, end)
+            else:
+                total += current_end - current_start
+                current_start, current_end = start, end
+        total += current_end - current_start
+        return round(total / 12, 1)
+
+def _parse_date(match: re.Match, prefix: str) -> Optional[Tuple[int, bool]]:
+    """Month index of one side of a range, and whether it had month precision"""
+    if match.group(f'{prefix}_month'):
+        month = MONTHS[match.group(f'{prefix}_month')[:3]]
+        return int(match.group(f'{prefix}_year')) * 12 + month - 1, True
+    if match.group(f'{prefix}_num'):
+        return int(match.group(f'{prefix}_numyear')) * 12 + int(match.group(f'{prefix}_num')) - 1, True
+    if match.group(f'{prefix}_bare'):
+        return int(match.group(f'{prefix}_bare')) * 12, False
+    return None
+
+def _parse_range(match: re.Match, today: date) -> Optional[EmploymentRange]:
+    start, _ = _parse_date(match, 'from')
+    if match.group('to_now'):
+        end = today.year * 12 + today.month
+    else:
+        end, precise = _parse_date(match, 'to')
+        # Month-precision ends are inclusive ("Jan 2020 - Dec 2020" is 12 months)
+        if precise:
+            end += 1
+    if start >= end or start > today.year * 12 + today.month or end - start > MAX_PLAUSIBLE_YEARS * 12:
+        return None
+    return EmploymentRange(start, end, match.start())
+
+def scan_experience(text_lower: str, today: Optional[date] = None) -> ExperienceScan:
+    """
+    Collect every indicator term, year claim and employment range in one pass
+    
+    Args:
+        text_lower: Lowercased text
+        today: Date used for open-ended ranges ("2021 - present")
+    
+    Returns:
+        ExperienceScan with the mentions in document order
+    """
+    today = today or date.today()
+    mentions = []
+    for match in SCANNER_PATTERN.finditer(text_lower):
+        kind = match.lastgroup
+        if kind == 'term':
+            term = match.group(kind)
+            if term not in TERM_IMPLICATIONS:
+                term = ' '.join(term.split())
+                if term not in TERM_IMPLICATIONS:
+                    term = term[:-1]
+            mentions.append(Mention('term', term, match.start(), match.end()))
+        elif kind == 'claim':
+            years = int(match.group('claim_years') or match.group('claim_min'))
+            if years <= MAX_PLAUSIBLE_YEARS:
+                mentions.append(Mention('years', years, match.start(), match.end()))
+        else:
+            employment_range = _parse_range(match, today)
+            if employment_range:
+                mentions.append(Mention('range', employment_range, match.start(), match.end()))
+    return ExperienceScan(mentions)
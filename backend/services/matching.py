@@ -0,0 +1,273 @@
+"""
+Local matching utilities for RealiZe
+Skill vectors and BM25 relevance scoring for resume/job matching
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, Any, List, Iterable, Iterator, Optional
+
+import numpy as np
+
+from backend.models.skill_aliases import SKILL_CANONICALIZER
+
+class SkillVectorizer:
+    """Maps extracted skill dictionaries onto a fixed vocabulary of canonical skills"""
+    
+    def __init__(self, skill_keywords: Dict[str, Dict[str, List[str]]]):
+        self.skill_names = []
+        self.index = {}
+        for category_skills in skill_keywords.values():
+            for name in category_skills:
+                skill_id = SKILL_CANONICALIZER.canonical_id(name)
+                if skill_id not in self.index:
+                    self.index[skill_id] = len(self.skill_names)
+                    self.skill_names.append(SKILL_CANONICALIZER.canonical_name(skill_id))
+    
+    @property
+    def dimension(self) -> int:
+        return len(self.skill_names)
+    
+    def vectorize(self, skills: Dict[str, Any]) -> np.ndarray:
+        """Binary skill vector for one extracted skill dictionary (aliases share a position)"""
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for skill_list in skills.values():
+            if not isinstance(skill_list, list):
+                continue
+            for skill in skill_list:
+                if isinstance(skill, dict) and 'name' in skill:
+                    position = self.index.get(SKILL_CANONICALIZER.lookup(skill['name']))
+                    if position is not None:
+                        vector[position] = 1.0
+        return vector
+    
+    def vectorize_many(self, skills_list: Iterable[Dict[str, Any]]) -> np.ndarray:
+        """Stack skill vectors into an (n_documents, n_skills) matrix"""
+        vectors = [self.vectorize(skills) for skills in skills_list]
+        if not vectors:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.vstack(vectors)
+    
+    def names_for(self, vector: np.ndarray) -> List[str]:
+        """Skill names set in a vector"""
+        return [self.skill_names[i] for i in np.flatnonzero(vector)]
+
+def merge_terms(*groups: List[str]) -> List[str]:
+    """Concatenate skill/term lists, dropping case-insensitive duplicates"""
+    seen = set()
+    merged = []
+    for group in groups:
+        for term in group:
+            if term.lower() not in seen:
+                seen.add(term.lower())
+                merged.append(term)
+    return merged
+
+def score_jobs(resume_vector: np.ndarray, job_matrix: np.ndarray) -> np.ndarray:
+    """
+    Score every job against one resume in a single vectorized pass
+    
+    Args:
+        resume_vector: Binary skill vector of the resume
+        job_matrix: (n_jobs, n_skills) binary matrix of job requirements
+    
+    Returns:
+        Share of each job's detected skills covered by the resume (0-100)
+    """
+    if job_matrix.shape[0] == 0:
+        return np.zeros(0, dtype=np.float32)
+    required = job_matrix.sum(axis=1)
+    covered = job_matrix @ resume_vector
+    scores = np.divide(covered, required, out=np.zeros_like(covered), where=required > 0)
+    return scores * 100.0
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*')
+
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could
+do does each for from had has have having he her his i if in into is it its may me
+more most must my no not of on or our out over own per she should so such than that
+the their them then there these they this those through to under up very was we were
+what when where which while who will with within would you your
+ability able applicant candidate candidates company duties etc excellent experience
+experienced good great ideal including job join knowledge looking plus position
+preferred required requirements responsibilities responsible role skills strong team
+understanding using work working year years
+""".split())
+
+DEMAND_WEIGHTS = {'high': 3.0, 'medium': 2.0, 'low': 1.5}
+
+def iter_tokens(text: str, lowered: bool = False) -> Iterator[str]:
+    """Lowercased word tokens without stopwords and numbers (keeps c++, c#, node.js)"""
+    for match in TOKEN_PATTERN.finditer(text if lowered else text.lower()):
+        token = match.group()
+        if token not in STOPWORDS and not token[0].isdigit():
+            yield token
+
+class MatchDocument:
+    """Precomputed term statistics of one resume or job description"""
+    
+    __slots__ = ('term_counts', 'length', 'skills')
+    
+    def __init__(self, text: str, skills: Dict[str, Any], lowered: bool = False):
+        self.term_counts = Counter(iter_tokens(text, lowered))
+        self.length = sum(self.term_counts.values())
+        # Canonical skill id -> mentions
+        self.skills = SKILL_CANONICALIZER.skill_mentions(skills)
+    
+    @classmethod
+    def from_context(cls, context, skills: Dict[str, Any]) -> 'MatchDocument':
+        """Build from an AnalysisContext, reusing its lowercased text"""
+        return cls(context.lower, skills, lowered=True)
+
+class CorpusStats:
+    """
+    Frozen BM25 corpus statistics: document frequencies and total length
+    
+    Built offline from the resume store, one document per resume_id, and
+    loaded from a JSON snapshot, so every worker scores the same input the
+    same way. Requests never change it; an empty corpus gives every term
+    the same IDF and normalizes by the resume's own length.
+    """
+    
+    def __init__(self, document_frequency: Optional[Dict[str, int]] = None, document_count: int = 0,
+                 total_length: int = 0):
+        self.document_frequency = dict(document_frequency or {})
+        self.document_count = document_count
+        self.total_length = total_length
+        payload = json.dumps([self.document_count, self.total_length, self.document_frequency], sort_keys=True)
+        self.version = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:12]
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'CorpusStats':
+        """Statistics over resume store records, counting each resume_id once"""
+        document_frequency = Counter()
+        seen = set()
+        total_length = 0
+        for record in records:
+            if record['resume_id'] in seen:
+                continue
+            seen.add(record['resume_id'])
+            document = MatchDocument(record['text'], record.get('basic_skills', {}))
+            document_frequency.update(document.term_counts.keys())
+            total_length += document.length
+        return cls(document_frequency, len(seen), total_length)
+    
+    @classmethod
+    def load(cls, path: str) -> 'CorpusStats':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['document_frequency'], data['document_count'], data['total_length'])
+    
+    def save(self, path: str):
+        """Write the snapshot atomically"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': self.version,
+                'document_count': self.document_count,
+                'total_length': self.total_length,
+                'document_frequency': self.document_frequency
+            }, f, ensure_ascii=False, sort_keys=True)
+        os.replace(temp_path, path)
+    
+    @property
+    def average_length(self) -> Optional[float]:
+        return self.total_length / self.document_count if self.document_count else None
+
+class JobMatchScorer:
+    """
+    Local resume/job relevance scorer
+    
+    Combines a BM25 score of the job description terms against the resume
+    with a skill coverage score in which each required skill is weighted by
+    its market demand level from the SkillDatabase. Skills are compared by
+    canonical id, so 'Vue' in a resume covers 'Vue.js' in a job description.
+    IDF and length normalization come from a frozen CorpusStats snapshot.
+    """
+    
+    def __init__(self, demand_levels: Optional[Dict[str, str]] = None, corpus: Optional[CorpusStats] = None,
+                 k1: float = 1.2, b: float = 0.75, skill_weight: float = 0.6):
+        self.k1 = k1
+        self.b = b
+        self.skill_weight = skill_weight
+        self.set_demand_levels(demand_levels or {})
+        self.corpus = corpus or CorpusStats()
+    
+    def set_demand_levels(self, demand_levels: Dict[str, str]):
+        """Replace the skill demand levels (e.g. after the skills database was reloaded)"""
+        self.skill_boosts = {
+            SKILL_CANONICALIZER.canonical_id(name): DEMAND_WEIGHTS.get(str(level).lower(), 1.0)
+            for name, level in demand_levels.items()
+        }
+    
+    def idf(self, term: str) -> float:
+        df = self.corpus.document_frequency.get(term, 0)
+        return math.log(1.0 + (self.corpus.document_count - df + 0.5) / (df + 0.5))
+    
+    def skill_boost(self, skill) -> float:
+        """Demand weight of a skill given by canonical id or by any of its names"""
+        skill_id = skill if isinstance(skill, int) else SKILL_CANONICALIZER.lookup(skill)
+        return self.skill_boosts.get(skill_id, 1.0)
+    
+    def score(self, resume: MatchDocument, job: MatchDocument) -> Dict[str, Any]:
+        """
+        Score a resume against a job description
+        
+        Returns:
+            Overall score (0-100), its lexical and skill components, and the
+            matched and missing job skills and terms
+        """
+        average_length = self.corpus.average_length or max(resume.length, 1)
+        length_norm = self.k1 * (1 - self.b + self.b * resume.length / max(average_length, 1))
+        
+        achieved = 0.0
+        attainable = 0.0
+        term_contributions = []
+        for term, query_count in job.term_counts.items():
+            weight = self.idf(term) * query_count
+            attainable += weight * (self.k1 + 1)
+            tf = resume.term_counts.get(term, 0)
+            if tf:
+                contribution = weight * tf * (self.k1 + 1) / (tf + length_norm)
+                achieved += contribution
+                term_contributions.append((contribution, term))
+        lexical_score = 100.0 * achieved / attainable if attainable else 0.0
+        
+        matched_skills = [skill_id for skill_id in job.skills if skill_id in resume.skills]
+        missing_skills = [skill_id for skill_id in job.skills if skill_id not in resume.skills]
+        skill_total = sum(self.skill_boost(skill_id) for skill_id in job.skills)
+        skill_score = (100.0 * sum(self.skill_boost(skill_id) for skill_id in matched_skills) / skill_total
+                       if skill_total else 0.0)
+        
+        skill_weight = self.skill_weight if job.skills else 0.0
+        overall = skill_weight * skill_score + (1 - skill_weight) * lexical_score
+        
+        matched_terms = {term for _, term in term_contributions}
+        missing_terms = sorted(
+            (term for term in job.term_counts if term not in matched_terms),
+            key=lambda term: -self.idf(term) * job.term_counts[term]
+        )
+        
+        return {
+            'score': round(overall, 1),
+            'lexical_score': round(lexical_score, 1),
+            'skill_score': round(skill_score, 1),
+            'matched_skills': self._skill_names(matched_skills),
+            'missing_skills': self._skill_names(missing_skills),
+            'top_matching_terms': [term for _, term in sorted(term_contributions, reverse=True)[:10]],
+            'missing_terms': missing_terms[:10]
+        }
+    
+    def _skill_names(self, skill_ids: List[int]) -> List[str]:
+        """Canonical names of skill ids, most in-demand first"""
+        ranked = sorted(skill_ids, key=lambda skill_id: -self.skill_boost(skill_id))
+        return [SKILL_CANONICALIZER.canonical_name(skill_id) for skill_id in ranked]
@@ -6,18 +6,171 @@ Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
 
 import os
 import json
-import requests
+import hashlib
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Dict, Any, Optional
 
+from backend.models.skill_aliases import SKILL_CANONICALIZER
+
 logger = logging.getLogger(__name__)
 
+SKILL_ANALYSIS_PROMPT = """You are a professional IT skills analyst. Analyze the following resume text and extract:
+
+1. Programming Languages (with proficiency levels)
+2. Frameworks and Libraries
+3. Databases
+4. Cloud Platforms
+5. Development Tools
+6. Certifications
+7. Soft Skills
+8. Experience Level Assessment
+
+Return your analysis as a JSON object with the following structure:
+{
+  "programming_languages": [{"name": "Python", "proficiency": "Advanced", "mentions": 3}],
+  "frameworks": [{"name": "React", "proficiency": "Intermediate", "mentions": 2}],
+  "databases": [{"name": "MySQL", "proficiency": "Advanced", "mentions": 1}],
+  "cloud_platforms": [{"name": "AWS", "proficiency": "Intermediate", "mentions": 1}],
+  "tools": [{"name": "Git", "proficiency": "Advanced", "mentions": 5}],
+  "certifications": ["AWS Certified Developer", "Google Cloud Professional"],
+  "soft_skills": ["Leadership", "Problem Solving", "Communication"],
+  "experience_level": "Senior",
+  "overall_score": 85
+}"""
+
+JOB_COMPARISON_PROMPT = """You are a professional recruitment analyst. Compare the following resume with a job description and provide:
+
+1. Skills Match Score (0-100)
+2. Missing Skills/Gaps
+3. Strong Matches
+4. Additional Recommendations
+5. Overall Fit Assessment
+
+Return as JSON:
+{
+  "match_score": 75,
+  "strong_matches": ["Python", "React", "Problem Solving"],
+  "missing_skills": ["Docker", "Kubernetes", "Microservices"],
+  "recommendations": ["Consider learning Docker for containerization", "Add Kubernetes experience to improve cloud skills"],
+  "overall_assessment": "Good fit with some skill gaps that can be addressed",
+  "priority_gaps": ["Docker", "Kubernetes"]
+}"""
+
+CAREER_SUGGESTIONS_PROMPT = """You are a career counselor specialized in IT careers. Based on the resume analysis, provide:
+
+1. Career Path Recommendations (3-5 options)
+2. Learning Roadmap for each path
+3. Skills to Develop
+4. Industry Trends to watch
+5. Salary expectations range
+6. Next steps action plan
+
+Return as JSON:
+{
+  "career_paths": [
+    {
+      "title": "Senior Full Stack Developer",
+      "match_percentage": 90,
+      "description": "Leverage your Python and React skills",
+      "learning_path": ["Advanced Python patterns", "System design", "Cloud architecture"]
+    }
+  ],
+  "skills_to_develop": ["System Design", "Cloud Architecture", "DevOps"],
+  "industry_trends": ["AI/ML Integration", "Serverless Computing", "Edge Computing"],
+  "salary_range": {"min": 80000, "max": 120000},
+  "action_plan": ["Complete a cloud certification", "Build a portfolio project", "Network with industry professionals"]
+}"""
+
+AI_RECOMMENDATIONS_PROMPT = """You are a professional career advisor specializing in IT. Based on the resume analysis provided, generate 3-5 specific, actionable recommendations for career improvement. Focus on:
+
+1. Skill gaps to address
+2. Experience areas to develop
+3. Certifications to consider
+4. Career advancement strategies
+5. Industry trends to follow
+
+Each recommendation should be:
+- Specific and actionable
+- Based on the actual resume content
+- Tailored to IT industry standards
+- Include a brief explanation of why it's important
+
+Return as JSON:
+{
+  "recommendations": [
+    {
+      "title": "Recommendation title",
+      "description": "Detailed explanation and action steps",
+      "priority": "High/Medium/Low",
+      "category": "Skills/Certifications/Experience/Trends"
+    }
+  ]
+}"""
+
+AI_SUMMARY_PROMPT = """You are a professional resume reviewer. Analyze the complete resume and provide a comprehensive summary including:
+
+1. Overall assessment of the candidate
+2. Key strengths and competitive advantages
+3. Areas that need improvement
+4. Career trajectory assessment
+5. Market competitiveness analysis
+6. Summary assessment (Brief overall evaluation)
+
+Be honest, constructive, and specific. Focus on actionable insights.
+
+Return as JSON:
+{
+  "overall_assessment": "Brief overall evaluation (1-2 sentences)",
+  "key_strengths": ["Strength 1", "Strength 2", "Strength 3"],
+  "areas_for_improvement": ["Area 1", "Area 2"],
+  "career_trajectory": "Assessment of career progression potential",
+  "market_competitiveness": "How competitive the candidate is in current market",
+  "summary": "Comprehensive 2-3 paragraph summary of the candidate"
+}"""
+
+PROMPTS = {
+    'skill_analysis': SKILL_ANALYSIS_PROMPT,
+    'job_comparison': JOB_COMPARISON_PROMPT,
+    'career_suggestions': CAREER_SUGGESTIONS_PROMPT,
+    'ai_recommendations': AI_RECOMMENDATIONS_PROMPT,
+    'ai_summary': AI_SUMMARY_PROMPT,
+}
+
+RESUME_WITH_SKILLS_TEMPLATE = """RESUME:
+{resume_text}
+
+SKILLS ANALYSIS:
+{skills_analysis}"""
+
+# User message sent with each prompt, filled in by OpenRouterService._messages
+USER_TEMPLATES = {
+    'skill_analysis': """Analyze this resume text:
+
+{resume_text}""",
+    'job_comparison': """RESUME:
+{resume_text}
+
+JOB DESCRIPTION:
+{job_description}""",
+    'career_suggestions': RESUME_WITH_SKILLS_TEMPLATE,
+    'ai_recommendations': RESUME_WITH_SKILLS_TEMPLATE,
+    'ai_summary': RESUME_WITH_SKILLS_TEMPLATE,
+}
+
+DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
+
+# Set while requests are shed to local-only analysis (see OpenRouterService.local_only)
+LOCAL_ONLY = ContextVar('openrouter_local_only', default=False)
+
 class OpenRouterService:
     """Service for interacting with OpenRouter API"""
     
     def __init__(self):
         self.api_key = os.environ.get('OPENROUTER_API_KEY')
-        self.base_url = "https://openrouter.ai/api/v1"
+        # Point at a local stand-in (benchmarks/openrouter_stub.py) for load tests
+        self.base_url = os.environ.get('OPENROUTER_BASE_URL', DEFAULT_BASE_URL).rstrip('/')
         self.model = "minimax/minimax-m2:free"
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -29,6 +182,61 @@ class OpenRouterService:
         if not self.api_key:
             logger.warning("OpenRouter API key not found. Some features will be limited.")
     
+    @property
+    def llm_enabled(self) -> bool:
+        """Whether calls go to the LLM: an API key is set and local-only mode is off"""
+        return bool(self.api_key) and not LOCAL_ONLY.get()
+    
+    @contextmanager
+    def local_only(self):
+        """
+        Answer every call in the block with the local fallbacks
+        
+        Used to shed load. The mode is a context variable, so it covers the
+        current request only; work handed to thread pools must run in a copy
+        of the context (contextvars.copy_context) to inherit it.
+        """
+        token = LOCAL_ONLY.set(True)
+        try:
+            yield
+        finally:
+            LOCAL_ONLY.reset(token)
+    
+    def prompt_fingerprint(self) -> str:
+        """
+        Fingerprint of everything that shapes the API output
+        
+        Changes whenever a prompt, the model, the endpoint or the fallback mode changes,
+        so cached analysis results can be invalidated automatically.
+        """
+        payload = json.dumps({
+            'prompts': PROMPTS,
+            'user_templates': USER_TEMPLATES,
+            'model': self.model,
+            'base_url': self.base_url,
+            'llm_enabled': bool(self.api_key)
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _messages(key: str, **fields: Any) -> list:
+        """
+        System and user messages for a prompt
+        
+        Args:
+            key: Key of PROMPTS and USER_TEMPLATES
+            **fields: Values for the user template; anything but text is sent as indented JSON
+        
+        Returns:
+            List of message dictionaries
+        """
+        values = {name: value if isinstance(value, str) else json.dumps(value, indent=2)
+                  for name, value in fields.items()}
+        return [
+            {"role": "system", "content": PROMPTS[key]},
+            {"role": "user", "content": USER_TEMPLATES[key].format(**values)}
+        ]
+    
     def _make_request(self, messages: list, max_tokens: int = 1000) -> Optional[str]:
         """
         Make a request to OpenRouter API
@@ -40,6 +248,9 @@ class OpenRouterService:
         Returns:
             Response text or None if request fails
         """
+        # Imported on first use: requests is a large share of the app's import time
+        import requests
+        
         try:
             data = {
                 "model": self.model,
@@ -80,41 +291,10 @@ class OpenRouterService:
         Returns:
             Dictionary containing skill analysis
         """
-        if not self.api_key:
+        if not self.llm_enabled:
             return self._fallback_skill_analysis(resume_text)
         
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a professional IT skills analyst. Analyze the following resume text and extract:
-
-1. Programming Languages (with proficiency levels)
-2. Frameworks and Libraries
-3. Databases
-4. Cloud Platforms
-5. Development Tools
-6. Certifications
-7. Soft Skills
-8. Experience Level Assessment
-
-Return your analysis as a JSON object with the following structure:
-{
-  "programming_languages": [{"name": "Python", "proficiency": "Advanced", "mentions": 3}],
-  "frameworks": [{"name": "React", "proficiency": "Intermediate", "mentions": 2}],
-  "databases": [{"name": "MySQL", "proficiency": "Advanced", "mentions": 1}],
-  "cloud_platforms": [{"name": "AWS", "proficiency": "Intermediate", "mentions": 1}],
-  "tools": [{"name": "Git", "proficiency": "Advanced", "mentions": 5}],
-  "certifications": ["AWS Certified Developer", "Google Cloud Professional"],
-  "soft_skills": ["Leadership", "Problem Solving", "Communication"],
-  "experience_level": "Senior",
-  "overall_score": 85
-}"""
-            },
-            {
-                "role": "user", 
-                "content": f"Analyze this resume text:\n\n{resume_text}"
-            }
-        ]
+        messages = self._messages('skill_analysis', resume_text=resume_text)
         
         response = self._make_request(messages, max_tokens=1500)
         
@@ -124,7 +304,8 @@ Return your analysis as a JSON object with the following structure:
                 import re
                 json_match = re.search(r'\{.*\}', response, re.DOTALL)
                 if json_match:
-                    return json.loads(json_match.group())
+                    # Same skill, same name: "Vue", "VueJS" and "Vue.js" all become "Vue.js"
+                    return SKILL_CANONICALIZER.canonicalize_skills(json.loads(json_match.group()))
                 else:
                     return {"error": "Could not parse JSON response", "raw_response": response}
             except json.JSONDecodeError:
@@ -144,39 +325,11 @@ Return your analysis as a JSON object with the following structure:
         Returns:
             Dictionary containing comparison analysis
         """
-        if not self.api_key:
+        if not self.llm_enabled:
             return self._fallback_job_comparison(resume_text, job_description)
         
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a professional recruitment analyst. Compare the following resume with a job description and provide:
-
-1. Skills Match Score (0-100)
-2. Missing Skills/Gaps
-3. Strong Matches
-4. Additional Recommendations
-5. Overall Fit Assessment
-
-Return as JSON:
-{
-  "match_score": 75,
-  "strong_matches": ["Python", "React", "Problem Solving"],
-  "missing_skills": ["Docker", "Kubernetes", "Microservices"],
-  "recommendations": ["Consider learning Docker for containerization", "Add Kubernetes experience to improve cloud skills"],
-  "overall_assessment": "Good fit with some skill gaps that can be addressed",
-  "priority_gaps": ["Docker", "Kubernetes"]
-}"""
-            },
-            {
-                "role": "user",
-                "content": f"""RESUME:
-{resume_text}
-
-JOB DESCRIPTION:
-{job_description}"""
-            }
-        ]
+        messages = self._messages('job_comparison', resume_text=resume_text,
+                                  job_description=job_description)
         
         response = self._make_request(messages, max_tokens=1200)
         
@@ -204,46 +357,11 @@ JOB DESCRIPTION:
         Returns:
             Dictionary containing career suggestions
         """
-        if not self.api_key:
+        if not self.llm_enabled:
             return self._fallback_career_suggestions(resume_text, skills_analysis)
         
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a career counselor specialized in IT careers. Based on the resume analysis, provide:
-
-1. Career Path Recommendations (3-5 options)
-2. Learning Roadmap for each path
-3. Skills to Develop
-4. Industry Trends to watch
-5. Salary expectations range
-6. Next steps action plan
-
-Return as JSON:
-{
-  "career_paths": [
-    {
-      "title": "Senior Full Stack Developer",
-      "match_percentage": 90,
-      "description": "Leverage your Python and React skills",
-      "learning_path": ["Advanced Python patterns", "System design", "Cloud architecture"]
-    }
-  ],
-  "skills_to_develop": ["System Design", "Cloud Architecture", "DevOps"],
-  "industry_trends": ["AI/ML Integration", "Serverless Computing", "Edge Computing"],
-  "salary_range": {"min": 80000, "max": 120000},
-  "action_plan": ["Complete a cloud certification", "Build a portfolio project", "Network with industry professionals"]
-}"""
-            },
-            {
-                "role": "user",
-                "content": f"""RESUME:
-{resume_text}
-
-SKILLS ANALYSIS:
-{json.dumps(skills_analysis, indent=2)}"""
-            }
-        ]
+        messages = self._messages('career_suggestions', resume_text=resume_text,
+                                  skills_analysis=skills_analysis)
         
         response = self._make_request(messages, max_tokens=1500)
         
@@ -271,47 +389,11 @@ SKILLS ANALYSIS:
         Returns:
             Dictionary containing AI recommendations
         """
-        if not self.api_key:
+        if not self.llm_enabled:
             return self._fallback_ai_recommendations(resume_text, skills_analysis)
         
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a professional career advisor specializing in IT. Based on the resume analysis provided, generate 3-5 specific, actionable recommendations for career improvement. Focus on:
-
-1. Skill gaps to address
-2. Experience areas to develop
-3. Certifications to consider
-4. Career advancement strategies
-5. Industry trends to follow
-
-Each recommendation should be:
-- Specific and actionable
-- Based on the actual resume content
-- Tailored to IT industry standards
-- Include a brief explanation of why it's important
-
-Return as JSON:
-{
-  "recommendations": [
-    {
-      "title": "Recommendation title",
-      "description": "Detailed explanation and action steps",
-      "priority": "High/Medium/Low",
-      "category": "Skills/Certifications/Experience/Trends"
-    }
-  ]
-}"""
-            },
-            {
-                "role": "user",
-                "content": f"""RESUME:
-{resume_text}
-
-SKILLS ANALYSIS:
-{json.dumps(skills_analysis, indent=2)}"""
-            }
-        ]
+        messages = self._messages('ai_recommendations', resume_text=resume_text,
+                                  skills_analysis=skills_analysis)
         
         response = self._make_request(messages, max_tokens=1200)
         
@@ -339,42 +421,11 @@ SKILLS ANALYSIS:
         Returns:
             Dictionary containing AI resume summary
         """
-        if not self.api_key:
+        if not self.llm_enabled:
             return self._fallback_ai_summary(resume_text, skills_analysis)
         
-        messages = [
-            {
-                "role": "system",
-                "content": """You are a professional resume reviewer. Analyze the complete resume and provide a comprehensive summary including:
-
-1. Overall assessment of the candidate
-2. Key strengths and competitive advantages
-3. Areas that need improvement
-4. Career trajectory assessment
-5. Market competitiveness analysis
-6. Summary assessment (Brief overall evaluation)
-
-Be honest, constructive, and specific. Focus on actionable insights.
-
-Return as JSON:
-{
-  "overall_assessment": "Brief overall evaluation (1-2 sentences)",
-  "key_strengths": ["Strength 1", "Strength 2", "Strength 3"],
-  "areas_for_improvement": ["Area 1", "Area 2"],
-  "career_trajectory": "Assessment of career progression potential",
-  "market_competitiveness": "How competitive the candidate is in current market",
-  "summary": "Comprehensive 2-3 paragraph summary of the candidate"
-}"""
-            },
-            {
-                "role": "user",
-                "content": f"""RESUME:
-{resume_text}
-
-SKILLS ANALYSIS:
-{json.dumps(skills_analysis, indent=2)}"""
-            }
-        ]
+        messages = self._messages('ai_summary', resume_text=resume_text,
+                                  skills_analysis=skills_analysis)
         
         response = self._make_request(messages, max_tokens=1500)
         
@@ -431,7 +482,7 @@ SKILLS ANALYSIS:
                     "mentions": text_lower.count(tool.lower())
                 })
         
-        return {
+        return SKILL_CANONICALIZER.canonicalize_skills({
             "programming_languages": programming_languages,
             "frameworks": frameworks,
             "databases": [],
@@ -442,7 +493,7 @@ SKILLS ANALYSIS:
             "experience_level": "Mid-Level",
             "overall_score": 60,
             "note": "Basic analysis - configure OpenRouter API for detailed analysis"
-        }
+        })
     
     def _fallback_job_comparison(self, resume_text: str, job_description: str) -> Dict[str, Any]:
         """Fallback job comparison when API key is not available"""
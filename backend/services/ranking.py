@@ -0,0 +1,166 @@
+"""
+Candidate ranking engine for RealiZe
+Ranks many analyzed resumes against one job description using skill vectors
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import contextvars
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class CandidateRanker:
+    """Keeps a precomputed skill matrix of resumes and ranks it against jobs"""
+    
+    def __init__(self, analyzer, initial_capacity: int = 1024):
+        self.analyzer = analyzer
+        self.vectorizer = analyzer.skill_vectorizer
+        self._matrix = np.zeros((initial_capacity, self.vectorizer.dimension), dtype=np.float32)
+        self._resume_ids = []
+        self._rows = {}
+        self._lock = threading.Lock()
+        self._store_marker = 0
+        self._sync_lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._resume_ids)
+    
+    def add_resume(self, resume_id: str, resume_skills: Dict[str, Any]):
+        """Add or update the skill vector of one resume"""
+        vector = self.vectorizer.vectorize(resume_skills)
+        with self._lock:
+            row = self._rows.get(resume_id)
+            if row is None:
+                row = len(self._resume_ids)
+                if row == self._matrix.shape[0]:
+                    grown = np.zeros((row * 2, self._matrix.shape[1]), dtype=np.float32)
+                    grown[:row] = self._matrix
+                    self._matrix = grown
+                self._resume_ids.append(resume_id)
+                self._rows[resume_id] = row
+            self._matrix[row] = vector
+    
+    def sync_from(self, resume_store) -> int:
+        """
+        Add the resumes stored since the last sync, including those stored by other worker processes
+        
+        Returns:
+            Number of resumes added or updated
+        """
+        with self._sync_lock:
+            self._store_marker, records = resume_store.records_since(self._store_marker)
+            for record in records:
+                self.add_resume(record['resume_id'], record['basic_skills'])
+        return len(records)
+    
+    def add_stored(self, resume_store, resumes: Dict[str, Dict[str, Any]]):
+        """
+        Add resumes this process has just saved to a resume store
+        
+        With a durable store they are picked up by sync_from along with other
+        workers' writes, so each is vectorized once; a memory-only store has
+        nothing to sync from, so they are added directly.
+        
+        Args:
+            resume_store: The ResumeStore the resumes were saved to
+            resumes: Basic skills by resume id
+        """
+        if resume_store.durable:
+            self.sync_from(resume_store)
+        else:
+            for resume_id, resume_skills in resumes.items():
+                self.add_resume(resume_id, resume_skills)
+    
+    def rank(self, job_description: str, page: int = 1, page_size: int = 50, llm_review_top: int = 0,
+             text_lookup: Optional[Callable[[str], Optional[str]]] = None) -> Dict[str, Any]:
+        """
+        Rank every known resume against a job description
+        
+        Args:
+            job_description: Job description text
+            page: 1-based page number
+            page_size: Candidates per page
+            llm_review_top: Review the candidates ranked 1..llm_review_top (overall, not per page) with the LLM
+            text_lookup: Returns the resume text for a resume id (needed for LLM review)
+        
+        Returns:
+            One page of ranked candidates with their local scores
+        """
+        job_skills = self.analyzer._extract_basic_skills(job_description)
+        job_vector = self.vectorizer.vectorize(job_skills)
+        required = float(job_vector.sum())
+        
+        with self._lock:
+            count = len(self._resume_ids)
+            matrix = self._matrix[:count]
+            resume_ids = list(self._resume_ids)
+        
+        if required > 0 and count:
+            scores = (matrix @ job_vector) * (100.0 / required)
+        else:
+            scores = np.zeros(count, dtype=np.float32)
+        
+        page = max(1, page)
+        page_size = max(1, page_size)
+        start = (page - 1) * page_size
+        end = min(count, start + page_size)
+        
+        order = np.zeros(0, dtype=np.int64)
+        if start < count:
+            # Only fully sort the prefix the requested page needs; keep every
+            # candidate tied with the cut-off so pages stay consistent
+            if end < count:
+                cutoff = -np.partition(-scores, end - 1)[end - 1]
+                head = np.flatnonzero(scores >= cutoff)
+            else:
+                head = np.arange(count)
+            order = head[np.lexsort((head, -scores[head]))][start:end]
+        
+        candidates = []
+        for offset, row in enumerate(order):
+            candidates.append({
+                'rank': start + offset + 1,
+                'resume_id': resume_ids[row],
+                'local_score': round(float(scores[row]), 1),
+                'matched_skills': self.vectorizer.names_for(matrix[row] * job_vector),
+                'missing_skills': self.vectorizer.names_for(job_vector * (1 - matrix[row])),
+                'llm_review': None
+            })
+        
+        head = [candidate for candidate in candidates if candidate['rank'] <= llm_review_top]
+        if head and text_lookup is not None:
+            self._review_head(head, job_description, text_lookup)
+        
+        return {
+            'job_skills': self.vectorizer.names_for(job_vector),
+            'total_candidates': count,
+            'page': page,
+            'page_size': page_size,
+            'total_pages': (count + page_size - 1) // page_size,
+            'candidates': candidates,
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    def _review_head(self, candidates: List[Dict[str, Any]], job_description: str,
+                     text_lookup: Callable[[str], Optional[str]]):
+        """Attach detailed LLM comparisons to the head of the ranking, concurrently"""
+        texts = [text_lookup(candidate['resume_id']) for candidate in candidates]
+        reviewable = [(candidate, text) for candidate, text in zip(candidates, texts) if text]
+        if not reviewable:
+            return
+        
+        workers = max(1, min(len(reviewable), self.analyzer.llm_max_concurrency))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Each review runs in a copy of this request's context (e.g. local-only mode)
+            reviews = executor.map(
+                lambda item, context: context.run(self.analyzer._detailed_job_comparison, item[1], job_description),
+                reviewable, [contextvars.copy_context() for _ in reviewable]
+            )
+            for (candidate, _), review in zip(reviewable, reviews):
+                candidate['llm_review'] = review
@@ -0,0 +1,83 @@
+"""
+Service registry for RealiZe
+Builds each backend service once, on first use, from a registered factory
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+class ServiceRegistry:
+    """
+    Lazily constructed, process-wide service instances
+    
+    Factories are registered by name and run on the first lookup, so importing
+    the app does not import PyPDF2, numpy or requests or build any service.
+    Factories may look up other services; construction is serialized by one
+    re-entrant lock, and each factory runs at most once.
+    """
+    
+    def __init__(self):
+        self._factories = {}
+        self._instances = {}
+        self._lock = threading.RLock()
+    
+    def register(self, name: str, factory: Callable[[], Any]):
+        """
+        Register the factory of a service
+        
+        Args:
+            name: Service name, also available as an attribute of the registry
+            factory: Zero-argument callable returning the service
+        """
+        with self._lock:
+            if name in self._instances:
+                raise ValueError(f"Service already created: {name}")
+            self._factories[name] = factory
+    
+    def get(self, name: str) -> Any:
+        """
+        The service instance, created on first use
+        
+        Raises:
+            KeyError: If no factory is registered under the name
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._lock:
+            if name not in self._instances:
+                if name not in self._factories:
+                    raise KeyError(f"No service registered as {name!r}")
+                factory = self._factories[name]
+                start = time.perf_counter()
+                self._instances[name] = factory()
+                logger.debug(f"Created service {name} in {(time.perf_counter() - start) * 1000:.1f} ms")
+            return self._instances[name]
+    
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name not in self._factories:
+            raise AttributeError(f"No service registered as {name!r}")
+        return self.get(name)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._factories
+    
+    def names(self) -> List[str]:
+        return list(self._factories)
+    
+    def created(self) -> Dict[str, Any]:
+        """Services constructed so far, by name"""
+        return dict(self._instances)
+    
+    def create_all(self) -> Dict[str, Any]:
+        """Construct every registered service, e.g. before forking workers"""
+        for name in self.names():
+            self.get(name)
+        return self.created()
@@ -0,0 +1,389 @@
+"""
+Inverted index over analyzed resumes for RealiZe
+Maps skills and experience levels to posting lists and answers boolean queries
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Set
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows: appends of several processes are then not serialized
+    fcntl = None
+
+from backend.models.skill_aliases import SKILL_CANONICALIZER
+
+logger = logging.getLogger(__name__)
+
+class QuerySyntaxError(ValueError):
+    """Raised when a search query cannot be parsed"""
+
+class ResumeIndex:
+    """
+    Inverted index from skill / level terms to posting lists of resume ids
+    
+    Updates are appended to a JSON-lines journal, so adding a resume costs one
+    line of I/O; the journal is replayed on startup. Worker processes share
+    the journal: before searching, each one replays the lines the others
+    appended, and appends and compaction hold a file lock. It is compacted
+    once the superseded lines outnumber both COMPACT_MIN_SUPERSEDED and the
+    live ones.
+    """
+    
+    COMPACT_MIN_SUPERSEDED = 1000
+    
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            path = os.environ.get('RESUME_INDEX_PATH', os.path.join('cache', 'resume_index.jsonl'))
+        self.path = path
+        self._resume_ids = []
+        self._doc_ids = {}
+        self._documents = []
+        self._postings = {}
+        self._journal_lines = 0
+        # Journal file (inode) replayed so far, and the byte offset reached in it
+        self._journal_inode = None
+        self._journal_offset = 0
+        self._lock_file = None
+        self._lock = threading.RLock()
+        
+        if self.path and os.path.exists(self.path):
+            with self._lock, self._journal_lock():
+                self._catch_up()
+                logger.info(f"Loaded resume index with {len(self)} resumes from {self._journal_lines} journal entries")
+                self._compact_if_needed()
+    
+    def __len__(self) -> int:
+        return len(self._resume_ids)
+    
+    def add_resume(self, resume_id: str, basic_skills: Dict[str, Any],
+                   experience_analysis: Dict[str, Any], persist: bool = True):
+        """
+        Index (or re-index) one analyzed resume
+        
+        Args:
+            resume_id: Resume id from the resume store
+            basic_skills: Output of ResumeAnalyzer._extract_basic_skills
+            experience_analysis: Output of ResumeAnalyzer._analyze_experience_indicators
+            persist: Append the update to the on-disk journal
+        """
+        self._add([self._document(resume_id, basic_skills, experience_analysis)], persist)
+    
+    def add_many(self, entries: List[Dict[str, Any]]):
+        """Index several resumes with a single journal write"""
+        self._add([
+            self._document(entry['resume_id'], entry['basic_skills'], entry['experience_analysis'])
+            for entry in entries
+        ])
+    
+    def refresh(self):
+        """Apply the journal lines other worker processes appended since the last look"""
+        if self.path:
+            with self._lock:
+                self._catch_up()
+    
+    def search(self, query: str = '', level: Optional[str] = None, min_years: Optional[int] = None,
+               offset: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """
+        Run a boolean query with optional filters
+        
+        Query syntax: skill names combined with AND, OR, NOT and parentheses,
+        e.g. 'kubernetes AND (go OR rust) AND level:senior'. Adjacent terms
+        are ANDed, multi-word skills are quoted ("ruby on rails") and
+        'years>=5' style comparisons filter on detected years of experience.
+        
+        Returns:
+            Total number of hits and one page of matching documents
+        """
+        with self._lock:
+            self.refresh()
+            if query.strip():
+                hits = _QueryParser(query, self).parse()
+            else:
+                hits = set(range(len(self._resume_ids)))
+            if level:
+                hits = hits & self._postings.get(f'level:{level.lower()}', set())
+            if min_years is not None:
+                hits = hits & self._years_matching('>=', min_years)
+            
+            ordered = sorted(hits)
+            page = [dict(self._documents[doc_id]) for doc_id in ordered[offset:offset + limit]]
+        
+        return {
+            'total': len(ordered),
+            'offset': offset,
+            'limit': limit,
+            'results': page
+        }
+    
+    def compact(self):
+        """Rewrite the journal with one line per indexed resume"""
+        if not self.path:
+            return
+        with self._lock, self._journal_lock():
+            # Keep what other workers appended
+            self._catch_up()
+            temp_path = f'{self.path}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for document in self._documents:
+                    f.write(json.dumps(document, ensure_ascii=False) + '\n')
+            os.replace(temp_path, self.path)
+            stat = os.stat(self.path)
+            self._journal_inode, self._journal_offset = stat.st_ino, stat.st_size
+            self._journal_lines = len(self._documents)
+    
+    def _compact_if_needed(self):
+        superseded = self._journal_lines - len(self._documents)
+        if superseded > max(self.COMPACT_MIN_SUPERSEDED, len(self._documents)):
+            logger.info(f"Compacting resume index journal ({superseded} superseded entries)")
+            self.compact()
+    
+    @staticmethod
+    def _document(resume_id: str, basic_skills: Dict[str, Any], experience_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        # Canonical names, so 'vue' and 'vue.js' in queries and old journal entries agree
+        skills = sorted(
+            SKILL_CANONICALIZER.canonical_name(skill_id).lower()
+            for skill_id in SKILL_CANONICALIZER.skill_mentions(basic_skills)
+        )
+        return {
+            'resume_id': resume_id,
+            'skills': skills,
+            'level': experience_analysis.get('estimated_level', 'Unknown'),
+            'years': experience_analysis.get('years_pattern') or experience_analysis.get('employment_years')
+        }
+    
+    def _add(self, documents: List[Dict[str, Any]], persist: bool = True):
+        with self._lock:
+            if not (persist and self.path):
+                self._apply_changed(documents)
+                return
+            with self._journal_lock():
+                # Lines other workers appended go first, so these updates win
+                self._catch_up()
+                changed = self._apply_changed(documents)
+                if changed:
+                    self._append_journal(changed)
+                    self._compact_if_needed()
+    
+    def _apply_changed(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Apply the documents that differ from the indexed ones (re-uploads and cached repeats change nothing)"""
+        changed = []
+        for document in documents:
+            doc_id = self._doc_ids.get(document['resume_id'])
+            if doc_id is None or self._documents[doc_id] != document:
+                self._apply(document)
+                changed.append(document)
+        return changed
+    
+    def _apply(self, document: Dict[str, Any]):
+        """Update in-memory postings for one document"""
+        resume_id = document['resume_id']
+        doc_id = self._doc_ids.get(resume_id)
+        if doc_id is None:
+            doc_id = len(self._resume_ids)
+            self._resume_ids.append(resume_id)
+            self._doc_ids[resume_id] = doc_id
+            self._documents.append(document)
+        else:
+            for term in self._terms(self._documents[doc_id]):
+                self._postings.get(term, set()).discard(doc_id)
+            self._documents[doc_id] = document
+        
+        for term in self._terms(document):
+            self._postings.setdefault(term, set()).add(doc_id)
+    
+    @staticmethod
+    def _terms(document: Dict[str, Any]) -> List[str]:
+        return document['skills'] + [f"level:{str(document['level']).lower()}"]
+    
+    def _term_postings(self, term: str) -> Set[int]:
+        postings = self._postings.get(term.lower())
+        if postings is None:
+            skill_id = SKILL_CANONICALIZER.lookup(term)
+            if skill_id is not None:
+                postings = self._postings.get(SKILL_CANONICALIZER.canonical_name(skill_id).lower())
+        return postings or set()
+    
+    def _years_matching(self, operator: str, value: int) -> Set[int]:
+        compare = {
+            '>=': lambda years: years >= value,
+            '>': lambda years: years > value,
+            '<=': lambda years: years <= value,
+            '<': lambda years: years < value,
+            '=': lambda years: years == value
+        }[operator]
+        return {
+            doc_id for doc_id, document in enumerate(self._documents)
+            if document['years'] is not None and compare(document['years'])
+        }
+    
+    @contextmanager
+    def _journal_lock(self):
+        """Exclusive lock on the journal across processes; reentrant, taken while holding self._lock"""
+        if fcntl is None or self._lock_file is not None:
+            yield
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(f'{self.path}.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self._lock_file = lock_file
+            try:
+                yield
+            finally:
+                self._lock_file = None
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _append_journal(self, documents: List[Dict[str, Any]]):
+        payload = ''.join(json.dumps(document, ensure_ascii=False) + '\n' for document in documents)
+        with open(self.path, 'ab') as f:
+            f.write(payload.encode('utf-8'))
+            self._journal_inode = os.fstat(f.fileno()).st_ino
+            self._journal_offset = f.tell()
+        self._journal_lines += len(documents)
+    
+    def _catch_up(self):
+        """Replay the journal from where this process stopped, or from the start if it was compacted"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return
+        if stat.st_ino == self._journal_inode and stat.st_size == self._journal_offset:
+            return
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != self._journal_inode or stat.st_size < self._journal_offset:
+                # Replaced by a compaction in another process
+                self._reset(stat.st_ino)
+            f.seek(self._journal_offset)
+            data = f.read()
+        # A line still being written is left for the next look
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Skipping corrupt resume index entry: {str(e)}")
+            self._journal_lines += 1
+        self._journal_offset += end
+    
+    def _reset(self, inode: int):
+        self._resume_ids = []
+        self._doc_ids = {}
+        self._documents = []
+        self._postings = {}
+        self._journal_lines = 0
+        self._journal_inode = inode
+        self._journal_offset = 0
+
+class _QueryParser:
+    """Recursive-descent parser evaluating a boolean query to a set of doc ids"""
+    
+    # Deepest nesting of parentheses and NOTs, well below Python's recursion limit
+    MAX_DEPTH = 32
+    
+    TOKEN_PATTERN = re.compile(
+        r'\s*(?:(?P<lparen>\()|(?P<rparen>\))|"(?P<phrase>[^"]+)"'
+        r'|(?P<years>years\s*(?:>=|<=|>|<|=)\s*\d+)|(?P<word>[^\s()"]+))',
+        re.IGNORECASE
+    )
+    
+    def __init__(self, query: str, index: ResumeIndex):
+        self.index = index
+        self.universe = set(range(len(index._resume_ids)))
+        self.tokens = self._tokenize(query)
+        self.position = 0
+        self.depth = 0
+    
+    def _tokenize(self, query: str) -> List[tuple]:
+        tokens = []
+        position = 0
+        query = query.strip()
+        while position < len(query):
+            match = self.TOKEN_PATTERN.match(query, position)
+            if not match or match.end() == position:
+                raise QuerySyntaxError(f"Unexpected character at position {position}")
+            position = match.end()
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == 'word' and value.upper() in ('AND', 'OR', 'NOT'):
+                kind = value.upper()
+            tokens.append((kind, value))
+        return tokens
+    
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+    
+    def _nested(self, parse):
+        self.depth += 1
+        if self.depth > self.MAX_DEPTH:
+            raise QuerySyntaxError(f"Query nested more than {self.MAX_DEPTH} levels deep")
+        try:
+            return parse()
+        finally:
+            self.depth -= 1
+    
+    def _next(self) -> tuple:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+    
+    def parse(self) -> Set[int]:
+        result = self._or()
+        if self._peek() is not None:
+            raise QuerySyntaxError(f"Unexpected token '{self.tokens[self.position][1]}'")
+        return result
+    
+    def _or(self) -> Set[int]:
+        result = self._and()
+        while self._peek() == 'OR':
+            self._next()
+            result = result | self._and()
+        return result
+    
+    def _and(self) -> Set[int]:
+        result = self._not()
+        while self._peek() in ('AND', 'NOT', 'lparen', 'phrase', 'years', 'word'):
+            if self._peek() == 'AND':
+                self._next()
+            result = result & self._not()
+        return result
+    
+    def _not(self) -> Set[int]:
+        if self._peek() == 'NOT':
+            self._next()
+            return self.universe - self._nested(self._not)
+        return self._atom()
+    
+    def _atom(self) -> Set[int]:
+        kind = self._peek()
+        if kind is None:
+            raise QuerySyntaxError("Unexpected end of query")
+        kind, value = self._next()
+        if kind == 'lparen':
+            result = self._nested(self._or)
+            if self._peek() != 'rparen':
+                raise QuerySyntaxError("Missing closing parenthesis")
+            self._next()
+            return result
+        if kind == 'years':
+            operator, number = re.match(r'years\s*(>=|<=|>|<|=)\s*(\d+)', value, re.IGNORECASE).groups()
+            return self.index._years_matching(operator, int(number))
+        if kind in ('phrase', 'word'):
+            if value.lower().startswith('skill:'):
+                value = value[len('skill:'):]
+            return set(self.index._term_postings(value))
+        raise QuerySyntaxError(f"Unexpected token '{value}'")
@@ -0,0 +1,121 @@
+"""
+Resume store for RealiZe
+Keeps analyzed resumes server-side so follow-up requests can use a resume id
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import hashlib
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from backend.services.analyzer import update_normalized_digest
+from backend.utils.cache import LRUCache, TieredCache
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored record layout changes
+RESUME_STORE_VERSION = "1"
+
+class ResumeStore:
+    """Server-side store of resume text, extracted skills and section index
+    
+    Resumes are personal data, so they are kept for at most max_age seconds
+    (RESUME_STORE_MAX_AGE_DAYS) and the durable tier holds at most max_rows
+    (RESUME_STORE_MAX_ROWS) of them; 0 disables a limit.
+    """
+    
+    def __init__(self, max_size: Optional[int] = None, path: Optional[str] = None,
+                 max_rows: Optional[int] = None, max_age: Optional[float] = None):
+        if max_size is None:
+            max_size = int(os.environ.get('RESUME_STORE_SIZE', 512))
+        if path is None:
+            path = os.environ.get('RESUME_STORE_PATH', os.path.join('cache', 'resume_store.db'))
+        if max_rows is None:
+            max_rows = int(os.environ.get('RESUME_STORE_MAX_ROWS', 10000))
+        if max_age is None:
+            max_age = float(os.environ.get('RESUME_STORE_MAX_AGE_DAYS', 30)) * 86400
+        
+        self.cache = TieredCache(
+            namespace=f'resume-store-v{RESUME_STORE_VERSION}',
+            max_size=max_size,
+            path=path,
+            table='resumes',
+            max_rows=max_rows,
+            max_age=max_age
+        )
+        # SHA-256 of uploaded PDF bytes -> resume id, so re-uploads skip text extraction
+        self.uploads = LRUCache(max_size)
+    
+    @staticmethod
+    def resume_id_for(resume_text: str) -> str:
+        """Stable resume id derived from the normalized resume text"""
+        digest = hashlib.sha256()
+        update_normalized_digest(digest, resume_text)
+        return digest.hexdigest()[:32]
+    
+    def save(self, resume_text: str, analysis: Dict[str, Any]) -> str:
+        """
+        Store a resume together with the features already computed for it
+        
+        Args:
+            resume_text: Extracted resume text
+            analysis: Result of ResumeAnalyzer.analyze for that text
+        
+        Returns:
+            Resume id to use in follow-up requests
+        """
+        resume_id = self.resume_id_for(resume_text)
+        record = {
+            'resume_id': resume_id,
+            'text': resume_text,
+            'basic_skills': analysis.get('basic_skills', {}),
+            'sections': analysis.get('basic_info', {}).get('sections_detected', []),
+            'skills_analysis': analysis.get('skills_analysis', {}),
+            'experience_analysis': analysis.get('experience_analysis', {}),
+            'stored_at': datetime.now().isoformat()
+        }
+        self.cache.set(resume_id, record)
+        logger.info(f"Stored resume {resume_id}")
+        return resume_id
+    
+    @property
+    def durable(self) -> bool:
+        """Whether records go to the SQLite file shared by all worker processes"""
+        return self.cache.durable is not None
+    
+    def remember_upload(self, upload_digest: str, resume_id: str):
+        """Record which resume an uploaded file (by content digest) produced"""
+        self.uploads.set(upload_digest, resume_id)
+    
+    def get_by_upload(self, upload_digest: str) -> Optional[Dict[str, Any]]:
+        """Stored record for a previously uploaded file, or None if unknown or evicted"""
+        return self.get(self.uploads.get(upload_digest))
+    
+    def get(self, resume_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored record for a resume id, or None if unknown"""
+        if not resume_id:
+            return None
+        return self.cache.get(resume_id)
+    
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over durably stored resumes (empty when running memory-only)"""
+        if self.cache.durable is None:
+            return iter(())
+        return self.cache.durable.values(self.cache.namespace)
+    
+    def records_since(self, marker: int = 0) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Resumes durably stored by any worker process since a marker
+        
+        Returns:
+            The new marker to pass next time and the records (none when running memory-only)
+        """
+        if self.cache.durable is None:
+            return marker, []
+        return self.cache.durable.values_since(marker, self.cache.namespace)
+    
+    def delete(self, resume_id: str):
+        """Forget a stored resume"""
+        self.cache.delete(resume_id)
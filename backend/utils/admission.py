@@ -0,0 +1,273 @@
+"""
+Admission control for RealiZe
+Per-client token-bucket rate limits and a bounded concurrency gate for expensive API routes
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import json
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+from backend.utils.cache import SQLiteStore
+
+def refill_and_take(tokens: float, updated: float, now: float, rate: float, burst: float,
+                    cost: float) -> Tuple[float, float]:
+    """
+    One token-bucket step
+    
+    Returns:
+        Tokens left in the bucket, and 0.0 if the request was admitted or
+        else the seconds until enough tokens will have accumulated
+    """
+    tokens = min(burst, tokens + max(0.0, now - updated) * rate)
+    if tokens >= cost:
+        return tokens - cost, 0.0
+    return tokens, (cost - tokens) / rate
+
+class MemoryTokenBuckets:
+    """Token buckets of one process; the least recently seen clients are forgotten past max_keys"""
+    
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def take(self, key: str, rate: float, burst: float, cost: float = 1.0,
+             now: Optional[float] = None) -> float:
+        """Take cost tokens from a client's bucket; returns 0.0 or the seconds to wait"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (burst, now))
+            tokens, wait = refill_and_take(tokens, updated, now, rate, burst, cost)
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                # A forgotten client starts again with a full bucket
+                self._buckets.popitem(last=False)
+        return wait
+
+class SQLiteTokenBuckets(SQLiteStore):
+    """
+    Token buckets in a SQLite file, shared by every worker process
+    
+    Each take is one IMMEDIATE transaction, so concurrent workers cannot
+    both spend the same token. Buckets that have refilled completely are
+    pruned now and then, since a missing bucket counts as full.
+    """
+    
+    PRUNE_EVERY = 1000
+    
+    def __init__(self, path: str, table: str = 'token_buckets'):
+        super().__init__(path, table)
+        self._takes = 0
+    
+    def take(self, key: str, rate: float, burst: float, cost: float = 1.0,
+             now: Optional[float] = None) -> float:
+        """Take cost tokens from a client's bucket; returns 0.0 or the seconds to wait"""
+        # Wall-clock time, since the stamps are compared across processes
+        now = time.time() if now is None else now
+        with self._lock:
+            conn = self._conn
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = conn.execute(f'SELECT value FROM {self.table} WHERE key = ?', (key,)).fetchone()
+                tokens, updated = json.loads(row[0]) if row else (burst, now)
+                tokens, wait = refill_and_take(tokens, updated, now, rate, burst, cost)
+                conn.execute(f'INSERT OR REPLACE INTO {self.table} (key, namespace, value) VALUES (?, ?, ?)',
+                             (key, '', json.dumps([tokens, now])))
+                self._takes += 1
+                if self._takes % self.PRUNE_EVERY == 0:
+                    conn.execute(f"DELETE FROM {self.table} WHERE json_extract(value, '$[1]') < ?",
+                                 (now - burst / rate,))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return wait
+
+class Overloaded(Exception):
+    """Raised when the concurrency gate's queue is full or the wait timed out"""
+    
+    def __init__(self, retry_after: float):
+        super().__init__(f"Server busy, retry after {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+class ConcurrencyGate:
+    """Bounds the requests this process runs at once; up to max_queue more wait up to timeout seconds"""
+    
+    def __init__(self, limit: int, max_queue: int, timeout: float):
+        self.limit = max(1, limit)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self.active = 0
+        self.waiting = 0
+        self._condition = threading.Condition()
+    
+    @contextmanager
+    def slot(self):
+        """
+        Hold one of the slots for the duration of the block
+        
+        Raises:
+            Overloaded: If no slot became free in time or the queue is full
+        """
+        with self._condition:
+            if self.active >= self.limit:
+                if self.waiting >= self.max_queue:
+                    raise Overloaded(max(1.0, self.timeout))
+                self.waiting += 1
+                try:
+                    if not self._condition.wait_for(lambda: self.active < self.limit, self.timeout):
+                        raise Overloaded(max(1.0, self.timeout))
+                finally:
+                    self.waiting -= 1
+            self.active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.active -= 1
+                self._condition.notify()
+
+class SQLiteConcurrencyGate(SQLiteStore):
+    """
+    ConcurrencyGate whose slots and queue are shared by every worker process
+    
+    Running and queued requests are rows of a SQLite table, claimed in
+    IMMEDIATE transactions; queued requests poll for a free slot. Every row
+    carries a lease, so the slots of a killed worker free themselves: running
+    requests hold theirs for `lease` seconds (the server's request timeout),
+    waiting ones renew a short lease on every poll.
+    """
+    
+    POLL_INTERVAL = 0.05
+    WAIT_LEASE = 5.0
+    
+    def __init__(self, path: str, limit: int, max_queue: int, timeout: float, lease: float = 120.0,
+                 table: str = 'admission_slots'):
+        super().__init__(path, table)
+        self.limit = max(1, limit)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self.lease = lease
+    
+    @property
+    def active(self) -> int:
+        return self._transaction(lambda conn, now: self._count(conn, 'active', now))
+    
+    @property
+    def waiting(self) -> int:
+        return self._transaction(lambda conn, now: self._count(conn, 'waiting', now))
+    
+    def _count(self, conn, state: str, now: float) -> int:
+        return conn.execute(f'SELECT COUNT(*) FROM {self.table} WHERE namespace = ? AND CAST(value AS REAL) >= ?',
+                            (state, now)).fetchone()[0]
+    
+    def _transaction(self, step):
+        """Run step(connection, wall-clock now) in one IMMEDIATE transaction"""
+        with self._lock:
+            conn = self._conn
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = step(conn, time.time())
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return result
+    
+    def _claim(self, key: str):
+        """One attempt: 'active' if a slot was taken, 'waiting' if queued, 'full' if the queue is full"""
+        def step(conn, now):
+            conn.execute(f'DELETE FROM {self.table} WHERE CAST(value AS REAL) < ?', (now,))
+            if self._count(conn, 'active', now) < self.limit:
+                state, expires = 'active', now + self.lease
+            else:
+                queued = conn.execute(f'SELECT 1 FROM {self.table} WHERE key = ?', (key,)).fetchone()
+                if queued is None and self._count(conn, 'waiting', now) >= self.max_queue:
+                    return 'full'
+                state, expires = 'waiting', now + self.WAIT_LEASE
+            conn.execute(f'INSERT OR REPLACE INTO {self.table} (key, namespace, value) VALUES (?, ?, ?)',
+                         (key, state, json.dumps(expires)))
+            return state
+        return self._transaction(step)
+    
+    def _release(self, key: str):
+        self._transaction(lambda conn, now: conn.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,)))
+    
+    @contextmanager
+    def slot(self):
+        """
+        Hold one of the shared slots for the duration of the block
+        
+        Raises:
+            Overloaded: If no slot became free in time or the queue is full
+        """
+        key = uuid.uuid4().hex
+        deadline = time.monotonic() + self.timeout
+        while True:
+            state = self._claim(key)
+            if state == 'active':
+                break
+            if state == 'full':
+                raise Overloaded(max(1.0, self.timeout))
+            if time.monotonic() >= deadline:
+                self._release(key)
+                raise Overloaded(max(1.0, self.timeout))
+            time.sleep(self.POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            self._release(key)
+
+def default_gate_sizes(request_threads: int) -> Tuple[int, int, int]:
+    """
+    Default concurrency limit, queue size and shedding depth of a gate
+    
+    A gthread worker runs at most its GUNICORN_THREADS requests at once, so
+    a gate only ever queues if its limit is below the request threads it
+    sees. Half of them may run expensive requests and all but one of the
+    rest may queue, keeping a thread free for cheap routes such as /health;
+    shedding starts once half the queue is taken.
+    
+    Args:
+        request_threads: Requests that can reach the gate at once (one
+            worker's threads, or all workers' for a shared gate)
+    """
+    limit = max(1, request_threads // 2)
+    queue = max(0, request_threads - limit - 1)
+    shed_depth = max(1, queue // 2) if queue else 0
+    return limit, queue, shed_depth
+
+class AdmissionController:
+    """
+    Admission decisions for expensive routes
+    
+    A client (IP address or API key) may start `rate` requests per second
+    on average and `burst` at once. Admitted requests then pass the
+    concurrency gate; while at least shed_queue_depth requests are queued
+    behind it, new ones should instead run at once in local-only (no LLM)
+    mode.
+    """
+    
+    def __init__(self, buckets, gate, rate: float, burst: float, shed_queue_depth: int):
+        self.buckets = buckets
+        self.gate = gate
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.shed_queue_depth = shed_queue_depth
+    
+    def retry_after(self, client: str) -> int:
+        """0 if the client may make a request now, else whole seconds to wait (for Retry-After)"""
+        if self.rate <= 0:
+            return 0
+        wait = self.buckets.take(client, self.rate, self.burst)
+        return math.ceil(wait) if wait > 0 else 0
+    
+    def should_shed(self) -> bool:
+        """Whether the queue is deep enough to skip LLM calls"""
+        return self.shed_queue_depth > 0 and self.gate.waiting >= self.shed_queue_depth
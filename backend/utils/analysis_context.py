@@ -0,0 +1,98 @@
+"""
+Shared per-document analysis context for RealiZe
+Computes lowercased text, tokens and offsets once for all analyzer passes
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import re
+from array import array
+from collections import Counter
+from functools import cached_property
+from typing import Iterable, List, Union
+
+from backend.utils.section_segmenter import SectionSpan, segment_sections
+
+WORD_PATTERN = re.compile(r'\w+')
+WHITESPACE_TOKEN_PATTERN = re.compile(r'\S+')
+
+class AnalysisContext:
+    """
+    Derived views of one document, computed lazily and at most once
+    
+    Every analyzer pass takes the context instead of the raw text, so the
+    lowercased copy, the token array, the token counts and the section spans
+    are shared.
+    """
+    
+    def __init__(self, text: str):
+        self.text = text or ''
+        self._slices = {}
+    
+    @classmethod
+    def of(cls, text_or_context: Union[str, 'AnalysisContext']) -> 'AnalysisContext':
+        """Return the given context, or build one for raw text"""
+        if isinstance(text_or_context, AnalysisContext):
+            return text_or_context
+        return cls(text_or_context)
+    
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+    
+    @cached_property
+    def word_count(self) -> int:
+        """Number of whitespace-separated words (same as len(text.split()))"""
+        return sum(1 for _ in WHITESPACE_TOKEN_PATTERN.finditer(self.text))
+    
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Lowercased word tokens (runs of \\w characters)"""
+        return WORD_PATTERN.findall(self.lower)
+    
+    @cached_property
+    def token_offsets(self) -> array:
+        """Start offset of each token in the lowercased text"""
+        return array('l', (match.start() for match in WORD_PATTERN.finditer(self.lower)))
+    
+    @cached_property
+    def token_counts(self) -> Counter:
+        """Token frequencies, counted without keeping the token array alive"""
+        if 'tokens' in self.__dict__:
+            return Counter(self.tokens)
+        return Counter(match.group() for match in WORD_PATTERN.finditer(self.lower))
+    
+    def count_word(self, word: str) -> int:
+        """Occurrences of a lowercase \\w+ word, equivalent to findall(r'\\bword\\b')"""
+        return self.token_counts.get(word, 0)
+    
+    @cached_property
+    def sections(self) -> List[SectionSpan]:
+        """Section spans (name, start, end) of the document"""
+        return segment_sections(self.text)
+    
+    def section_names(self) -> List[str]:
+        """Distinct section names in document order"""
+        return list(dict.fromkeys(span.name for span in self.sections))
+    
+    def section_text(self, names: Iterable[str]) -> str:
+        """
+        Text of the given sections only, in document order
+        
+        Falls back to the whole text when the document has no recognised
+        headings or none of the requested sections, so callers never lose input.
+        """
+        return self.section_context(names).text
+    
+    def section_context(self, names: Iterable[str]) -> 'AnalysisContext':
+        """Cached sub-context restricted to the given sections"""
+        key = frozenset(names)
+        sliced = self._slices.get(key)
+        if sliced is None:
+            if all(span.name in key for span in self.sections):
+                self._slices[key] = self
+                return self
+            parts = [self.text[span.start:span.end].strip() for span in self.sections if span.name in key]
+            parts = [part for part in parts if part]
+            sliced = AnalysisContext('\n\n'.join(parts)) if parts else self
+            self._slices[key] = sliced
+        return sliced
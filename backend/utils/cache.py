@@ -0,0 +1,311 @@
+"""
+Caching utilities for RealiZe
+Provides an in-memory LRU cache with an optional durable SQLite tier
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import copy
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class LRUCache:
+    """Thread-safe least-recently-used cache, optionally expiring entries max_age seconds after they were set"""
+    
+    def __init__(self, max_size: int = 128, max_age: Optional[float] = None):
+        self.max_size = max(1, max_size)
+        self.max_age = max_age or None
+        self._data = OrderedDict()
+        self._written = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value and mark it as recently used"""
+        with self._lock:
+            if key not in self._data:
+                return default
+            if self.max_age and time.time() - self._written[key] > self.max_age:
+                del self._data[key]
+                del self._written[key]
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def set(self, key: str, value: Any, written_at: Optional[float] = None):
+        """
+        Store a value, evicting the least recently used entry if full
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            written_at: When the value was first stored (default now), for values copied from another tier
+        """
+        with self._lock:
+            self._data[key] = value
+            self._written[key] = time.time() if written_at is None else written_at
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                evicted, _ = self._data.popitem(last=False)
+                del self._written[evicted]
+    
+    def delete(self, key: str):
+        """Remove a value if present"""
+        with self._lock:
+            self._data.pop(key, None)
+            self._written.pop(key, None)
+    
+    def clear(self):
+        """Remove all values"""
+        with self._lock:
+            self._data.clear()
+            self._written.clear()
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._data
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+class SQLiteStore:
+    """Durable key/value store for JSON-serializable values
+    
+    With max_rows or max_age set, the oldest writes beyond max_rows and every
+    entry older than max_age seconds are deleted on each write, and expired
+    entries are no longer returned.
+    """
+    
+    def __init__(self, path: str, table: str = 'entries', max_rows: Optional[int] = None,
+                 max_age: Optional[float] = None):
+        self.path = path
+        self.table = table
+        self.max_rows = max_rows or None
+        self.max_age = max_age or None
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._inherited = []
+        self._pid = os.getpid()
+        self._connection = self._connect()
+        self._connection.execute(
+            f'CREATE TABLE IF NOT EXISTS {self.table} ('
+            'key TEXT PRIMARY KEY, namespace TEXT NOT NULL, value TEXT NOT NULL, '
+            'written_at REAL NOT NULL DEFAULT 0)'
+        )
+        columns = [row[1] for row in self._connection.execute(f'PRAGMA table_info({self.table})')]
+        if 'written_at' not in columns:
+            # Tables from before retention limits: count their entries as written now
+            self._connection.execute(
+                f'ALTER TABLE {self.table} ADD COLUMN written_at REAL NOT NULL DEFAULT 0')
+            self._connection.execute(f'UPDATE {self.table} SET written_at = ?', (time.time(),))
+        self._connection.execute(
+            f'CREATE INDEX IF NOT EXISTS {self.table}_written_at ON {self.table} (written_at)')
+        self._connection.commit()
+        self.prune()
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+    
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """
+        This process's connection
+        
+        A connection must not be used across fork(), so workers forked from a
+        preloading server open their own. The inherited one is kept open but
+        unused: closing it in the child could remove WAL files the parent
+        still relies on.
+        """
+        if self._pid != os.getpid():
+            self._inherited.append(self._connection)
+            self._connection = self._connect()
+            self._pid = os.getpid()
+        return self._connection
+    
+    def _oldest_kept(self) -> float:
+        """Write time before which entries have expired (0 without max_age)"""
+        return time.time() - self.max_age if self.max_age else 0.0
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value or None"""
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+    
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return the stored value and its write time, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                f'SELECT value, written_at FROM {self.table} WHERE key = ? AND written_at >= ?',
+                (key, self._oldest_kept())
+            ).fetchone()
+        return (json.loads(row[0]), row[1]) if row else None
+    
+    def set(self, key: str, value: Any, namespace: str = ''):
+        """Insert or replace a value, then apply the retention limits"""
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                f'INSERT OR REPLACE INTO {self.table} (key, namespace, value, written_at) VALUES (?, ?, ?, ?)',
+                (key, namespace, payload, time.time())
+            )
+            self._prune()
+            self._conn.commit()
+    
+    def _prune(self) -> int:
+        """Delete entries beyond max_rows or max_age (caller holds the lock and commits)"""
+        deleted = 0
+        if self.max_age:
+            deleted += self._conn.execute(
+                f'DELETE FROM {self.table} WHERE written_at < ?', (self._oldest_kept(),)
+            ).rowcount
+        if self.max_rows:
+            # Every write gets a rowid above the current ones, so the lowest rowids are the oldest writes
+            deleted += self._conn.execute(
+                f'DELETE FROM {self.table} WHERE rowid <= '
+                f'(SELECT rowid FROM {self.table} ORDER BY rowid DESC LIMIT 1 OFFSET ?)',
+                (self.max_rows,)
+            ).rowcount
+        return deleted
+    
+    def prune(self) -> int:
+        """
+        Apply the retention limits now
+        
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            deleted = self._prune()
+            self._conn.commit()
+        return deleted
+    
+    def delete(self, key: str):
+        """Remove a value if present"""
+        with self._lock:
+            self._conn.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,))
+            self._conn.commit()
+    
+    def purge_other_namespaces(self, namespace: str) -> int:
+        """Delete every entry written under a different namespace"""
+        with self._lock:
+            cursor = self._conn.execute(
+                f'DELETE FROM {self.table} WHERE namespace != ?', (namespace,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+    
+    def values(self, namespace: Optional[str] = None) -> Iterator[Any]:
+        """Iterate over stored values, optionally restricted to one namespace"""
+        query = f'SELECT value FROM {self.table} WHERE written_at >= ?'
+        params = (self._oldest_kept(),)
+        if namespace is not None:
+            query += ' AND namespace = ?'
+            params += (namespace,)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        for row in rows:
+            yield json.loads(row[0])
+    
+    def values_since(self, rowid: int, namespace: Optional[str] = None) -> Tuple[int, List[Any]]:
+        """
+        Values written (by any process) after a rowid marker
+        
+        Every insert or replace gets a rowid above the current ones, so
+        passing the returned marker back yields only the later writes.
+        
+        Returns:
+            The new marker and the values in write order
+        """
+        query = f'SELECT rowid, value FROM {self.table} WHERE rowid > ? AND written_at >= ?'
+        params = (rowid, self._oldest_kept())
+        if namespace is not None:
+            query += ' AND namespace = ?'
+            params += (namespace,)
+        with self._lock:
+            rows = self._conn.execute(query + ' ORDER BY rowid', params).fetchall()
+        return (rows[-1][0] if rows else rowid), [json.loads(value) for _, value in rows]
+    
+    def clear(self):
+        """Remove all values"""
+        with self._lock:
+            self._conn.execute(f'DELETE FROM {self.table}')
+            self._conn.commit()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+
+class TieredCache:
+    """Memory LRU in front of an optional durable SQLite tier
+    
+    Entries are namespaced; on startup entries from other namespaces are
+    purged from the durable tier, so changing the namespace invalidates
+    everything that was cached before. max_rows and max_age (seconds) bound
+    the durable tier; see SQLiteStore.
+    """
+    
+    def __init__(self, namespace: str, max_size: int = 128, path: Optional[str] = None,
+                 table: str = 'entries', max_rows: Optional[int] = None, max_age: Optional[float] = None):
+        self.namespace = namespace
+        self.memory = LRUCache(max_size, max_age)
+        self.durable = None
+        
+        if path:
+            try:
+                self.durable = SQLiteStore(path, table, max_rows=max_rows, max_age=max_age)
+                purged = self.durable.purge_other_namespaces(namespace)
+                if purged:
+                    logger.info(f"Purged {purged} stale entries from {path}")
+            except sqlite3.Error as e:
+                logger.warning(f"Durable cache disabled ({path}): {str(e)}")
+                self.durable = None
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value or None"""
+        value = self.memory.get(key)
+        if value is None and self.durable is not None:
+            try:
+                entry = self.durable.get_entry(key)
+            except sqlite3.Error as e:
+                logger.warning(f"Durable cache read failed: {str(e)}")
+                entry = None
+            if entry is not None:
+                # Keep the original write time so max_age holds in memory too
+                value, written_at = entry
+                self.memory.set(key, value, written_at)
+        return copy.deepcopy(value) if value is not None else None
+    
+    def set(self, key: str, value: Any):
+        """Store a copy of the value in both tiers"""
+        value = copy.deepcopy(value)
+        self.memory.set(key, value)
+        if self.durable is not None:
+            try:
+                self.durable.set(key, value, self.namespace)
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logger.warning(f"Durable cache write failed: {str(e)}")
+    
+    def delete(self, key: str):
+        """Remove a value from both tiers"""
+        self.memory.delete(key)
+        if self.durable is not None:
+            self.durable.delete(key)
+    
+    def clear(self):
+        """Remove all values from both tiers"""
+        self.memory.clear()
+        if self.durable is not None:
+            self.durable.clear()
@@ -0,0 +1,148 @@
+"""
+HTTP response caching utilities for RealiZe
+Pre-serialized, pre-compressed response bodies with strong ETags and conditional requests,
+and negotiated compression of dynamic responses
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import gzip
+import hashlib
+import threading
+from typing import Callable
+
+from flask import Request, Response
+
+try:
+    import brotli
+except ImportError:  # Optional: responses are offered gzip-compressed only
+    brotli = None
+
+# Preferred order when the client accepts several encodings
+ENCODING_PREFERENCE = ('br', 'gzip')
+
+# Dynamic responses worth compressing; images and PDFs are compressed already
+COMPRESSIBLE_MIMETYPES = ('application/json', 'text/html', 'text/plain', 'text/css', 'application/javascript')
+
+def negotiate_encoding(request: Request, available) -> str:
+    """Best of the available encodings the client accepts, honouring q=0 refusals"""
+    for encoding in ENCODING_PREFERENCE:
+        if encoding in available and request.accept_encodings[encoding] > 0:
+            return encoding
+    return 'identity'
+
+def compress_response(response: Response, request: Request, min_size: int = 1024,
+                      gzip_level: int = 6, brotli_quality: int = 5) -> Response:
+    """
+    Compress a dynamic response body for clients that accept gzip or brotli
+    
+    Streamed, already encoded, non-2xx, no-transform and non-text responses
+    are left alone, as are bodies below min_size, where the encoding overhead
+    outweighs the saving. Levels favour speed: responses are compressed per
+    request, unlike PreparedResponse bodies.
+    
+    Returns:
+        The same response, compressed in place when worthwhile
+    """
+    if (response.status_code < 200 or response.status_code >= 300 or response.status_code == 204
+            or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or 'no-transform' in response.headers.get('Cache-Control', '')):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    available = ('br', 'gzip') if brotli is not None else ('gzip',)
+    encoding = negotiate_encoding(request, available)
+    if encoding == 'identity':
+        return response
+    
+    body = response.get_data()
+    if len(body) < min_size:
+        return response
+    if encoding == 'br':
+        compressed = brotli.compress(body, quality=brotli_quality)
+    else:
+        compressed = gzip.compress(body, compresslevel=gzip_level, mtime=0)
+    if len(compressed) >= len(body):
+        return response
+    
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    # A strong validator names these exact bytes; the compressed body needs its own
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(f'{etag}-{encoding}')
+    return response
+
+class PreparedResponse:
+    """A response body serialized and compressed once, served with strong ETags"""
+    
+    def __init__(self, body: bytes, mimetype: str = 'application/json', max_age: int = 60):
+        self.mimetype = mimetype
+        self.max_age = max_age
+        self.bodies = {'identity': body}
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(compressed) < len(body):
+            self.bodies['gzip'] = compressed
+        if brotli is not None:
+            compressed = brotli.compress(body, quality=11)
+            if len(compressed) < len(body):
+                self.bodies['br'] = compressed
+        
+        # Strong validators differ per encoding, since the bytes on the wire differ
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.etags = {
+            encoding: digest if encoding == 'identity' else f'{digest}-{encoding}'
+            for encoding in self.bodies
+        }
+    
+    def choose_encoding(self, request: Request) -> str:
+        """Best encoding both sides support, honouring q=0 refusals"""
+        return negotiate_encoding(request, self.bodies)
+    
+    def response(self, request: Request) -> Response:
+        """
+        The prepared body for one request
+        
+        Returns:
+            304 Not Modified if the client's If-None-Match holds any current
+            validator, otherwise the cached bytes in the negotiated encoding
+        """
+        encoding = self.choose_encoding(request)
+        if any(request.if_none_match.contains(etag) for etag in self.etags.values()):
+            response = Response(status=304)
+        else:
+            response = Response(self.bodies[encoding], mimetype=self.mimetype)
+            if encoding != 'identity':
+                response.headers['Content-Encoding'] = encoding
+        response.set_etag(self.etags[encoding])
+        response.headers['Cache-Control'] = f'public, max-age={self.max_age}'
+        response.vary.add('Accept-Encoding')
+        return response
+
+class VersionedResponseCache:
+    """Keeps the PreparedResponse of the latest version of a resource"""
+    
+    def __init__(self, build: Callable[[], bytes], mimetype: str = 'application/json', max_age: int = 60):
+        self.build = build
+        self.mimetype = mimetype
+        self.max_age = max_age
+        self._version = None
+        self._prepared = None
+        self._lock = threading.Lock()
+    
+    def get(self, version) -> PreparedResponse:
+        """Prepared response for this version, serializing it only when the version changed"""
+        prepared = self._prepared
+        if prepared is None or self._version != version:
+            with self._lock:
+                if self._prepared is None or self._version != version:
+                    self._prepared = PreparedResponse(self.build(), self.mimetype, self.max_age)
+                    self._version = version
+                prepared = self._prepared
+        return prepared
+    
+    def clear(self):
+        with self._lock:
+            self._prepared = None
+            self._version = None
@@ -0,0 +1,91 @@
+"""
+JSON serialization for RealiZe
+Flask JSON provider backed by orjson when it is installed, the stdlib json module otherwise
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import logging
+import os
+from typing import Any, Optional
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib json module is used instead
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+JSON_BACKENDS = ('orjson', 'json')
+
+def default_backend() -> str:
+    """The JSON_BACKEND setting ('auto', 'orjson' or 'json') resolved to an available backend"""
+    setting = os.environ.get('JSON_BACKEND', 'auto').lower()
+    if setting not in JSON_BACKENDS + ('auto',):
+        raise ValueError(f"JSON_BACKEND must be one of auto, {', '.join(JSON_BACKENDS)}: {setting}")
+    if setting == 'orjson' and orjson is None:
+        logger.warning("JSON_BACKEND=orjson but orjson is not installed; using the json module")
+        return 'json'
+    if setting == 'auto':
+        return 'orjson' if orjson is not None else 'json'
+    return setting
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Serializes with orjson when available, producing the same documents as Flask's provider
+    
+    Dates still go through Flask's default hook (RFC 822 strings), keys are
+    sorted, and output is compact unless the app runs in debug mode. Calls
+    with json.dumps arguments orjson has no equivalent for, and values orjson
+    rejects (such as integers beyond 64 bits), fall back to the json module.
+    Output is UTF-8 rather than ASCII-escaped with either backend.
+    """
+    
+    ensure_ascii = False
+    
+    def __init__(self, app, backend: Optional[str] = None):
+        super().__init__(app)
+        self.backend = backend or default_backend()
+        if self.backend not in JSON_BACKENDS or (self.backend == 'orjson' and orjson is None):
+            raise ValueError(f"JSON backend not available: {self.backend}")
+    
+    def _orjson_options(self, indent: bool) -> int:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+    
+    def dumps_bytes(self, obj: Any, indent: bool = False) -> bytes:
+        """
+        Serialize to UTF-8 bytes, skipping the str round trip where possible
+        
+        Args:
+            indent: Two-space indentation instead of compact output
+        """
+        if self.backend == 'orjson':
+            try:
+                return orjson.dumps(obj, default=self.default, option=self._orjson_options(indent))
+            except orjson.JSONEncodeError:
+                pass
+        if indent:
+            return super().dumps(obj, indent=2).encode('utf-8')
+        return super().dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # Flask's response() passes indent=2 or compact separators; anything else needs the json module
+        if self.backend == 'orjson' and kwargs in ({}, {'indent': 2}, {'separators': (',', ':')}):
+            return self.dumps_bytes(obj, indent='indent' in kwargs).decode('utf-8')
+        return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs: Any) -> Any:
+        if self.backend == 'orjson' and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+    
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(self.dumps_bytes(obj, indent) + b'\n', mimetype=self.mimetype)
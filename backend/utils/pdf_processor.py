@@ -4,10 +4,9 @@ Handles PDF text extraction and preprocessing
 Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
 """
 
-import PyPDF2
 import os
 import logging
-from typing import Optional, Dict, Any
+from typing import BinaryIO, Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
@@ -32,37 +31,57 @@ class PDFProcessor:
                 raise FileNotFoundError(f"File not found: {file_path}")
             
             with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                # Check if PDF has pages
-                if len(pdf_reader.pages) == 0:
-                    raise ValueError("PDF file has no pages")
-                
-                text_content = []
-                
-                # Extract text from each page
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text.strip():
-                            text_content.append(page_text)
-                    except Exception as e:
-                        logger.warning(f"Error extracting text from page {page_num + 1}: {str(e)}")
-                        continue
-                
-                # Combine all page texts
-                full_text = "\n".join(text_content)
-                
-                # Clean and preprocess text
-                cleaned_text = self._clean_text(full_text)
-                
-                logger.info(f"Successfully extracted {len(cleaned_text)} characters from PDF")
-                return cleaned_text
+                return self.extract_text_from_stream(file)
                 
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {str(e)}")
             return None
     
+    def extract_text_from_stream(self, stream: BinaryIO) -> Optional[str]:
+        """
+        Extract text from an open PDF file or in-memory upload
+        
+        Args:
+            stream: Seekable binary file object positioned at the PDF
+        
+        Returns:
+            Extracted text or None if extraction fails
+        """
+        # Imported on first use: PyPDF2 is a large share of the app's import time
+        import PyPDF2
+        
+        try:
+            pdf_reader = PyPDF2.PdfReader(stream)
+            
+            # Check if PDF has pages
+            if len(pdf_reader.pages) == 0:
+                raise ValueError("PDF file has no pages")
+            
+            text_content = []
+            
+            # Extract text from each page
+            for page_num, page in enumerate(pdf_reader.pages):
+                try:
+                    page_text = page.extract_text()
+                    if page_text.strip():
+                        text_content.append(page_text)
+                except Exception as e:
+                    logger.warning(f"Error extracting text from page {page_num + 1}: {str(e)}")
+                    continue
+            
+            # Combine all page texts
+            full_text = "\n".join(text_content)
+            
+            # Clean and preprocess text
+            cleaned_text = self._clean_text(full_text)
+            
+            logger.info(f"Successfully extracted {len(cleaned_text)} characters from PDF")
+            return cleaned_text
+        
+        except Exception as e:
+            logger.error(f"Error extracting text from PDF: {str(e)}")
+            return None
+    
     def _clean_text(self, text: str) -> str:
         """
         Clean and preprocess extracted text
@@ -99,6 +118,8 @@ class PDFProcessor:
         Returns:
             Dictionary containing PDF metadata
         """
+        import PyPDF2
+        
         try:
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
@@ -0,0 +1,101 @@
+"""
+Resume section segmenter for RealiZe
+Splits resume text into named section spans in a single regex pass
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import re
+from typing import Dict, List, NamedTuple
+
+# Canonical section name -> heading phrases that open it
+SECTION_HEADINGS = {
+    'summary': ['summary', 'professional summary', 'career summary', 'profile', 'professional profile',
+                'objective', 'career objective', 'about me'],
+    'experience': ['experience', 'work experience', 'professional experience', 'employment history',
+                   'employment', 'work history', 'career history'],
+    'education': ['education', 'academic background', 'qualifications', 'academic qualifications'],
+    'skills': ['skills', 'technical skills', 'technical abilities', 'core competencies', 'key skills',
+               'soft skills', 'tools and technologies'],
+    'certifications': ['certifications', 'certificates', 'licenses', 'licenses and certifications'],
+    'projects': ['projects', 'personal projects', 'academic projects', 'portfolio'],
+    'achievements': ['achievements', 'awards', 'recognition', 'honors', 'honours'],
+    'languages': ['languages'],
+    'interests': ['interests', 'hobbies', 'hobbies and interests'],
+    'references': ['references', 'referees']
+}
+
+# Name of the span before the first heading (name, contact details, headline)
+HEADER_SECTION = 'header'
+
+class SectionSpan(NamedTuple):
+    """One section of a document: canonical name and [start, end) character offsets"""
+    name: str
+    start: int
+    end: int
+
+def _build_heading_pattern(headings: Dict[str, List[str]]) -> re.Pattern:
+    phrases = sorted({phrase for aliases in headings.values() for phrase in aliases}, key=len, reverse=True)
+    alternatives = '|'.join(r'\s+'.join(re.escape(word) for word in phrase.split()) for phrase in phrases)
+    # Headings start with a capital letter; checking that first keeps the
+    # case-insensitive alternation from running at every word of the text
+    return re.compile(rf'\b(?=[A-Z])(?i:{alternatives})\b')
+
+HEADING_PATTERN = _build_heading_pattern(SECTION_HEADINGS)
+
+HEADING_LOOKUP = {
+    phrase: name
+    for name, aliases in SECTION_HEADINGS.items()
+    for phrase in aliases
+}
+
+def _is_heading(text: str, start: int, end: int) -> bool:
+    """
+    Decide whether a heading phrase occurrence really opens a section
+    
+    Extracted PDF text is usually flattened to one line, so a phrase counts
+    when it is written in capitals, when it is followed by a colon, or when
+    it is alone on its line. Ordinary mentions inside sentences do not.
+    """
+    phrase = text[start:end]
+    if not phrase[0].isupper():
+        return False
+    
+    rest = text[end:end + 3].lstrip(' \t')
+    if rest.startswith(':'):
+        return True
+    if phrase.isupper():
+        return True
+    
+    line_start = text.rfind('\n', 0, start) + 1
+    line_end = text.find('\n', end)
+    if line_end == -1:
+        line_end = len(text)
+    return not text[line_start:start].strip(' \t-*#•') and not text[end:line_end].strip()
+
+def segment_sections(text: str) -> List[SectionSpan]:
+    """
+    Split a resume into section spans
+    
+    Args:
+        text: Resume text
+    
+    Returns:
+        Spans in document order; text before the first heading becomes a
+        'header' span. Empty when no heading was recognised.
+    """
+    starts = []
+    for match in HEADING_PATTERN.finditer(text):
+        if _is_heading(text, match.start(), match.end()):
+            phrase = ' '.join(match.group().lower().split())
+            starts.append((match.start(), HEADING_LOOKUP[phrase]))
+    
+    if not starts:
+        return []
+    
+    spans = []
+    if text[:starts[0][0]].strip():
+        spans.append(SectionSpan(HEADER_SECTION, 0, starts[0][0]))
+    for i, (start, name) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else len(text)
+        spans.append(SectionSpan(name, start, end))
+    return spans
@@ -0,0 +1,123 @@
+"""
+Streaming upload handling for RealiZe
+Reads a multipart PDF upload chunk by chunk, validating, hashing and spooling it on the fly
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import hashlib
+import tempfile
+from typing import BinaryIO, Optional
+
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.sansio.multipart import NEED_DATA, Data, Epilogue, File, MultipartDecoder
+
+# PDF readers accept the %PDF- header anywhere in the first 1024 bytes
+PDF_MAGIC = b'%PDF-'
+MAGIC_WINDOW = 1024
+
+CHUNK_SIZE = 64 * 1024
+# Uploads up to this size stay in memory, larger ones are spooled to a temporary file
+SPOOL_SIZE = 1024 * 1024
+
+class UploadError(Exception):
+    """An upload rejected while it was being read"""
+    
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+def too_large(max_size: Optional[int]) -> UploadError:
+    if max_size is None:
+        return UploadError('File too large.', 413)
+    return UploadError(f'File too large. Maximum size is {max_size // (1024 * 1024)}MB.', 413)
+
+class PDFUpload:
+    """A received PDF: its spooled content, size in bytes and SHA-256 digest"""
+    
+    def __init__(self, filename: str, file: BinaryIO, size: int, digest: str):
+        self.filename = filename
+        self.file = file
+        self.size = size
+        self.digest = digest
+    
+    def close(self):
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+def receive_pdf_upload(stream: BinaryIO, boundary: bytes, field: str = 'resume',
+                       max_size: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> PDFUpload:
+    """
+    Read a multipart/form-data body and keep the PDF sent as `field`
+    
+    The body is decoded as it arrives. The filename is checked as soon as the
+    part's headers are in, the PDF header within the first MAGIC_WINDOW bytes,
+    and the size after every chunk, so a non-PDF or oversized upload is
+    rejected without reading (or storing) the rest of it. The digest is
+    computed over the file bytes while they are spooled.
+    
+    Args:
+        stream: The request body, e.g. flask.request.stream
+        boundary: The multipart boundary from the Content-Type header
+        max_size: Largest accepted file in bytes
+    
+    Returns:
+        The upload, with its file positioned at the start
+    
+    Raises:
+        UploadError: With the HTTP status to answer with
+    """
+    decoder = MultipartDecoder(boundary)
+    upload = None
+    receiving = False
+    head = b''
+    digest = hashlib.sha256()
+    
+    try:
+        while True:
+            event = decoder.next_event()
+            if event is NEED_DATA:
+                decoder.receive_data(stream.read(chunk_size) or None)
+            elif isinstance(event, Epilogue):
+                break
+            elif isinstance(event, File) and event.name == field and upload is None:
+                if not event.filename:
+                    raise UploadError('No file selected')
+                if not event.filename.lower().endswith('.pdf'):
+                    raise UploadError('Only PDF files are supported')
+                upload = PDFUpload(event.filename, tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE), 0, '')
+                receiving = True
+            elif isinstance(event, Data):
+                if receiving:
+                    upload.size += len(event.data)
+                    if max_size is not None and upload.size > max_size:
+                        raise too_large(max_size)
+                    if len(head) < MAGIC_WINDOW:
+                        head += event.data[:MAGIC_WINDOW - len(head)]
+                        if (len(head) >= MAGIC_WINDOW or not event.more_data) and PDF_MAGIC not in head:
+                            raise UploadError('Uploaded file is not a PDF document')
+                    digest.update(event.data)
+                    upload.file.write(event.data)
+                    receiving = event.more_data
+            else:
+                # Other form fields and files are read past without being kept
+                receiving = False
+    except (UploadError, RequestEntityTooLarge, ValueError) as e:
+        if upload is not None:
+            upload.close()
+        if isinstance(e, RequestEntityTooLarge):
+            # The request body went over MAX_CONTENT_LENGTH
+            raise too_large(max_size) from None
+        if isinstance(e, ValueError):
+            raise UploadError(f'Malformed upload: {str(e)}') from None
+        raise
+    
+    if upload is None:
+        raise UploadError('No file uploaded')
+    upload.digest = digest.hexdigest()
+    upload.file.seek(0)
+    return upload
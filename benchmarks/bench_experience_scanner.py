@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Experience scanner benchmark for RealiZe
+Compares the single-pass experience scanner with the previous multi-pass scan on long texts
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.services.experience_scanner import scan_experience
+
+WORDS = ("developed maintained services python platform architecture customers delivered projects "
+         "reports weekly with the and for of in to a built designed tested deployed api data cloud "
+         "pipelines features team senior lead leadership managed mentored junior intern manager "
+         "misleading years experience over").split()
+
+DATE_SNIPPETS = ["jan 2018 - mar 2021", "03/2021 to present", "2012 - 2015", "june 2016 – dec 2018"]
+
+CLAIM_SNIPPETS = ["7+ years of experience", "over 5 years", "3 years with"]
+
+def legacy_scan(text_lower: str) -> dict:
+    """The previous implementation: four year regexes and 21 substring scans"""
+    result = {}
+    for pattern in [r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)', r'(\d+)\+?\s*years?\s*(?:in|with)',
+                    r'over\s*(\d+)\s*years?', r'more\s*than\s*(\d+)\s*years?']:
+        matches = re.findall(pattern, text_lower)
+        if matches:
+            result['years'] = max(int(match) for match in matches)
+            break
+    for name, terms in {
+        'senior': ['senior', 'lead', 'principal', 'architect', 'expert', 'specialist'],
+        'leadership': ['lead', 'managed', 'managed team', 'supervised', 'mentored'],
+        'management': ['manager', 'director', 'head of', 'team lead'],
+        'junior': ['junior', 'entry', 'associate', 'intern', 'graduate']
+    }.items():
+        result[name] = sum(1 for term in terms if term in text_lower)
+    return result
+
+def make_text(words: int, claims: bool = True, seed: int = 7) -> str:
+    """Random resume-like text with a date range (and optionally a years claim) every 200 words"""
+    rng = random.Random(seed)
+    snippets = DATE_SNIPPETS + CLAIM_SNIPPETS if claims else DATE_SNIPPETS
+    parts = []
+    for i in range(words):
+        parts.append(rng.choice(WORDS))
+        if i % 200 == 0:
+            parts.append(rng.choice(snippets))
+    return ' '.join(parts)
+
+def time_call(func, text: str, repeat: int) -> float:
+    func(text)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the experience indicator scanner")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000], help="Text sizes in words")
+    parser.add_argument('--repeat', type=int, default=20, help="Runs per size")
+    args = parser.parse_args()
+    
+    print(f"{'words':>8} {'claims':>7} {'legacy ms':>10} {'scanner ms':>11} {'ranges':>7} {'employment yrs':>15}")
+    for size in args.sizes:
+        for claims in (True, False):
+            text = make_text(size, claims)
+            legacy = time_call(legacy_scan, text, args.repeat)
+            scanner = time_call(scan_experience, text, args.repeat)
+            scan = scan_experience(text)
+            print(f"{size:>8} {'yes' if claims else 'no':>7} {legacy:>10.2f} {scanner:>11.2f} "
+                  f"{len(scan.employment_ranges()):>7} {scan.employment_years()!s:>15}")
+
+if __name__ == "__main__":
+    main()
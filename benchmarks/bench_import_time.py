@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for RealiZe
+Measures the cold start of the app in fresh interpreters: import, first request and warm-up
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# Run in a fresh interpreter per sample; prints the milliseconds of each step as JSON
+CHILD_SCRIPT = """
+import json, logging, sys, time
+sys.path.insert(0, '.')
+logging.disable(logging.CRITICAL)
+timings = {}
+start = time.perf_counter()
+import app
+timings['import'] = (time.perf_counter() - start) * 1000
+step = sys.argv[1]
+if step == 'first_request':
+    start = time.perf_counter()
+    app.app.test_client().get('/api/skills/search?q=py')
+    timings['first_request'] = (time.perf_counter() - start) * 1000
+elif step == 'warm_up':
+    start = time.perf_counter()
+    app.warm_up()
+    timings['warm_up'] = (time.perf_counter() - start) * 1000
+print(json.dumps(timings))
+"""
+
+STEPS = ('import', 'first_request', 'warm_up')
+
+def child_env() -> Dict[str, str]:
+    """Environment of the measured interpreters: memory-only stores and no LLM"""
+    env = dict(os.environ)
+    env.update({'ANALYSIS_CACHE_PATH': '', 'RESUME_STORE_PATH': '', 'RESUME_INDEX_PATH': '',
+                'PYTHONDONTWRITEBYTECODE': '1'})
+    env.pop('OPENROUTER_API_KEY', None)
+    return env
+
+def run_once(project: Path, step: str) -> Dict[str, float]:
+    output = subprocess.run([sys.executable, '-c', CHILD_SCRIPT, step], cwd=project, env=child_env(),
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def slowest_imports(project: Path, top: int) -> List[Tuple[int, str]]:
+    """Modules imported directly by the app with the largest cumulative import time (us), from -X importtime"""
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'], cwd=project,
+                            env=child_env(), capture_output=True, text=True, check=True).stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # -X importtime indents two spaces per nesting level; the app's own imports are one level deep
+        if name.startswith('   ') and not name.startswith('    '):
+            modules.append((int(cumulative), name.strip()))
+    return sorted(modules, reverse=True)[:top]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the cold start of the app")
+    parser.add_argument('--runs', type=int, default=15, help="Fresh interpreters per step")
+    parser.add_argument('--project', default=str(project_root),
+                        help="Checkout to measure, e.g. a git worktree of an older revision")
+    parser.add_argument('--modules', type=int, default=10, help="Slowest imports of the app to list")
+    args = parser.parse_args()
+    project = Path(args.project).resolve()
+    
+    # Each step after the import is timed on its own, in interpreters that only just imported the app
+    print(f"{'step':<16} {'median ms':>10} {'min ms':>10}")
+    for step in STEPS:
+        values = [run_once(project, step)[step] for _ in range(args.runs)]
+        print(f"{step:<16} {statistics.median(values):>10.1f} {min(values):>10.1f}")
+    
+    if args.modules:
+        print(f"\n{'imported by app':<40} {'cumulative ms':>14}")
+        for cumulative, name in slowest_imports(project, args.modules):
+            print(f"{name:<40} {cumulative / 1000:>14.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
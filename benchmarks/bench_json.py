@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+JSON serialization benchmark for RealiZe
+Serialization time per JSON backend and bytes on the wire per encoding for typical analysis responses
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import argparse
+import gzip
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.corpus import CorpusGenerator
+from benchmarks.memory_profile import load_app
+from backend.utils.http_cache import brotli
+from backend.utils.json_provider import FastJSONProvider, orjson
+
+def per_call_ms(func: Callable[[], object], min_time: float) -> float:
+    """Mean milliseconds per call over at least min_time seconds, after one warm-up call"""
+    func()
+    calls, start = 0, time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / calls * 1000
+
+def analysis_payloads(app_module, words: tuple) -> Dict[str, dict]:
+    """/api/analyze-resume response bodies for generated resumes, plus one with a truncated LLM answer"""
+    analyzer = app_module.resume_analyzer
+    corpus = CorpusGenerator(seed=11)
+    payloads = {}
+    for count in words:
+        analyzer.result_cache.clear()
+        analysis = analyzer.analyze(corpus.resume(count, words=count).text)
+        payloads[f'analyze[{count}w]'] = {'success': True, 'analysis': analysis, 'resume_id': 'r' * 32}
+    
+    # Unparseable answers are returned raw inside the analysis, the largest payloads the API sends
+    service = analyzer.openrouter_service
+    answer = service._make_request
+    service._make_request = lambda messages, max_tokens=1000: answer(messages, max_tokens)[:-40]
+    analyzer.result_cache.clear()
+    analysis = analyzer.analyze(corpus.resume(0, words=words[-1]).text)
+    service._make_request = answer
+    payloads[f'analyze[{words[-1]}w, truncated LLM]'] = {'success': True, 'analysis': analysis, 'resume_id': 'r' * 32}
+    return payloads
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization and compression of analysis responses")
+    parser.add_argument('--words', type=int, nargs='+', default=[600, 2000], help="Words of the analyzed resumes")
+    parser.add_argument('--min-time', type=float, default=0.2, help="Seconds to time each measurement for")
+    args = parser.parse_args()
+    
+    import logging
+    logging.disable(logging.CRITICAL)
+    
+    app_module = load_app()
+    payloads = analysis_payloads(app_module, tuple(args.words))
+    providers = {'json': FastJSONProvider(app_module.app, 'json')}
+    if orjson is not None:
+        providers['orjson'] = FastJSONProvider(app_module.app, 'orjson')
+    
+    print(f"{'payload':<34} {'backend':<8} {'bytes':>8} {'dumps ms':>9} {'loads ms':>9}")
+    for name, payload in payloads.items():
+        for backend, provider in providers.items():
+            body = provider.dumps_bytes(payload)
+            dumps = per_call_ms(lambda: provider.dumps_bytes(payload), args.min_time)
+            loads = per_call_ms(lambda: provider.loads(body), args.min_time)
+            print(f"{name:<34} {backend:<8} {len(body):>8} {dumps:>9.3f} {loads:>9.3f}")
+    
+    encoders = {f'gzip-{level}': lambda body, level=level: gzip.compress(body, compresslevel=level, mtime=0)
+                for level in (1, 6, 9)}
+    if brotli is not None:
+        encoders.update({f'br-{quality}': lambda body, quality=quality: brotli.compress(body, quality=quality)
+                         for quality in (4, 5, 11)})
+    
+    print(f"\n{'payload':<34} {'encoding':<8} {'bytes':>8} {'ratio':>7} {'encode ms':>10}")
+    provider = providers.get('orjson', providers['json'])
+    for name, payload in payloads.items():
+        body = provider.dumps_bytes(payload)
+        print(f"{name:<34} {'identity':<8} {len(body):>8} {1:>7.2f} {0:>10.3f}")
+        for encoding, encode in encoders.items():
+            compressed = encode(body)
+            encode_ms = per_call_ms(lambda: encode(body), args.min_time)
+            print(f"{name:<34} {encoding:<8} {len(compressed):>8} {len(compressed) / len(body):>7.2f} {encode_ms:>10.3f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
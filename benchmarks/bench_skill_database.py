@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Skills database benchmark for RealiZe
+Compares indexed SkillDatabase lookups with linear scans on large synthetic databases
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.models.skill_database import SkillDatabase
+
+CATEGORIES = ['Backend', 'Frontend', 'Cloud', 'Data Science', 'Mobile', 'DevOps', 'Security', 'AI/ML']
+DEMANDS = ['High', 'Medium', 'Low']
+DIFFICULTIES = ['Easy', 'Medium', 'Hard']
+
+def make_skills_data(size: int, groups: int = 20, seed: int = 11) -> dict:
+    """Synthetic skills database with `size` skills spread over `groups` groups"""
+    rng = random.Random(seed)
+    data = {f'group_{g}': {'name': f'Group {g}', 'skills': []} for g in range(groups)}
+    for i in range(size):
+        data[f'group_{i % groups}']['skills'].append({
+            'name': f'Skill{i:06d}{rng.choice(["js", "py", "db", "ops", "ml"])}',
+            'category': rng.choice(CATEGORIES),
+            'demand': rng.choice(DEMANDS),
+            'learning_difficulty': rng.choice(DIFFICULTIES)
+        })
+    return data
+
+def linear_search(data: dict, query: str) -> list:
+    """The previous search_skills: loop over every skill of every category"""
+    query_lower = query.lower()
+    return [
+        skill for category_data in data.values() for skill in category_data['skills']
+        if query_lower in skill['name'].lower() or query_lower in skill.get('category', '').lower()
+    ]
+
+def linear_lookup(data: dict, name: str) -> dict:
+    """Case-insensitive name lookup by scanning"""
+    return next((
+        skill for category_data in data.values() for skill in category_data['skills']
+        if skill['name'].lower() == name.lower()
+    ), None)
+
+def linear_by_demand(data: dict, demand_level: str) -> list:
+    """The previous get_skills_by_demand"""
+    return [
+        skill for category_data in data.values() for skill in category_data['skills']
+        if skill.get('demand', '').lower() == demand_level.lower()
+    ]
+
+def time_call(func, *args, repeat: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SkillDatabase lookups")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 250000], help="Number of skills")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per lookup")
+    args = parser.parse_args()
+    
+    print(f"{'skills':>8} {'build ms':>9} {'lookup':<24} {'linear ms':>10} {'indexed ms':>11}")
+    for size in args.sizes:
+        data = make_skills_data(size)
+        start = time.perf_counter()
+        database = SkillDatabase(data)
+        len(database)
+        build = (time.perf_counter() - start) * 1000
+        
+        name = database.get_records()[size // 2].name.lower()
+        lookups = [
+            ("exact name", lambda: linear_lookup(data, name), lambda: database.get_skill(name)),
+            ("search 'ml' (cold)", lambda: linear_search(data, 'ml'),
+             lambda: (database._index.search_cache.clear(), database.search_skills('ml'))),
+            ("search 'ml' (cached)", lambda: linear_search(data, 'ml'), lambda: database.search_skills('ml')),
+            ("search one name (cold)", lambda: linear_search(data, name),
+             lambda: (database._index.search_cache.clear(), database.search_skills(name))),
+            ("by demand 'High'", lambda: linear_by_demand(data, 'High'), lambda: database.get_skills_by_demand('High')),
+            ("popular top 20", lambda: linear_by_demand(data, 'High')[:20], lambda: database.get_popular_skills(20))
+        ]
+        for index, (label, linear, indexed) in enumerate(lookups):
+            prefix = f"{size:>8} {build:>9.1f}" if index == 0 else f"{'':>8} {'':>9}"
+            print(f"{prefix} {label:<24} {time_call(linear, repeat=args.repeat):>10.3f} "
+                  f"{time_call(indexed, repeat=args.repeat):>11.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Skill search benchmark for RealiZe
+Measures autocomplete and fuzzy search latency per query at several taxonomy sizes
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.models.skill_database import SkillDatabase
+
+PARTS = ("cloud data web mobile api stream graph vector secure edge micro container serverless "
+         "quantum neural batch event query cache search identity payment logging metrics deploy").split()
+SUFFIXES = ("engine platform framework toolkit studio db ops analytics runtime gateway mesh sdk "
+            "pipeline server cli designer monitor orchestrator").split()
+
+QUERIES = ["k", "kub", "kubernets", "postgress", "pyth", "cloud eng", "serverles gatway", "reac", "xyzzy"]
+
+def make_skills_data(size: int, seed: int = 5) -> dict:
+    """The real database plus `size` synthetic, realistically shaped skill names"""
+    rng = random.Random(seed)
+    data = SkillDatabase().get_all_skills()
+    data = {group: {'name': value['name'], 'skills': list(value['skills'])} for group, value in data.items()}
+    synthetic = []
+    for i in range(size):
+        name = f"{rng.choice(PARTS).title()} {rng.choice(SUFFIXES).title()}"
+        if rng.random() < 0.5:
+            name += f" {rng.choice(PARTS).title()}"
+        synthetic.append({'name': f"{name} {i}", 'category': 'Synthetic',
+                          'demand': rng.choice(['High', 'Medium', 'Low'])})
+    data['synthetic'] = {'name': 'Synthetic', 'skills': synthetic}
+    return data
+
+def time_query(func, query: str, repeat: int) -> float:
+    func(query)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(query)
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill autocomplete and fuzzy search")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[0, 2000, 20000], help="Synthetic skills added")
+    parser.add_argument('--repeat', type=int, default=50, help="Runs per query")
+    args = parser.parse_args()
+    
+    print(f"{'skills':>7} {'build ms':>9} {'query':<18} {'prefix ms':>10} {'fuzzy ms':>9} {'suggest ms':>11}  top result")
+    for size in args.sizes:
+        database = SkillDatabase(make_skills_data(size))
+        start = time.perf_counter()
+        database.search_engine
+        build = (time.perf_counter() - start) * 1000
+        
+        for index, query in enumerate(QUERIES):
+            prefix = time_query(database.autocomplete, query, args.repeat)
+            fuzzy = time_query(database.fuzzy_search, query, args.repeat)
+            suggest = time_query(database.suggest, query, args.repeat)
+            top = database.suggest(query, 1)
+            label = f"{len(database):>7} {build:>9.1f}" if index == 0 else f"{'':>7} {'':>9}"
+            print(f"{label} {query:<18} {prefix:>10.3f} {fuzzy:>9.3f} {suggest:>11.3f}  "
+                  f"{top[0]['name'] if top else '-'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Skill taxonomy benchmark for RealiZe
+Measures file sizes, load times and hot-reload swaps of large JSON and SQLite taxonomies
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.models.skill_database import SkillDatabase, SkillIndex
+from backend.models.skill_taxonomy import load_taxonomy, save_taxonomy
+from bench_skill_database import make_skills_data
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000
+
+def reader_pause(database: SkillDatabase, name: str) -> float:
+    """Longest single lookup (ms) while a background reload rebuilds and swaps the indexes"""
+    version = database.version
+    database.reload(wait=False)
+    longest = 0.0
+    while database.version == version:
+        start = time.perf_counter()
+        database.get_skill(name)
+        longest = max(longest, (time.perf_counter() - start) * 1000)
+    return longest
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill taxonomy files and hot reloads")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 50000], help="Number of skills")
+    args = parser.parse_args()
+    
+    print(f"{'skills':>8} {'format':<7} {'size KB':>8} {'save ms':>8} {'load ms':>8} {'index ms':>9} "
+          f"{'reload ms':>10} {'max lookup ms':>14}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            data = make_skills_data(size)
+            for extension in ('json', 'db'):
+                path = os.path.join(directory, f'skills_{size}.{extension}')
+                save = timed(save_taxonomy, data, path)
+                load = timed(load_taxonomy, path)
+                index = timed(SkillIndex, data)
+                
+                database = SkillDatabase(path=path, reload_interval=0)
+                name = database.get_records()[size // 2].name
+                reload = timed(database.reload)
+                pause = reader_pause(database, name)
+                print(f"{size:>8} {extension:<7} {os.path.getsize(path) / 1024:>8.0f} {save:>8.1f} {load:>8.1f} "
+                      f"{index:>9.1f} {reload:>10.1f} {pause:>14.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Synthetic corpus generator for RealiZe
+Seeded resumes, resume PDFs and job descriptions built from the skills database, for benchmarks and load tests
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import textwrap
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.models.skill_database import SkillDatabase, SkillRecord
+
+FIRST_NAMES = ['Aisyah', 'Amir', 'Chen', 'Daniel', 'Farah', 'Hafiz', 'Jia Hui', 'Kumar', 'Lina', 'Marcus',
+               'Nurul', 'Priya', 'Ravi', 'Siti', 'Wei Ming', 'Zara']
+LAST_NAMES = ['Abdullah', 'Tan', 'Lim', 'Raj', 'Ismail', 'Wong', 'Hassan', 'Lee', 'Fernandez', 'Ong']
+COMPANIES = ['Acme Digital', 'Nusantara Tech', 'Bluewave Systems', 'Kijang Labs', 'Orbit Software',
+             'Petaling Data', 'Summit Cloud', 'Harbour Analytics']
+TITLES = ['Software Engineer', 'Backend Developer', 'Frontend Developer', 'Full Stack Developer',
+          'DevOps Engineer', 'Data Engineer', 'Mobile Developer', 'Data Scientist']
+SENIORITIES = ['Junior', '', 'Senior', 'Lead']
+UNIVERSITIES = ['Universiti Teknologi MARA', 'Universiti Malaya', 'Multimedia University', 'Taylor\'s University']
+DEGREES = ['Bachelor of Computer Science', 'Bachelor of Information Technology', 'Master of Data Science']
+VERBS = ['Developed', 'Designed', 'Maintained', 'Improved', 'Led', 'Migrated', 'Automated', 'Delivered',
+         'Refactored', 'Scaled']
+OBJECTS = ['the payment service', 'internal dashboards', 'a customer portal', 'data pipelines',
+           'the deployment workflow', 'REST endpoints', 'the reporting module', 'search features']
+FILLER_WORDS = ['reducing', 'latency', 'for', 'thousands', 'of', 'users', 'across', 'teams', 'and',
+                'improving', 'reliability', 'with', 'clear', 'documentation', 'the', 'production', 'systems']
+
+# Technical groups are spread through the text; these get sections of their own
+SOFT_SKILL_GROUP = 'soft_skills'
+CERTIFICATION_GROUP = 'certifications'
+DEMAND_WEIGHTS = {'High': 3.0, 'Medium': 2.0, 'Low': 1.0}
+
+# Characters per PDF text line and lines per page for Helvetica 10pt on A4
+PDF_LINE_CHARS = 95
+PDF_LINES_PER_PAGE = 60
+
+class SyntheticResume(NamedTuple):
+    """One generated resume and the skills it was built from"""
+    doc_id: str
+    text: str
+    skills: Tuple[str, ...]
+    years_experience: int
+    focus: str
+
+class SyntheticJob(NamedTuple):
+    """One generated job description and its required and optional skills"""
+    doc_id: str
+    text: str
+    required: Tuple[str, ...]
+    preferred: Tuple[str, ...]
+    min_years: int
+
+def _pdf_escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def make_pdf(pages: Sequence[Sequence[str]]) -> bytes:
+    """
+    Minimal PDF with one Helvetica text line per entry on each page
+    
+    Args:
+        pages: Lines of text for every page
+    
+    Returns:
+        PDF file bytes with a valid cross-reference table
+    """
+    font_id = 3 + 2 * len(pages)
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        ('<< /Type /Pages /Kids [%s] /Count %d >>' % (
+            ' '.join(f'{3 + 2 * i} 0 R' for i in range(len(pages))), len(pages))).encode('ascii')
+    ]
+    for i, lines in enumerate(pages):
+        content = 'BT /F1 10 Tf 12 TL 50 800 Td\n' + ''.join(
+            f'({_pdf_escape(line)}) Tj T*\n' for line in lines) + 'ET'
+        content = content.encode('latin-1', 'replace')
+        objects.append((f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+                        f'/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>').encode('ascii'))
+        objects.append(b'<< /Length %d >>\nstream\n' % len(content) + content + b'\nendstream')
+    objects.append(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+    
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b'%d 0 obj\n' % number + body + b'\nendobj\n')
+    xref = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b'%010d 00000 n \n' % offset)
+    out.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref))
+    return out.getvalue()
+
+def text_to_pdf(text: str, pages: Optional[int] = None) -> bytes:
+    """
+    Lay out text as a PDF
+    
+    Args:
+        text: Text with one paragraph per line
+        pages: Exact page count (lines are spread evenly); by default as many
+            A4 pages as the text needs
+    """
+    lines = [wrapped for line in text.split('\n') for wrapped in (textwrap.wrap(line, PDF_LINE_CHARS) or [''])]
+    if pages is None:
+        pages = max(1, -(-len(lines) // PDF_LINES_PER_PAGE))
+    per_page = -(-len(lines) // pages)
+    return make_pdf([lines[i * per_page:(i + 1) * per_page] or [' '] for i in range(pages)])
+
+class CorpusGenerator:
+    """
+    Deterministic generator of resumes and job descriptions
+    
+    Every document has its own random stream derived from the seed, its kind
+    and its index, so document 99,999 is generated as cheaply as document 0
+    and a corpus can be produced in shards or streamed without holding it
+    in memory.
+    """
+    
+    def __init__(self, seed: int = 0, skill_database: Optional[SkillDatabase] = None):
+        self.seed = seed
+        records = (skill_database or SkillDatabase()).get_records()
+        self.soft_skills = [record for record in records if record.group == SOFT_SKILL_GROUP]
+        self.certifications = [record for record in records if record.group == CERTIFICATION_GROUP]
+        self.technical = [record for record in records if record.group not in (SOFT_SKILL_GROUP, CERTIFICATION_GROUP)]
+        self.focuses = sorted({record.category for record in self.technical if record.category})
+        self._weights = [DEMAND_WEIGHTS.get(record.demand, 1.0) for record in self.technical]
+        self._pools = {}
+    
+    def _rng(self, kind: str, index: int) -> random.Random:
+        # String seeds are hashed with SHA-512, so streams are stable across runs and platforms
+        return random.Random(f'{self.seed}:{kind}:{index}')
+    
+    def _draw_skills(self, rng: random.Random, count: int, focus: str,
+                     focus_share: float = 0.7) -> List[SkillRecord]:
+        """Distinct technical skills, mostly from the focus category, weighted by market demand"""
+        pools = self._pools.get(focus)
+        if pools is None:
+            inside = [(record, weight) for record, weight in zip(self.technical, self._weights)
+                      if record.category == focus]
+            outside = [(record, weight) for record, weight in zip(self.technical, self._weights)
+                       if record.category != focus]
+            pools = self._pools[focus] = [
+                ([record for record, _ in pool], [weight for _, weight in pool]) for pool in (outside, inside) if pool
+            ]
+        count = min(count, len(self.technical))
+        chosen = {}
+        attempts = 0
+        while len(chosen) < count and attempts < count * 50:
+            attempts += 1
+            records, weights = pools[-1] if rng.random() < focus_share else pools[0]
+            record = rng.choices(records, weights)[0]
+            chosen.setdefault(record.name, record)
+        return list(chosen.values())
+    
+    def resume(self, index: int, words: int = 600, skill_count: int = 12,
+               skill_density: float = 0.06) -> SyntheticResume:
+        """
+        Generate one resume
+        
+        Args:
+            index: Document number; the same seed and index always give the same resume
+            words: Approximate length in words
+            skill_count: Distinct technical skills the candidate has
+            skill_density: Share of words in experience bullets that are skill mentions
+        
+        Returns:
+            The resume text with its skills, years of experience and focus category
+        """
+        rng = self._rng('resume', index)
+        focus = rng.choice(self.focuses)
+        skills = self._draw_skills(rng, skill_count, focus)
+        names = [skill.name for skill in skills]
+        soft = [record.name for record in rng.sample(self.soft_skills, min(3, len(self.soft_skills)))]
+        certifications = [record.name for record in rng.sample(self.certifications, rng.randint(0, 2))]
+        years = rng.randint(0, 15)
+        
+        lines = [
+            f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            f'candidate{index}@example.com | +60 1{rng.randint(0, 9)}-{rng.randint(100, 999)} {rng.randint(1000, 9999)}',
+            'Summary',
+            f'{focus} professional with {years}+ years of experience in {", ".join(names[:3])}. '
+            f'Known for {", ".join(soft).lower()}.',
+            'Experience'
+        ]
+        header = sum(len(line.split()) for line in lines)
+        jobs = max(1, min(4, years // 3 + 1))
+        year = 2025
+        budget = max(words - header - 40, 20)
+        for job in range(jobs):
+            span = max(1, years // jobs) if years else 1
+            seniority = SENIORITIES[min(len(SENIORITIES) - 1, years // 4)] if job == 0 else rng.choice(SENIORITIES[:2])
+            title = f'{seniority} {rng.choice(TITLES)}'.strip()
+            lines.append(f'{title}, {rng.choice(COMPANIES)}, {year - span} - {"Present" if job == 0 else year}')
+            year -= span
+            job_budget = budget // jobs
+            while job_budget > 0:
+                bullet = [rng.choice(VERBS), rng.choice(OBJECTS)]
+                length = rng.randint(10, 18)
+                while len(bullet) < length:
+                    bullet.append(rng.choice(names) if rng.random() < skill_density else rng.choice(FILLER_WORDS))
+                line = '- ' + ' '.join(bullet) + '.'
+                lines.append(line)
+                job_budget -= line.count(' ')
+        
+        lines.extend([
+            'Education',
+            f'{rng.choice(DEGREES)}, {rng.choice(UNIVERSITIES)}, {year - 4} - {year}',
+            'Skills',
+            ', '.join(names)
+        ])
+        if certifications:
+            lines.append('Certifications')
+            lines.extend(certifications)
+        return SyntheticResume(f'resume-{self.seed}-{index}', '\n'.join(lines), tuple(names), years, focus)
+    
+    def job_description(self, index: int, required_count: int = 6, preferred_count: int = 4,
+                        resume: Optional[SyntheticResume] = None, overlap: float = 0.6) -> SyntheticJob:
+        """
+        Generate one job description
+        
+        Args:
+            index: Document number; the same seed and index always give the same job
+            required_count: Required technical skills
+            preferred_count: Nice-to-have technical skills
+            resume: Optional resume to match; `overlap` of the required skills come from it
+            overlap: Share of required skills taken from the resume
+        """
+        rng = self._rng('job', index)
+        focus = resume.focus if resume else rng.choice(self.focuses)
+        required = []
+        if resume:
+            shared = list(resume.skills)
+            rng.shuffle(shared)
+            required = shared[:round(required_count * overlap)]
+        for record in self._draw_skills(rng, required_count + preferred_count + len(required), focus):
+            if len(required) >= required_count:
+                break
+            if record.name not in required:
+                required.append(record.name)
+        preferred = [record.name for record in self._draw_skills(rng, preferred_count * 2, focus)
+                     if record.name not in required][:preferred_count]
+        min_years = rng.choice([0, 1, 2, 3, 5, 7])
+        title = f'{rng.choice(SENIORITIES)} {rng.choice(TITLES)}'.strip()
+        soft = [record.name for record in rng.sample(self.soft_skills, min(2, len(self.soft_skills)))]
+        
+        lines = [
+            f'{title} at {rng.choice(COMPANIES)}',
+            f'We are looking for a {focus} engineer to join our team.',
+            'Requirements:',
+            *(f'- Experience with {name}' for name in required),
+            f'- {min_years}+ years of professional experience' if min_years else '- Fresh graduates are welcome',
+            'Nice to have:',
+            *(f'- {name}' for name in preferred),
+            f'Soft skills: {", ".join(soft)}.'
+        ]
+        return SyntheticJob(f'job-{self.seed}-{index}', '\n'.join(lines), tuple(required), tuple(preferred), min_years)
+    
+    def resumes(self, count: int, start: int = 0, **options) -> Iterator[SyntheticResume]:
+        """Lazily generate resumes start .. start + count - 1 (options as for resume())"""
+        for index in range(start, start + count):
+            yield self.resume(index, **options)
+    
+    def job_descriptions(self, count: int, start: int = 0, **options) -> Iterator[SyntheticJob]:
+        """Lazily generate job descriptions start .. start + count - 1"""
+        for index in range(start, start + count):
+            yield self.job_description(index, **options)
+    
+    def resume_pdf(self, index: int, pages: Optional[int] = None, **options) -> bytes:
+        """The resume with this index as PDF bytes, on `pages` pages if given"""
+        return text_to_pdf(self.resume(index, **options).text, pages)
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic resume and job description corpus")
+    parser.add_argument('output', help="Directory for the corpus")
+    parser.add_argument('--resumes', type=int, default=100)
+    parser.add_argument('--jobs', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--words', type=int, default=600, help="Approximate words per resume")
+    parser.add_argument('--skills', type=int, default=12, help="Distinct skills per resume")
+    parser.add_argument('--density', type=float, default=0.06, help="Share of bullet words that are skills")
+    parser.add_argument('--pdf', action='store_true', help="Also write every resume as PDF")
+    parser.add_argument('--pages', type=int, default=None, help="Pages per PDF (default: as needed)")
+    args = parser.parse_args()
+    
+    generator = CorpusGenerator(args.seed)
+    options = {'words': args.words, 'skill_count': args.skills, 'skill_density': args.density}
+    os.makedirs(args.output, exist_ok=True)
+    with open(os.path.join(args.output, 'manifest.jsonl'), 'w', encoding='utf-8') as manifest:
+        for resume in generator.resumes(args.resumes, **options):
+            files = {'text': f'{resume.doc_id}.txt'}
+            with open(os.path.join(args.output, files['text']), 'w', encoding='utf-8') as f:
+                f.write(resume.text)
+            if args.pdf:
+                files['pdf'] = f'{resume.doc_id}.pdf'
+                with open(os.path.join(args.output, files['pdf']), 'wb') as f:
+                    f.write(text_to_pdf(resume.text, args.pages))
+            manifest.write(json.dumps({'id': resume.doc_id, 'kind': 'resume', 'skills': resume.skills,
+                                       'years_experience': resume.years_experience, **files}) + '\n')
+        for job in generator.job_descriptions(args.jobs):
+            path = f'{job.doc_id}.txt'
+            with open(os.path.join(args.output, path), 'w', encoding='utf-8') as f:
+                f.write(job.text)
+            manifest.write(json.dumps({'id': job.doc_id, 'kind': 'job', 'required': job.required,
+                                       'preferred': job.preferred, 'min_years': job.min_years, 'text': path}) + '\n')
+    print(f"Wrote {args.resumes} resumes and {args.jobs} job descriptions to {args.output}")
+
+if __name__ == "__main__":
+    main()
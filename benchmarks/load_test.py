@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+HTTP load test for RealiZe
+Drives the API with a configurable route mix and arrival rate and reports throughput, errors and latency percentiles
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.corpus import CorpusGenerator, text_to_pdf
+
+# Route name -> (method, path)
+ROUTES = {
+    'analyze': ('POST', '/api/analyze-resume'),
+    'compare': ('POST', '/api/compare-job'),
+    'career': ('POST', '/api/career-suggestions'),
+    'skills': ('GET', '/api/skills-database')
+}
+DEFAULT_MIX = 'analyze=1,compare=2,career=1,skills=4'
+PERCENTILES = (50, 95, 99)
+
+# Bump when the report layout changes
+REPORT_VERSION = "1"
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """'analyze=1,skills=4' -> route weights; unknown routes and negative weights are rejected"""
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ROUTES:
+            raise ValueError(f"Unknown route '{name}' in mix, expected one of {', '.join(ROUTES)}")
+        try:
+            mix[name] = float(weight or 1)
+        except ValueError:
+            raise ValueError(f"Invalid weight '{weight}' for route '{name}'")
+        if mix[name] < 0:
+            raise ValueError(f"Negative weight for route '{name}'")
+    if not any(mix.values()):
+        raise ValueError("Route mix has no positive weights")
+    return mix
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+class RequestFactory:
+    """Builds request arguments for each route from a seeded synthetic corpus"""
+    
+    def __init__(self, seed: int, pool_size: int, pages: int, unique_uploads: bool):
+        corpus = CorpusGenerator(seed)
+        self.resumes = list(corpus.resumes(pool_size))
+        self.jobs = [corpus.job_description(i, resume=resume) for i, resume in enumerate(self.resumes)]
+        self.pdfs = [text_to_pdf(resume.text, pages) for resume in self.resumes]
+        self.unique_uploads = unique_uploads
+        self.pages = pages
+        self._corpus = corpus
+        self._counter = pool_size
+        self._lock = threading.Lock()
+    
+    def _upload(self, rng: random.Random) -> bytes:
+        if not self.unique_uploads:
+            return rng.choice(self.pdfs)
+        # A resume the server has never seen, so the analysis cache cannot answer it
+        with self._lock:
+            index = self._counter
+            self._counter += 1
+        return text_to_pdf(self._corpus.resume(index).text, self.pages)
+    
+    def build(self, route: str, rng: random.Random) -> Dict[str, Any]:
+        """Keyword arguments for requests.Session.request"""
+        slot = rng.randrange(len(self.resumes))
+        if route == 'analyze':
+            return {'files': {'resume': ('resume.pdf', self._upload(rng), 'application/pdf')}}
+        if route == 'compare':
+            return {'json': {'resume_text': self.resumes[slot].text, 'job_description': self.jobs[slot].text}}
+        if route == 'career':
+            return {'json': {'resume_text': self.resumes[slot].text}}
+        return {'headers': {'Accept-Encoding': 'gzip'}}
+
+class LoadTest:
+    """
+    Open-loop load generator
+    
+    Requests are scheduled by a Poisson process at the target rate and sent
+    by at most `concurrency` workers. Latency is measured from the scheduled
+    send time, so time spent waiting for a free worker counts: a server that
+    falls behind shows up in the percentiles instead of silently lowering the
+    offered load. With rate 0 the workers send back to back (closed loop).
+    """
+    
+    def __init__(self, base_url: str, mix: Dict[str, float], factory: RequestFactory, rate: float,
+                 concurrency: int, duration: float, timeout: float, seed: int):
+        self.base_url = base_url.rstrip('/')
+        self.routes = [route for route, weight in mix.items() if weight > 0]
+        self.weights = [mix[route] for route in self.routes]
+        self.factory = factory
+        self.rate = rate
+        self.concurrency = concurrency
+        self.duration = duration
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.samples = []
+        self._samples_lock = threading.Lock()
+        self._local = threading.local()
+    
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+    
+    def _send(self, route: str, kwargs: Dict[str, Any], scheduled: float):
+        method, path = ROUTES[route]
+        status = None
+        try:
+            response = self._session().request(method, self.base_url + path, timeout=self.timeout, **kwargs)
+            status = response.status_code
+        except requests.RequestException as e:
+            status = type(e).__name__
+        finished = time.perf_counter()
+        with self._samples_lock:
+            self.samples.append((route, scheduled, finished, status))
+    
+    def _next_request(self) -> Tuple[str, Dict[str, Any]]:
+        route = self.rng.choices(self.routes, self.weights)[0]
+        return route, self.factory.build(route, self.rng)
+    
+    def run(self) -> float:
+        """Send load for `duration` seconds and wait for the stragglers; returns the wall time"""
+        start = time.perf_counter()
+        deadline = start + self.duration
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            if self.rate > 0:
+                scheduled = start
+                while True:
+                    scheduled += self.rng.expovariate(self.rate)
+                    if scheduled >= deadline:
+                        break
+                    route, kwargs = self._next_request()
+                    delay = scheduled - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    executor.submit(self._send, route, kwargs, scheduled)
+            else:
+                def closed_loop():
+                    while time.perf_counter() < deadline:
+                        with self._samples_lock:
+                            route, kwargs = self._next_request()
+                        self._send(route, kwargs, time.perf_counter())
+                for _ in range(self.concurrency):
+                    executor.submit(closed_loop)
+        return time.perf_counter() - start
+    
+    def summarize(self, elapsed: float) -> Dict[str, Any]:
+        """Throughput, error rate, status counts and latency percentiles per route and overall"""
+        by_route = {route: [] for route in self.routes}
+        for sample in self.samples:
+            by_route[sample[0]].append(sample)
+        summary = {route: summarize_samples(samples, elapsed) for route, samples in by_route.items()}
+        summary['all'] = summarize_samples(self.samples, elapsed)
+        return summary
+
+def summarize_samples(samples: List[Tuple[str, float, float, Any]], elapsed: float) -> Dict[str, Any]:
+    latencies = sorted((finished - scheduled) * 1000 for _, scheduled, finished, _ in samples)
+    statuses = {}
+    for *_, status in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    errors = sum(count for status, count in statuses.items() if not (status.isdigit() and int(status) < 400))
+    ok = len(samples) - errors
+    result = {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+        'throughput_rps': round(ok / elapsed, 2) if elapsed else 0.0,
+        'statuses': statuses,
+        'mean_ms': round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        'max_ms': round(latencies[-1], 2) if latencies else 0.0
+    }
+    for percent in PERCENTILES:
+        result[f'p{percent}_ms'] = round(percentile(latencies, percent), 2)
+    return result
+
+def print_summary(summary: Dict[str, Dict[str, Any]], previous: Optional[Dict[str, Dict[str, Any]]] = None):
+    print(f"{'route':<9} {'requests':>8} {'errors':>7} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for route, result in summary.items():
+        print(f"{route:<9} {result['requests']:>8} {result['error_rate']:>7.1%} {result['throughput_rps']:>8.1f} "
+              f"{result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} {result['p99_ms']:>9.1f}")
+        before = (previous or {}).get(route)
+        if before:
+            changes = ' '.join(
+                f"{key.replace('_ms', '').replace('_rps', '')} {_change(before[key], result[key])}"
+                for key in ('throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms')
+            )
+            print(f"{'':<9} vs previous: {changes}")
+
+def _change(before: float, after: float) -> str:
+    return f"{(after - before) / before:+.0%}" if before else 'n/a'
+
+def spawn(command: List[str], env: Dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def wait_until_up(url: str, timeout: float = 30.0):
+    """Poll a URL until it answers, raising RuntimeError after timeout seconds"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(url, timeout=1)
+            return
+        except requests.RequestException:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up within {timeout:.0f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test a running RealiZe server")
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help="Base URL of the server under test")
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f"Route weights (default {DEFAULT_MIX})")
+    parser.add_argument('--rate', type=float, default=10.0, help="Requests per second; 0 = closed loop")
+    parser.add_argument('--concurrency', type=int, default=32, help="Maximum requests in flight")
+    parser.add_argument('--duration', type=float, default=30.0, help="Seconds of load")
+    parser.add_argument('--timeout', type=float, default=60.0, help="Per-request timeout in seconds")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--pool', type=int, default=50, help="Distinct resumes and job descriptions to send")
+    parser.add_argument('--pages', type=int, default=2, help="Pages per uploaded PDF")
+    parser.add_argument('--unique-uploads', action='store_true',
+                        help="Upload a new resume every time so analyses are never served from cache")
+    parser.add_argument('--output', help="Write the report as JSON to this file")
+    parser.add_argument('--compare', help="Previous JSON report to print changes against")
+    parser.add_argument('--stub-port', type=int, help="Start benchmarks/openrouter_stub.py on this port")
+    parser.add_argument('--stub-args', default='--latency lognormal:800,0.5',
+                        help="Extra arguments for the OpenRouter stub")
+    parser.add_argument('--server-cmd', help="Start the server under test with this command "
+                        "(given OPENROUTER_BASE_URL of the stub) and stop it afterwards")
+    args = parser.parse_args()
+    
+    mix = parse_mix(args.mix)
+    processes = []
+    try:
+        env = dict(os.environ)
+        if args.stub_port:
+            stub_url = f'http://127.0.0.1:{args.stub_port}/api/v1'
+            processes.append(spawn([sys.executable, str(Path(__file__).resolve().parent / 'openrouter_stub.py'),
+                                    '--port', str(args.stub_port), *shlex.split(args.stub_args)], env))
+            wait_until_up(f'http://127.0.0.1:{args.stub_port}/stub/stats')
+            env.update(OPENROUTER_BASE_URL=stub_url, OPENROUTER_API_KEY=env.get('OPENROUTER_API_KEY') or 'stub')
+        if args.server_cmd:
+            processes.append(spawn(shlex.split(args.server_cmd), env))
+            wait_until_up(args.url.rstrip('/') + '/health', timeout=60)
+        
+        factory = RequestFactory(args.seed, args.pool, args.pages, args.unique_uploads)
+        load_test = LoadTest(args.url, mix, factory, args.rate, args.concurrency, args.duration,
+                             args.timeout, args.seed)
+        print(f"Sending {args.mix} at {args.rate or 'max'} req/s with {args.concurrency} workers "
+              f"for {args.duration:.0f}s to {args.url}", file=sys.stderr)
+        elapsed = load_test.run()
+        summary = load_test.summarize(elapsed)
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait(timeout=10)
+    
+    previous = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f).get('routes')
+    print_summary(summary, previous)
+    
+    if args.output:
+        report = {
+            'meta': {
+                'report_version': REPORT_VERSION,
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'url': args.url,
+                'mix': mix,
+                'rate': args.rate,
+                'concurrency': args.concurrency,
+                'duration': args.duration,
+                'elapsed': round(elapsed, 3),
+                'seed': args.seed,
+                'pool': args.pool,
+                'pages': args.pages,
+                'unique_uploads': args.unique_uploads,
+                'stub_args': args.stub_args if args.stub_port else None,
+                'server_cmd': args.server_cmd
+            },
+            'routes': summary
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Memory profiler for RealiZe
+Peak and retained tracemalloc allocations per pipeline stage, and retention across many requests
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import argparse
+import gc
+import io
+import os
+import re
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.corpus import CorpusGenerator, text_to_pdf
+
+# Budgets for a 2-page resume upload; the tests and --check fail above them
+REQUEST_PEAK_BUDGET_KB = 1024
+RETAINED_BUDGET_KB = 256
+RETAINED_REQUESTS = 30
+
+def start_peak() -> int:
+    """
+    Restart the traced peak
+    
+    tracemalloc.reset_peak needs Python 3.9; on 3.8 the traces are cleared
+    instead. Blocks allocated before then are no longer traced, so their
+    frees are not counted and peak and retained sizes read slightly high.
+    
+    Returns:
+        The traced size to measure the new peak and current size against
+    """
+    if hasattr(tracemalloc, 'reset_peak'):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        return before
+    tracemalloc.clear_traces()
+    return 0
+
+class StageProfiler:
+    """
+    Records traced allocations of consecutive pipeline stages
+    
+    peak_kb is the highest allocation above the stage's starting point;
+    retained_kb is what is still alive after the stage and a full garbage
+    collection, i.e. the stage's output plus anything it leaked or cached.
+    Stages must not be nested, since each one resets the traced peak.
+    """
+    
+    def __init__(self):
+        self.stages = {}
+    
+    @contextmanager
+    def stage(self, name: str):
+        gc.collect()
+        before = start_peak()
+        try:
+            yield
+        finally:
+            peak = tracemalloc.get_traced_memory()[1] - before
+            gc.collect()
+            retained = tracemalloc.get_traced_memory()[0] - before
+            entry = self.stages.setdefault(name, {'calls': 0, 'peak_kb': 0.0, 'retained_kb': 0.0})
+            entry['calls'] += 1
+            entry['peak_kb'] = max(entry['peak_kb'], round(peak / 1024, 1))
+            entry['retained_kb'] = round(retained / 1024, 1)
+
+@contextmanager
+def tracing(frames: int = 1):
+    """Run the block under tracemalloc, unless tracing is already on"""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(frames)
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+def load_app():
+    """Import the app with memory-only stores and in-process OpenRouter stub replies"""
+    os.environ.setdefault('ANALYSIS_CACHE_PATH', '')
+    os.environ.setdefault('RESUME_STORE_PATH', '')
+    os.environ.setdefault('RESUME_INDEX_PATH', '')
+    os.environ.setdefault('RATE_LIMIT_PER_MINUTE', '0')
+    import app as app_module
+    from benchmarks.openrouter_stub import patch_service
+    patch_service(app_module.resume_analyzer.openrouter_service)
+    # Import and build everything the app defers, so it is not counted against the first stage
+    app_module.warm_up()
+    return app_module
+
+def multipart_body(pdf_bytes: bytes, boundary: str = 'memory-profile') -> bytes:
+    """A multipart/form-data body uploading pdf_bytes as the 'resume' field"""
+    return (f'--{boundary}\r\nContent-Disposition: form-data; name="resume"; filename="resume.pdf"\r\n'
+            f'Content-Type: application/pdf\r\n\r\n').encode('latin-1') + pdf_bytes + f'\r\n--{boundary}--\r\n'.encode('latin-1')
+
+def clear_caches(app_module):
+    """Forget analyses and uploaded files, so the next upload is parsed and analyzed again"""
+    app_module.resume_analyzer.result_cache.clear()
+    app_module.resume_store.uploads.clear()
+
+def profile_stages(app_module, pdf_bytes: bytes, profiler: StageProfiler, cold: bool = True) -> Dict[str, Any]:
+    """
+    Run one upload through the same stages as /api/analyze-resume, each profiled
+    
+    Args:
+        cold: Clear the analysis and upload caches first so the analysis really runs
+    """
+    from backend.utils.upload_stream import receive_pdf_upload
+    
+    if cold:
+        clear_caches(app_module)
+    body = multipart_body(pdf_bytes)
+    with profiler.stage('upload'):
+        upload = receive_pdf_upload(io.BytesIO(body), b'memory-profile')
+    with upload:
+        with profiler.stage('extract_text'):
+            text = app_module.pdf_processor.extract_text_from_stream(upload.file)
+    with profiler.stage('analyze'):
+        analysis = app_module.resume_analyzer.analyze(text)
+    with profiler.stage('store'):
+        resume_id = app_module.resume_store.save(text, analysis)
+        app_module.resume_store.remember_upload(upload.digest, resume_id)
+        app_module.candidate_ranker.add_resume(resume_id, analysis['basic_skills'])
+        app_module.resume_index.add_resume(resume_id, analysis['basic_skills'], analysis['experience_analysis'])
+    with profiler.stage('serialize'):
+        body = app_module.app.json.dumps_bytes({'success': True, 'analysis': analysis, 'resume_id': resume_id})
+    del body
+    return profiler.stages
+
+def post_resume(client, pdf_bytes: bytes):
+    response = client.post('/api/analyze-resume', data={'resume': (io.BytesIO(pdf_bytes), 'resume.pdf')},
+                           content_type='multipart/form-data')
+    if response.status_code != 200:
+        raise RuntimeError(f"/api/analyze-resume returned {response.status_code}")
+    response.close()
+
+def request_peak_kb(app_module, pdf_bytes: bytes) -> float:
+    """Peak traced allocation (KB) of one cold /api/analyze-resume request"""
+    client = app_module.app.test_client()
+    with tracing():
+        post_resume(client, pdf_bytes)
+        clear_caches(app_module)
+        gc.collect()
+        before = start_peak()
+        post_resume(client, pdf_bytes)
+        return round((tracemalloc.get_traced_memory()[1] - before) / 1024, 1)
+
+def retained_kb(app_module, pdfs: Sequence[bytes], requests: int,
+                top: int = 0) -> Tuple[float, List[str]]:
+    """
+    Memory (KB) still held after `requests` uploads cycling through `pdfs`
+    
+    Every pdf is uploaded once first, so caches that legitimately keep one
+    entry per resume are already filled; anything retained afterwards grows
+    with the request count and is a leak. The re module's pattern cache is
+    purged around the measurement: werkzeug compiles one pattern per
+    multipart boundary, and that cache is bounded.
+    
+    Returns:
+        Retained KB and, if top > 0, the biggest growing allocation sites
+    """
+    client = app_module.app.test_client()
+    with tracing(frames=8 if top else 1):
+        for pdf_bytes in pdfs:
+            post_resume(client, pdf_bytes)
+        re.purge()
+        gc.collect()
+        before = tracemalloc.take_snapshot() if top else None
+        start = tracemalloc.get_traced_memory()[0]
+        for i in range(requests):
+            clear_caches(app_module)
+            post_resume(client, pdfs[i % len(pdfs)])
+        re.purge()
+        gc.collect()
+        retained = round((tracemalloc.get_traced_memory()[0] - start) / 1024, 1)
+        sites = []
+        if top:
+            for stat in tracemalloc.take_snapshot().compare_to(before, 'traceback')[:top]:
+                # Allocation site, and the innermost project frame that led to it
+                frames = list(stat.traceback)
+                caller = next((frame for frame in reversed(frames) if str(project_root) in frame.filename), None)
+                site = f"{frames[-1].filename}:{frames[-1].lineno}"
+                if caller is not None and caller is not frames[-1]:
+                    site += f" via {caller.filename}:{caller.lineno}"
+                sites.append(f"{stat.size_diff / 1024:+.1f} KB ({stat.count_diff:+d} blocks) {site}")
+        return retained, sites
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile memory of the resume analysis pipeline")
+    parser.add_argument('--pages', type=int, default=2, help="Pages of the uploaded resume")
+    parser.add_argument('--words', type=int, default=1000, help="Words of the uploaded resume")
+    parser.add_argument('--requests', type=int, default=RETAINED_REQUESTS,
+                        help="Requests to run when measuring retained memory")
+    parser.add_argument('--pool', type=int, default=5, help="Distinct resumes cycled through")
+    parser.add_argument('--top', type=int, default=10, help="Growing allocation sites to list")
+    parser.add_argument('--check', action='store_true', help="Exit with status 1 when a budget is exceeded")
+    args = parser.parse_args()
+    
+    import logging
+    logging.disable(logging.CRITICAL)
+    
+    app_module = load_app()
+    corpus = CorpusGenerator(seed=5)
+    pdfs = [text_to_pdf(corpus.resume(i, words=args.words).text, args.pages) for i in range(args.pool)]
+    
+    profiler = StageProfiler()
+    with tracing():
+        profile_stages(app_module, pdfs[0], profiler)
+    print(f"{'stage':<14} {'peak KB':>10} {'retained KB':>12}")
+    for name, entry in profiler.stages.items():
+        print(f"{name:<14} {entry['peak_kb']:>10.1f} {entry['retained_kb']:>12.1f}")
+    
+    peak = request_peak_kb(app_module, pdfs[0])
+    retained, sites = retained_kb(app_module, pdfs, args.requests, args.top)
+    print(f"\nPeak of one request:            {peak:>10.1f} KB (budget {REQUEST_PEAK_BUDGET_KB} KB)")
+    print(f"Retained after {args.requests} requests:  {retained:>10.1f} KB (budget {RETAINED_BUDGET_KB} KB)")
+    for site in sites:
+        print(f"  {site}")
+    
+    if args.check and (peak > REQUEST_PEAK_BUDGET_KB or retained > RETAINED_BUDGET_KB):
+        print("Memory budget exceeded", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+OpenRouter stand-in server for RealiZe
+Local /api/v1/chat/completions with schema-valid answers, injected latency, errors and truncation
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import Flask, Response, jsonify, request
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.services.openrouter_service import PROMPTS
+
+# Names the stub recognizes in resume text, by skill-analysis category
+SKILL_VOCABULARY = {
+    'programming_languages': ['Python', 'Java', 'JavaScript', 'TypeScript', 'C#', 'C++', 'Go', 'Rust', 'PHP',
+                              'Ruby', 'Swift', 'Kotlin', 'SQL'],
+    'frameworks': ['React', 'Angular', 'Vue.js', 'Django', 'Flask', 'Spring', 'ASP.NET', 'Node.js',
+                   'Express.js', 'TensorFlow', 'PyTorch'],
+    'databases': ['PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'SQLite', 'Elasticsearch'],
+    'cloud_platforms': ['AWS', 'Microsoft Azure', 'Google Cloud Platform', 'Heroku'],
+    'tools': ['Git', 'Docker', 'Kubernetes', 'Jenkins', 'Terraform', 'Linux', 'GraphQL']
+}
+SOFT_SKILLS = ['Leadership', 'Communication', 'Problem Solving', 'Teamwork', 'Mentoring']
+PROFICIENCIES = ['Beginner', 'Intermediate', 'Advanced', 'Expert']
+
+ERROR_MESSAGES = {
+    429: 'Rate limit exceeded: free-models-per-min',
+    500: 'Internal Server Error',
+    502: 'Provider returned error',
+    503: 'No instances available'
+}
+
+class LatencyModel:
+    """
+    Response latency distribution parsed from a 'kind:params' spec, in milliseconds
+    
+    constant:200, uniform:100,800, normal:500,150 (mean, stddev) and
+    lognormal:500,0.6 (median, sigma of the underlying normal).
+    """
+    
+    KINDS = {'constant': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2}
+    
+    def __init__(self, spec: str = 'constant:0'):
+        kind, _, params = spec.partition(':')
+        try:
+            values = [float(value) for value in params.split(',')] if params else [0.0]
+        except ValueError:
+            raise ValueError(f"Invalid latency parameters in '{spec}'")
+        if kind not in self.KINDS or len(values) != self.KINDS[kind]:
+            raise ValueError(f"Invalid latency spec '{spec}', expected one of "
+                             "constant:MS, uniform:MIN,MAX, normal:MEAN,STDDEV, lognormal:MEDIAN,SIGMA")
+        self.spec = spec
+        self.kind = kind
+        self.values = values
+    
+    def sample(self, rng: random.Random) -> float:
+        """One latency in seconds (never negative)"""
+        if self.kind == 'constant':
+            ms = self.values[0]
+        elif self.kind == 'uniform':
+            ms = rng.uniform(*self.values)
+        elif self.kind == 'normal':
+            ms = rng.gauss(*self.values)
+        else:
+            ms = self.values[0] * math.exp(rng.gauss(0.0, self.values[1]))
+        return max(ms, 0.0) / 1000
+
+def _found(text: str, names: List[str]) -> List[str]:
+    return [name for name in names if re.search(r'(?<!\w)' + re.escape(name.lower()) + r'(?!\w)', text)]
+
+def skill_analysis(text: str, rng: random.Random) -> Dict[str, Any]:
+    lower = text.lower()
+    result = {
+        category: [
+            {'name': name, 'proficiency': rng.choice(PROFICIENCIES), 'mentions': lower.count(name.lower())}
+            for name in _found(lower, names)
+        ]
+        for category, names in SKILL_VOCABULARY.items()
+    }
+    skills = sum(len(found) for found in result.values())
+    result['certifications'] = ['AWS Certified Developer'] if 'certified' in lower else []
+    result['soft_skills'] = _found(lower, SOFT_SKILLS) or ['Problem Solving']
+    result['experience_level'] = 'Senior' if skills > 12 else 'Mid-Level' if skills > 5 else 'Junior'
+    result['overall_score'] = min(40 + 4 * skills, 95)
+    return result
+
+def job_comparison(text: str, rng: random.Random) -> Dict[str, Any]:
+    resume, _, job = text.lower().partition('job description')
+    names = [name for names in SKILL_VOCABULARY.values() for name in names]
+    wanted = _found(job, names) or names[:5]
+    matches = _found(resume, wanted)
+    missing = [name for name in wanted if name not in matches]
+    return {
+        'match_score': round(100 * len(matches) / len(wanted)),
+        'strong_matches': matches,
+        'missing_skills': missing,
+        'recommendations': [f'Build a project using {name}' for name in missing[:3]],
+        'overall_assessment': 'Good fit with some skill gaps' if len(matches) >= len(missing) else 'Partial fit',
+        'priority_gaps': missing[:2]
+    }
+
+def career_suggestions(text: str, rng: random.Random) -> Dict[str, Any]:
+    titles = ['Backend Developer', 'Full Stack Developer', 'DevOps Engineer', 'Data Engineer', 'Cloud Architect']
+    return {
+        'career_paths': [
+            {
+                'title': title,
+                'match_percentage': rng.randint(55, 95),
+                'description': f'Grow towards a {title} role',
+                'learning_path': ['System design', 'Cloud architecture', 'Testing practices']
+            }
+            for title in rng.sample(titles, 3)
+        ],
+        'skills_to_develop': ['System Design', 'Cloud Architecture', 'DevOps'],
+        'industry_trends': ['AI/ML Integration', 'Serverless Computing', 'Edge Computing'],
+        'salary_range': {'min': 60000, 'max': 120000},
+        'action_plan': ['Complete a cloud certification', 'Build a portfolio project', 'Contribute to open source']
+    }
+
+def ai_recommendations(text: str, rng: random.Random) -> Dict[str, Any]:
+    categories = ['Skills', 'Certifications', 'Experience', 'Trends']
+    return {
+        'recommendations': [
+            {
+                'title': f'{category} recommendation',
+                'description': f'Concrete next steps to strengthen {category.lower()}.',
+                'priority': rng.choice(['High', 'Medium', 'Low']),
+                'category': category
+            }
+            for category in categories[:rng.randint(3, 4)]
+        ]
+    }
+
+def ai_summary(text: str, rng: random.Random) -> Dict[str, Any]:
+    return {
+        'overall_assessment': 'Solid technical foundation with clear growth areas.',
+        'key_strengths': ['Hands-on development experience', 'Broad tool knowledge', 'Delivery focus'],
+        'areas_for_improvement': ['Specialization', 'Certifications'],
+        'career_trajectory': 'Steady progression towards senior roles',
+        'market_competitiveness': 'Competitive for mid-level positions',
+        'summary': ' '.join(['The candidate shows practical experience across the stack.'] * 6)
+    }
+
+# Prompt key (as in OpenRouterService PROMPTS) -> answer builder
+ANSWERS = {
+    'skill_analysis': skill_analysis,
+    'job_comparison': job_comparison,
+    'career_suggestions': career_suggestions,
+    'ai_recommendations': ai_recommendations,
+    'ai_summary': ai_summary
+}
+
+PROMPT_KEYS = {prompt: key for key, prompt in PROMPTS.items()}
+
+def answer_messages(messages: List[Dict[str, Any]], rng: random.Random) -> Tuple[Optional[str], str]:
+    """
+    The stub's reply to a chat conversation
+    
+    Returns:
+        The PROMPTS key of the system prompt (None if unknown) and the reply content
+    """
+    system = next((m.get('content', '') for m in messages if m.get('role') == 'system'), '')
+    user = '\n'.join(m.get('content', '') for m in messages if m.get('role') == 'user')
+    key = PROMPT_KEYS.get(system)
+    if key is None:
+        return None, 'This is a canned reply from the local OpenRouter stand-in.'
+    return key, json.dumps(ANSWERS[key](user, rng), indent=2)
+
+def patch_service(service, seed: int = 0):
+    """
+    Answer an OpenRouterService's LLM calls in-process with the stub's replies
+    
+    For benchmarks and profiling that need realistic LLM output without the
+    network; parsing and canonicalization of the reply still run.
+    """
+    rng = random.Random(seed)
+    lock = threading.Lock()
+    
+    def make_request(messages: list, max_tokens: int = 1000) -> Optional[str]:
+        with lock:
+            answer_rng = random.Random(rng.random())
+        return answer_messages(messages, answer_rng)[1]
+    
+    service.api_key = service.api_key or 'stub'
+    service._make_request = make_request
+
+class StubStats:
+    """Thread-safe counters of what the stub answered"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {}
+    
+    def add(self, key: str):
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+    
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+def create_stub_app(latency: str = 'constant:0', rate_429: float = 0.0, rate_5xx: float = 0.0,
+                    truncate_rate: float = 0.0, seed: Optional[int] = None, chunk_chars: int = 40,
+                    first_token_fraction: float = 0.3) -> Flask:
+    """
+    Flask app imitating OpenRouter's chat completions API
+    
+    Args:
+        latency: LatencyModel spec for the whole response
+        rate_429: Share of requests rejected with 429 and Retry-After
+        rate_5xx: Share of requests failing with 500/502/503
+        truncate_rate: Share of answers cut off mid-JSON (finish_reason 'length')
+        seed: Seed for latencies, failures and answers
+        chunk_chars: Content characters per streamed chunk
+        first_token_fraction: Share of the latency spent before the first streamed chunk
+    
+    Returns:
+        The app; GET /stub/stats reports counts per prompt and outcome
+    """
+    latency_model = LatencyModel(latency)
+    rng = random.Random(seed)
+    rng_lock = threading.Lock()
+    stats = StubStats()
+    stub = Flask(__name__)
+    
+    def draw(func, *args):
+        with rng_lock:
+            return func(*args)
+    
+    def error(status: int, message: str) -> Response:
+        response = jsonify({'error': {'code': status, 'message': message}})
+        response.status_code = status
+        return response
+    
+    def completion_body(model: str, content: str, finish_reason: str, prompt_chars: int) -> Dict[str, Any]:
+        return {
+            'id': f'gen-{uuid.uuid4().hex}',
+            'provider': 'RealiZe Stub',
+            'model': model,
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'choices': [{
+                'index': 0,
+                'finish_reason': finish_reason,
+                'message': {'role': 'assistant', 'content': content}
+            }],
+            'usage': {
+                'prompt_tokens': prompt_chars // 4,
+                'completion_tokens': len(content) // 4,
+                'total_tokens': (prompt_chars + len(content)) // 4
+            }
+        }
+    
+    def stream(model: str, content: str, finish_reason: str, delay: float):
+        generation_id = f'gen-{uuid.uuid4().hex}'
+        chunks = [content[i:i + chunk_chars] for i in range(0, len(content), chunk_chars)] or ['']
+        time.sleep(delay * first_token_fraction)
+        yield ': OPENROUTER PROCESSING\n\n'
+        for position, chunk in enumerate(chunks):
+            if position:
+                time.sleep(delay * (1 - first_token_fraction) / len(chunks))
+            yield 'data: ' + json.dumps({
+                'id': generation_id,
+                'object': 'chat.completion.chunk',
+                'created': int(time.time()),
+                'model': model,
+                'choices': [{
+                    'index': 0,
+                    'delta': {'role': 'assistant', 'content': chunk},
+                    'finish_reason': finish_reason if position == len(chunks) - 1 else None
+                }]
+            }) + '\n\n'
+        yield 'data: [DONE]\n\n'
+    
+    @stub.route('/api/v1/chat/completions', methods=['POST'])
+    def chat_completions():
+        if not request.headers.get('Authorization', '').startswith('Bearer '):
+            stats.add('status_401')
+            return error(401, 'No auth credentials found')
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict) or not isinstance(payload.get('messages'), list) or not payload['messages']:
+            stats.add('status_400')
+            return error(400, "'messages' must be a non-empty list")
+        
+        delay = draw(latency_model.sample, rng)
+        roll = draw(rng.random)
+        if roll < rate_429:
+            stats.add('status_429')
+            time.sleep(delay * first_token_fraction)
+            response = error(429, ERROR_MESSAGES[429])
+            response.headers['Retry-After'] = '1'
+            return response
+        if roll < rate_429 + rate_5xx:
+            status = draw(rng.choice, [500, 502, 503])
+            stats.add(f'status_{status}')
+            time.sleep(delay)
+            return error(status, ERROR_MESSAGES[status])
+        
+        key, content = answer_messages(payload['messages'], random.Random(draw(rng.random)))
+        stats.add(f'prompt_{key or "other"}')
+        
+        finish_reason = 'stop'
+        if draw(rng.random) < truncate_rate:
+            content = content[:draw(rng.randint, 1, max(len(content) * 9 // 10, 1))]
+            finish_reason = 'length'
+            stats.add('truncated')
+        
+        model = payload.get('model', 'stub')
+        stats.add('status_200')
+        if payload.get('stream'):
+            stats.add('streamed')
+            return Response(stream(model, content, finish_reason, delay), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache'})
+        time.sleep(delay)
+        prompt_chars = sum(len(str(message.get('content', ''))) for message in payload['messages'])
+        return jsonify(completion_body(model, content, finish_reason, prompt_chars))
+    
+    @stub.route('/stub/stats', methods=['GET'])
+    def stub_stats():
+        return jsonify(stats.snapshot())
+    
+    return stub
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local OpenRouter stand-in for load tests")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--latency', default='lognormal:800,0.5',
+                        help="constant:MS, uniform:MIN,MAX, normal:MEAN,STDDEV or lognormal:MEDIAN,SIGMA")
+    parser.add_argument('--rate-429', type=float, default=0.0, help="Share of requests answered 429")
+    parser.add_argument('--rate-5xx', type=float, default=0.0, help="Share of requests answered 500/502/503")
+    parser.add_argument('--truncate-rate', type=float, default=0.0, help="Share of answers cut off mid-JSON")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+    
+    stub = create_stub_app(args.latency, args.rate_429, args.rate_5xx, args.truncate_rate, args.seed)
+    print(f"OpenRouter stub on http://{args.host}:{args.port}/api/v1 "
+          f"(set OPENROUTER_BASE_URL to this URL and OPENROUTER_API_KEY to any value)")
+    stub.run(host=args.host, port=args.port, threaded=True)
+
+if __name__ == "__main__":
+    main()
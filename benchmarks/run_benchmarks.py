@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Pipeline benchmark suite for RealiZe
+Times every stage of resume analysis, writes JSON results and compares them with a stored baseline
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.corpus import CorpusGenerator
+from benchmarks.openrouter_stub import patch_service
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+
+# Bump when cases are added, renamed or their inputs change; older baselines are then not comparable
+SUITE_VERSION = "3"
+CORPUS_SEED = 7
+
+PAGE_COUNTS = (1, 5, 20)
+WORD_COUNTS = (300, 2000, 10000)
+
+def build_cases(workdir: str) -> List[Tuple[str, Callable[[], object]]]:
+    """Named zero-argument callables, one per measured operation"""
+    # The app reads its configuration at import time: keep every store in memory or in workdir
+    os.environ['OPENROUTER_API_KEY'] = 'benchmark'
+    os.environ['ANALYSIS_CACHE_PATH'] = ''
+    os.environ['RESUME_STORE_PATH'] = ''
+    os.environ['RESUME_INDEX_PATH'] = ''
+    os.environ['RATE_LIMIT_PER_MINUTE'] = '0'
+    
+    import app as app_module
+    from backend.models.skill_database import SkillDatabase
+    from backend.utils.pdf_processor import PDFProcessor
+    
+    cases = []
+    corpus = CorpusGenerator(CORPUS_SEED)
+    processor = PDFProcessor()
+    for pages in PAGE_COUNTS:
+        path = os.path.join(workdir, f'resume_{pages}p.pdf')
+        with open(path, 'wb') as f:
+            f.write(corpus.resume_pdf(0, pages=pages, words=pages * 500))
+        cases.append((f'pdf.extract_text[{pages}p]', lambda path=path: processor.extract_text(path)))
+    
+    analyzer = app_module.resume_analyzer
+    for words in WORD_COUNTS:
+        text = corpus.resume(0, words=words).text
+        cases.append((f'pdf._clean_text[{words}w]', lambda text=text: processor._clean_text(text)))
+        cases.append((f'analyzer._extract_basic_skills[{words}w]',
+                      lambda text=text: analyzer._extract_basic_skills(text)))
+        cases.append((f'analyzer._analyze_experience_indicators[{words}w]',
+                      lambda text=text: analyzer._analyze_experience_indicators(text)))
+    
+    database = SkillDatabase()
+    names = [record.name for record in database.get_records()]
+    cases.append(('skills.get_skill[all]', lambda: [database.get_skill(name) for name in names]))
+    cases.append(('skills.get_skill[lowercase]', lambda: [database.get_skill(name.lower()) for name in names]))
+    queries = ('py', 'java', 'cloud', 'sql', 'react', 'ops', 'data', 'test', 'go', 'net')
+    
+    def search_uncached():
+        database._index.search_cache.clear()
+        return [database.search_skills(query) for query in queries]
+    
+    cases.append(('skills.search_skills[10 queries]', search_uncached))
+    cases.append(('skills.get_skills_by_demand[high]', lambda: database.get_skills_by_demand('High')))
+    
+    patch_service(app_module.resume_analyzer.openrouter_service, CORPUS_SEED)
+    client = app_module.app.test_client()
+    pdf_bytes = corpus.resume_pdf(1, pages=2, words=1000)
+    
+    def analyze_request():
+        response = client.post('/api/analyze-resume', data={
+            'resume': (io.BytesIO(pdf_bytes), 'resume.pdf')
+        }, content_type='multipart/form-data')
+        if response.status_code != 200:
+            raise RuntimeError(f"/api/analyze-resume returned {response.status_code}: {response.get_data(as_text=True)}")
+        return response
+    
+    def analyze_cold():
+        app_module.resume_analyzer.result_cache.clear()
+        app_module.resume_store.uploads.clear()
+        return analyze_request()
+    
+    cases.append(('api.analyze_resume[cold]', analyze_cold))
+    cases.append(('api.analyze_resume[cached]', analyze_request))
+    return cases
+
+def measure(func: Callable[[], object], repeat: int, min_time: float) -> Dict[str, float]:
+    """
+    Time a callable after one warm-up call
+    
+    Each run loops the callable until it took at least min_time seconds, so
+    fast operations are not lost in timer resolution.
+    
+    Returns:
+        Median, min and mean milliseconds per call, and calls per run
+    """
+    func()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2
+    
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+    return {
+        'median_ms': round(statistics.median(samples) * 1000, 6),
+        'min_ms': round(min(samples) * 1000, 6),
+        'mean_ms': round(statistics.fmean(samples) * 1000, 6),
+        'loops': loops,
+        'runs': len(samples)
+    }
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float,
+            min_delta_ms: float) -> List[Tuple[str, float, float, float]]:
+    """
+    Cases whose median is slower than the baseline by more than the threshold
+    
+    Args:
+        threshold: Allowed slowdown as a fraction, e.g. 0.25 for +25%
+        min_delta_ms: Absolute slowdowns below this are treated as noise
+    
+    Returns:
+        (case, baseline ms, current ms, relative change) per regression
+    """
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        before, after = previous['median_ms'], result['median_ms']
+        change = (after - before) / before if before else 0.0
+        if change > threshold and after - before > min_delta_ms:
+            regressions.append((name, before, after, change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the resume analysis pipeline")
+    parser.add_argument('--output', help="Write results as JSON to this file ('-' for stdout)")
+    parser.add_argument('--baseline', help="Baseline results to compare with; must exist when given "
+                        f"(default {DEFAULT_BASELINE.name}, skipped when missing)")
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed slowdown against the baseline median, as a fraction (default 0.25)")
+    parser.add_argument('--min-delta-ms', type=float, default=0.05,
+                        help="Ignore slowdowns smaller than this many milliseconds")
+    parser.add_argument('--repeat', type=int, default=7, help="Timed runs per case")
+    parser.add_argument('--min-time', type=float, default=0.05, help="Minimum seconds per timed run")
+    parser.add_argument('--only', nargs='+', default=[], help="Only run cases whose name contains one of these")
+    args = parser.parse_args()
+    # A missing default baseline just skips the comparison; a missing explicit one is a setup error (e.g. in CI)
+    if args.baseline and not args.save_baseline and not os.path.exists(args.baseline):
+        parser.error(f"baseline {args.baseline} does not exist")
+    baseline_path = args.baseline or str(DEFAULT_BASELINE)
+    
+    import logging
+    logging.disable(logging.CRITICAL)
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        cases = build_cases(workdir)
+        if args.only:
+            cases = [(name, func) for name, func in cases if any(part in name for part in args.only)]
+        
+        results = {}
+        print(f"{'case':<48} {'median ms':>11} {'min ms':>11} {'loops':>7}", file=sys.stderr)
+        for name, func in cases:
+            results[name] = measure(func, args.repeat, args.min_time)
+            print(f"{name:<48} {results[name]['median_ms']:>11.4f} {results[name]['min_ms']:>11.4f} "
+                  f"{results[name]['loops']:>7}", file=sys.stderr)
+    
+    report = {
+        'meta': {
+            'suite_version': SUITE_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'repeat': args.repeat,
+            'min_time': args.min_time
+        },
+        'results': results
+    }
+    if args.output == '-':
+        print(json.dumps(report, indent=2))
+    elif args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    
+    if args.save_baseline:
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {baseline_path}", file=sys.stderr)
+        return 0
+    
+    if not os.path.exists(baseline_path):
+        print(f"No baseline at {baseline_path}; run with --save-baseline to create one", file=sys.stderr)
+        return 0
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('meta', {}).get('suite_version') != SUITE_VERSION:
+        print("Baseline was recorded by another suite version; not comparing", file=sys.stderr)
+        return 0
+    
+    regressions = compare(results, baseline.get('results', {}), args.threshold, args.min_delta_ms)
+    for name, before, after, change in regressions:
+        print(f"REGRESSION {name}: {before:.4f} ms -> {after:.4f} ms ({change:+.0%})", file=sys.stderr)
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} against {baseline_path}", file=sys.stderr)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
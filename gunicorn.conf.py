@@ -0,0 +1,49 @@
+"""
+Gunicorn configuration for RealiZe
+Preloads and warms the app in the master, then forks workers that share it copy-on-write
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+
+Run with: gunicorn -c gunicorn.conf.py
+"""
+
+import gc
+import multiprocessing
+import os
+
+wsgi_app = 'wsgi:application'
+bind = os.environ.get('GUNICORN_BIND', f"0.0.0.0:{os.environ.get('PORT', 8000)}")
+
+# Requests spend most of their time waiting on OpenRouter, so each worker
+# serves several of them on threads
+workers = int(os.environ.get('WEB_CONCURRENCY') or multiprocessing.cpu_count() + 1)
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS') or 4)
+
+# The preloaded app sizes its admission gate from these (default_gate_sizes)
+os.environ['WEB_CONCURRENCY'] = str(workers)
+os.environ['GUNICORN_THREADS'] = str(threads)
+
+# Load (and warm up) the app once in the master instead of in every worker
+preload_app = True
+
+# An analysis makes up to three sequential LLM calls with a 30 s timeout each
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Recycle workers now and then to bound slow memory growth; jitter avoids
+# every worker restarting at once
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+loglevel = os.environ.get('LOG_LEVEL', 'info').lower()
+
+def pre_fork(server, worker):
+    # Move everything the preloaded app built into the permanent generation:
+    # the cycle collector then never writes to those objects, so their pages
+    # stay shared between workers instead of being copied on first collection
+    gc.freeze()
+
+def post_fork(server, worker):
+    server.log.info(f"Worker {worker.pid} forked with {threads} threads")
@@ -58,8 +58,7 @@ class AnalysisManager {
                     'Content-Type': 'application/json'
                 },
                 body: JSON.stringify({
-                    resume_text: this.extractResumeText(),
-                    skills_analysis: this.currentAnalysis.skills_analysis || {}
+                    resume_id: this.getResumeId()
                 })
             });
             
@@ -274,13 +273,10 @@ class AnalysisManager {
     }
     
     /**
-     * Extract text from current analysis
+     * Get the server-side resume id of the current analysis
      */
-    extractResumeText() {
-        if (!this.currentAnalysis || !this.currentAnalysis.basic_info) {
-            return '';
-        }
-        return this.currentAnalysis.basic_info.text_content || '';
+    getResumeId() {
+        return this.currentAnalysis?.resume_id || null;
     }
     
     /**
@@ -401,7 +397,7 @@ class JobComparisonManager {
                     'Content-Type': 'application/json'
                 },
                 body: JSON.stringify({
-                    resume_text: this.extractResumeText(),
+                    resume_id: this.getResumeId(),
                     job_description: jobDescription
                 })
             });
@@ -542,11 +538,10 @@ class JobComparisonManager {
     }
     
     /**
-     * Extract resume text from current analysis
+     * Get the server-side resume id of the current analysis
      */
-    extractResumeText() {
-        // This would get the text from the current analysis
-        return AppState.analysisResults?.basic_info?.text_content || '';
+    getResumeId() {
+        return AppState.analysisResults?.resume_id || null;
     }
     
     /**
@@ -351,7 +351,7 @@ async function performJobComparison(jobDescription) {
                 'Content-Type': 'application/json'
             },
             body: JSON.stringify({
-                resume_text: extractTextFromAnalysis(AppState.analysisResults),
+                resume_id: AppState.analysisResults?.resume_id,
                 job_description: jobDescription
             })
         });
@@ -366,14 +366,6 @@ async function performJobComparison(jobDescription) {
     }
 }
 
-/**
- * Extract text from analysis results for comparison
- */
-function extractTextFromAnalysis(analysis) {
-    // This would be implemented based on the actual analysis structure
-    return analysis?.basic_info?.text_content || '';
-}
-
 /**
  * Show loading state
  */
@@ -15,6 +15,9 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Every test request comes from one address; rate limiting is tested on its own controller
+os.environ.setdefault('RATE_LIMIT_PER_MINUTE', '0')
+
 def test_imports():
     """Test if all required modules can be imported"""
     print("🧪 Testing imports...")
@@ -98,6 +101,15 @@ def test_skills_database():
             print("❌ No programming languages in database")
             return False
         
+        python = skill_db.get_skill('python')
+        if python is None or python.demand != 'High' or python not in skill_db.search_skills('PYTH'):
+            print("❌ Indexed skill lookups failed")
+            return False
+        if not isinstance(skill_db.get_skills_by_category('programming_languages'), tuple):
+            print("❌ Category lookup returned a mutable list")
+            return False
+        print("✅ Indexed lookups return immutable skill records")
+        
         return True
         
     except Exception as e:
@@ -228,6 +240,1267 @@ def test_pdf_processor():
         print(f"❌ PDF processor test failed: {e}")
         return False
 
+def test_analysis_cache():
+    """Test that repeated analyses are served from the result cache"""
+    print("\n🧪 Testing analysis result cache...")
+    
+    try:
+        import tempfile
+        import time
+        from backend.services.analyzer import ResumeAnalyzer
+        from backend.utils.cache import TieredCache
+        
+        os.environ.pop('OPENROUTER_API_KEY', None)
+        cache_path = os.path.join(tempfile.mkdtemp(), 'cache.db')
+        analyzer = ResumeAnalyzer()
+        analyzer.result_cache = TieredCache(analyzer.cache_fingerprint(), path=cache_path)
+        
+        resume_text = "Senior Python developer with 6 years of experience in Django and React."
+        first = analyzer.analyze(resume_text)
+        second = analyzer.analyze("  Senior Python developer with 6 years\nof experience in Django and React. ")
+        
+        if first.get('cached') is False and second.get('cached') is True:
+            print("✅ Normalized resume text served from memory cache")
+        else:
+            print("❌ Second analysis was not served from cache")
+            return False
+        
+        # A fresh memory tier must fall back to the durable tier
+        analyzer.result_cache = TieredCache(analyzer.cache_fingerprint(), path=cache_path)
+        if analyzer.analyze(resume_text).get('cached') is True:
+            print("✅ Result served from durable cache tier")
+        else:
+            print("❌ Durable cache tier missed")
+            return False
+        
+        # Changing the skill keywords must invalidate old entries
+        analyzer.skill_keywords['programming_languages']['Elixir'] = [r'\belixir\b']
+        analyzer.result_cache = TieredCache(analyzer.cache_fingerprint(), path=cache_path)
+        if analyzer.analyze(resume_text).get('cached') is False:
+            print("✅ Cache invalidated when skill keywords change")
+        else:
+            print("❌ Stale cache entry served after keyword change")
+            return False
+        
+        # So must editing the user message sent with a prompt
+        from backend.services import openrouter_service
+        fingerprint = analyzer.cache_fingerprint()
+        template = openrouter_service.USER_TEMPLATES['ai_summary']
+        openrouter_service.USER_TEMPLATES['ai_summary'] = 'CV:\n{resume_text}\n\nSKILLS:\n{skills_analysis}'
+        try:
+            changed = analyzer.cache_fingerprint() != fingerprint
+        finally:
+            openrouter_service.USER_TEMPLATES['ai_summary'] = template
+        if changed:
+            print("✅ Cache invalidated when a user message template changes")
+        else:
+            print("❌ User message templates are not part of the cache fingerprint")
+            return False
+        
+        # The durable tier keeps at most max_rows entries, none older than max_age
+        bounded = TieredCache('retention', path=os.path.join(tempfile.mkdtemp(), 'bounded.db'),
+                              max_rows=2, max_age=3600)
+        for key in ('a', 'b', 'c'):
+            bounded.set(key, {'key': key})
+        bounded.durable._conn.execute(
+            f"UPDATE {bounded.durable.table} SET written_at = written_at - 7200 WHERE key = 'b'")
+        bounded.durable._conn.commit()
+        bounded.memory.clear()
+        kept = [key for key in 'abc' if bounded.get(key) is not None]
+        pruned = bounded.durable.prune()
+        if kept == ['c'] and pruned == 1 and len(bounded.durable) == 1:
+            print("✅ Durable cache bounded by row count and age")
+        else:
+            print(f"❌ Durable cache retention not applied: kept {kept}, pruned {pruned}")
+            return False
+        
+        memory = TieredCache('retention', max_age=3600)
+        memory.memory.set('old', {'key': 'old'}, written_at=time.time() - 7200)
+        if memory.get('old') is None:
+            print("✅ Expired entries not served from memory")
+        else:
+            print("❌ Memory tier served an expired entry")
+            return False
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Analysis cache test failed: {e}")
+        return False
+
+def test_resume_handles():
+    """Test that follow-up endpoints accept a stored resume id"""
+    print("\n🧪 Testing resume handle API...")
+    
+    try:
+        from app import app, resume_analyzer, resume_store
+        
+        resume_text = "Python developer with 3 years of experience building Flask and React applications."
+        analysis = resume_analyzer.analyze(resume_text)
+        resume_id = resume_store.save(resume_text, analysis)
+        
+        if resume_store.get(resume_id)['text'] == resume_text:
+            print("✅ Resume stored server-side")
+        else:
+            print("❌ Stored resume text does not round-trip")
+            return False
+        
+        client = app.test_client()
+        response = client.post('/api/compare-job', json={
+            'resume_id': resume_id,
+            'job_description': 'Looking for a Python engineer with Flask experience.'
+        })
+        if response.status_code == 200 and response.get_json().get('success'):
+            print("✅ Job comparison works with resume_id")
+        else:
+            print(f"❌ Job comparison with resume_id returned {response.status_code}")
+            return False
+        
+        response = client.post('/api/career-suggestions', json={'resume_id': 'unknown'})
+        if response.status_code == 404:
+            print("✅ Unknown resume_id rejected")
+        else:
+            print(f"❌ Unknown resume_id returned {response.status_code}")
+            return False
+        
+        statuses = [client.post('/api/career-suggestions', json={'resume_id': resume_id}).status_code
+                    for resume_id in (None, '')]
+        if statuses == [400, 400]:
+            print("✅ Empty resume_id without resume_text rejected")
+        else:
+            print(f"❌ Empty resume_id without resume_text returned {statuses}")
+            return False
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Resume handle test failed: {e}")
+        return False
+
+def test_batch_job_comparison():
+    """Test one-resume-vs-many-jobs comparison"""
+    print("\n🧪 Testing batch job comparison...")
+    
+    try:
+        from backend.services.analyzer import ResumeAnalyzer
+        
+        analyzer = ResumeAnalyzer()
+        resume_text = "Backend engineer skilled in Python, Django and Flask with some Java."
+        jobs = [
+            "We need a Rust and C++ systems programmer.",
+            "Looking for a Python developer with Django and Flask experience.",
+            "Frontend role using React and TypeScript."
+        ]
+        
+        result = analyzer.compare_with_jobs(resume_text, jobs, top_k=1)
+        ranked = result.get('results', [])
+        
+        if len(ranked) == 3 and ranked[0]['job_index'] == 1 and ranked[0]['skill_coverage'] == 100.0:
+            print("✅ Best matching job ranked first")
+        else:
+            print("❌ Unexpected job ranking")
+            return False
+        
+        if ranked[0]['detailed_comparison'] is not None and ranked[1]['detailed_comparison'] is None:
+            print("✅ Only top-K jobs sent for detailed comparison")
+        else:
+            print("❌ Detailed comparison not limited to top-K")
+            return False
+        
+        import app as app_module
+        response = app_module.app.test_client().post('/api/compare-jobs', json={
+            'resume_text': resume_text, 'job_descriptions': jobs,
+            'top_k': app_module.app.config['MAX_DETAILED_COMPARISONS'] + 1})
+        if response.status_code == 400:
+            print("✅ top_k above MAX_DETAILED_COMPARISONS rejected")
+        else:
+            print(f"❌ Oversized top_k returned {response.status_code}")
+            return False
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Batch job comparison test failed: {e}")
+        return False
+
+def test_candidate_ranking():
+    """Test ranking many resumes against one job description"""
+    print("\n🧪 Testing candidate ranking...")
+    
+    try:
+        import tempfile
+        import time
+        from backend.services.analyzer import ResumeAnalyzer
+        from backend.services.ranking import CandidateRanker
+        from backend.services.resume_store import ResumeStore
+        
+        analyzer = ResumeAnalyzer()
+        ranker = CandidateRanker(analyzer, initial_capacity=2)
+        resumes = {
+            'java': "Java developer using Spring.",
+            'python': "Python engineer building Django and Flask services.",
+            'partial': "Python scripting experience."
+        }
+        for resume_id, text in resumes.items():
+            ranker.add_resume(resume_id, analyzer.extract_resume_features(text)['basic_skills'])
+        
+        job = "Python developer with Django and Flask."
+        first_page = ranker.rank(job, page=1, page_size=2)
+        order = [candidate['resume_id'] for candidate in first_page['candidates']]
+        if order == ['python', 'partial'] and first_page['total_pages'] == 2:
+            print("✅ Candidates ranked and paginated")
+        else:
+            print(f"❌ Unexpected ranking: {order}")
+            return False
+        
+        # LLM reviews go to the overall top candidates, not the head of every page
+        reviewed = []
+        analyzer._detailed_job_comparison = lambda text, job: reviewed.append(text) or {'match_score': 0}
+        first_page = ranker.rank(job, page=1, page_size=2, llm_review_top=1, text_lookup=resumes.get)
+        second_page = ranker.rank(job, page=2, page_size=2, llm_review_top=1, text_lookup=resumes.get)
+        if (reviewed == [resumes['python']] and first_page['candidates'][0]['llm_review']
+                and second_page['candidates'][0]['llm_review'] is None):
+            print("✅ Only the overall top candidates reviewed")
+        else:
+            print(f"❌ Reviewed {len(reviewed)} candidates across pages")
+            return False
+        
+        from app import app
+        response = app.test_client().post('/api/rank-candidates', json={'job_description': job, 'llm_review_top': -1})
+        if response.status_code == 400:
+            print("✅ Negative llm_review_top rejected")
+        else:
+            print(f"❌ Negative llm_review_top returned {response.status_code}")
+            return False
+        
+        # Resumes saved to a durable store are vectorized once, by the sync
+        for path in (os.path.join(tempfile.mkdtemp(), 'resumes.db'), ''):
+            store = ResumeStore(path=path)
+            pool = CandidateRanker(analyzer)
+            added = []
+            add_resume = pool.add_resume
+            pool.add_resume = lambda resume_id, skills: added.append(resume_id) or add_resume(resume_id, skills)
+            stored = {}
+            for text in resumes.values():
+                features = analyzer.extract_resume_features(text)
+                stored[store.save(text, features)] = features['basic_skills']
+            pool.add_stored(store, stored)
+            if sorted(added) != sorted(stored) or len(pool) != 3:
+                print(f"❌ Stored resumes added {len(added)} times (durable: {store.durable})")
+                return False
+        print("✅ Stored resumes added to the pool once")
+        
+        # Scale check: tens of thousands of precomputed vectors
+        vector_skills = {'programming_languages': [{'name': 'Python'}], 'frameworks': [{'name': 'Django'}]}
+        for i in range(20000):
+            ranker.add_resume(f'bulk-{i}', vector_skills if i % 3 else {})
+        start = time.perf_counter()
+        ranker.rank(job, page=3, page_size=50)
+        elapsed = time.perf_counter() - start
+        if elapsed < 1.0:
+            print(f"✅ Ranked {len(ranker)} candidates in {elapsed * 1000:.1f}ms")
+        else:
+            print(f"❌ Ranking took {elapsed:.2f}s")
+            return False
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Candidate ranking test failed: {e}")
+        return False
+
+def test_resume_search():
+    """Test boolean queries over the resume index"""
+    print("\n🧪 Testing resume search index...")
+    
+    try:
+        import tempfile
+        from backend.services.resume_index import ResumeIndex, QuerySyntaxError
+        
+        index_path = os.path.join(tempfile.mkdtemp(), 'index.jsonl')
+        index = ResumeIndex(index_path)
+        senior = {'estimated_level': 'Senior', 'years_pattern': 9}
+        junior = {'estimated_level': 'Junior', 'years_pattern': 1}
+        index.add_resume('a', {'programming_languages': [{'name': 'Go'}], 'frameworks': [{'name': 'React'}]}, senior)
+        index.add_resume('b', {'programming_languages': [{'name': 'Rust'}]}, junior)
+        index.add_resume('c', {'programming_languages': [{'name': 'Python'}]}, senior)
+        
+        hits = [doc['resume_id'] for doc in index.search('(go OR rust) AND level:senior')['results']]
+        if hits == ['a']:
+            print("✅ Boolean query with level filter")
+        else:
+            print(f"❌ Unexpected hits: {hits}")
+            return False
+        
+        hits = [doc['resume_id'] for doc in index.search('NOT go', min_years=5)['results']]
+        if hits == ['c']:
+            print("✅ NOT query with years filter")
+        else:
+            print(f"❌ Unexpected hits: {hits}")
+            return False
+        
+        # Re-indexing replaces old postings and survives a reload
+        index.add_resume('a', {'programming_languages': [{'name': 'Python'}]}, senior)
+        reloaded = ResumeIndex(index_path)
+        if reloaded.search('go')['total'] == 0 and reloaded.search('python')['total'] == 2:
+            print("✅ Incremental updates persisted to disk")
+        else:
+            print("❌ Reloaded index does not match")
+            return False
+        
+        try:
+            index.search('(go OR')
+            print("❌ Invalid query accepted")
+            return False
+        except QuerySyntaxError:
+            print("✅ Invalid query rejected")
+        
+        try:
+            index.search('(' * 5000 + 'go' + ')' * 5000)
+            print("❌ Deeply nested query accepted")
+            return False
+        except QuerySyntaxError:
+            print("✅ Deeply nested query rejected as a syntax error")
+        
+        # Unchanged re-uploads are not journaled; superseded lines are compacted away
+        index.COMPACT_MIN_SUPERSEDED = 5
+        for _ in range(20):
+            index.add_resume('c', {'programming_languages': [{'name': 'Python'}]}, senior)
+        for years in range(20):
+            index.add_resume('b', {'programming_languages': [{'name': 'Rust'}]}, {'estimated_level': 'Junior', 'years_pattern': years})
+        with open(index_path, encoding='utf-8') as f:
+            lines = sum(1 for _ in f)
+        if lines <= 2 * index.COMPACT_MIN_SUPERSEDED and ResumeIndex(index_path).search('rust')['results'][0]['years'] == 19:
+            print(f"✅ Journal stays bounded ({lines} lines)")
+        else:
+            print(f"❌ Journal grew to {lines} lines")
+            return False
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Resume search test failed: {e}")
+        return False
+
+def test_shared_worker_state():
+    """Test that workers sharing the store and journal see each other's resumes"""
+    print("\n🧪 Testing state shared between workers...")
+    
+    try:
+        import tempfile
+        from backend.services.analyzer import ResumeAnalyzer
+        from backend.services.ranking import CandidateRanker
+        from backend.services.resume_index import ResumeIndex
+        from backend.services.resume_store import ResumeStore
+        
+        directory = tempfile.mkdtemp()
+        # Two of each, as two forked workers would have
+        indexes = [ResumeIndex(os.path.join(directory, 'index.jsonl')) for _ in range(2)]
+        skills = {'programming_languages': [{'name': 'Go'}]}
+        indexes[0].add_resume('a', skills, {'estimated_level': 'Senior'})
+        if indexes[1].search('go')['total'] != 1:
+            print("❌ Search index missed another worker's resume")
+            return False
+        indexes[1].add_resume('b', skills, {'estimated_level': 'Junior'})
+        indexes[1].compact()
+        indexes[0].add_resume('c', {'programming_languages': [{'name': 'Rust'}]}, {'estimated_level': 'Junior'})
+        if indexes[0].search('go')['total'] != 2 or indexes[1].search('go OR rust')['total'] != 3:
+            print("❌ Search indexes diverged after a compaction")
+            return False
+        print("✅ Search index replays other workers' journal lines")
+        
+        os.environ.pop('OPENROUTER_API_KEY', None)
+        analyzer = ResumeAnalyzer()
+        stores = [ResumeStore(path=os.path.join(directory, 'store.db')) for _ in range(2)]
+        rankers = [CandidateRanker(analyzer) for _ in range(2)]
+        text = "Python developer with Django and PostgreSQL."
+        resume_id = stores[0].save(text, analyzer.extract_resume_features(text))
+        rankers[0].add_resume(resume_id, stores[0].get(resume_id)['basic_skills'])
+        added = rankers[1].sync_from(stores[1])
+        if added != 1 or len(rankers[1]) != 1 or rankers[1].sync_from(stores[1]) != 0:
+            print("❌ Candidate pool did not catch up with the shared store")
+            return False
+        print("✅ Candidate pool catches up with resumes stored by other workers")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Shared worker state test failed: {e}")
+        return False
+
+def test_local_job_matching():
+    """Test the local BM25 / skill-weighted job match scorer"""
+    print("\n🧪 Testing local job match scorer...")
+    
+    try:
+        from backend.services.analyzer import ResumeAnalyzer
+        
+        os.environ.pop('OPENROUTER_API_KEY', None)
+        analyzer = ResumeAnalyzer()
+        job = "Backend engineer: Python, Django, PostgreSQL and REST API design. 5+ years of experience."
+        good = analyzer.compare_with_job(
+            "Python and Django backend engineer, 6 years of experience designing REST API services on PostgreSQL.", job)
+        poor = analyzer.compare_with_job(
+            "Graphic designer focused on branding, illustration and print layouts.", job)
+        
+        if good['match_score'] > poor['match_score'] and good['match_score'] >= 50:
+            print(f"✅ Local match scores differentiate ({good['match_score']} vs {poor['match_score']})")
+        else:
+            print(f"❌ Local scores do not differentiate ({good['match_score']} vs {poor['match_score']})")
+            return False
+        
+        alignment = poor['additional_metrics']['experience_alignment']
+        if alignment['alignment_score'] != 75 and '5+ years of experience' in alignment['gaps']:
+            print("✅ Experience alignment computed from the texts")
+        else:
+            print("❌ Experience alignment still a placeholder")
+            return False
+        
+        resume = "Python and Django backend engineer with REST API experience."
+        first = analyzer.compare_with_job(resume, job)['match_score']
+        for i in range(20):
+            analyzer.extract_resume_features(f"Python developer number {i} with Django and PostgreSQL.")
+        if analyzer.compare_with_job(resume, job)['match_score'] == first:
+            print("✅ Scores do not drift with the requests a process has seen")
+        else:
+            print("❌ Local match score changed after unrelated requests")
+            return False
+        
+        import tempfile
+        from backend.services.matching import CorpusStats, JobMatchScorer
+        records = [{'resume_id': 'a', 'text': 'Python Django'}, {'resume_id': 'a', 'text': 'Python Django'},
+                   {'resume_id': 'b', 'text': 'Graphic design'}]
+        corpus = CorpusStats.from_records(records)
+        path = os.path.join(tempfile.mkdtemp(), 'corpus.json')
+        corpus.save(path)
+        loaded = CorpusStats.load(path)
+        scorer = JobMatchScorer(corpus=loaded)
+        if (corpus.document_count == 2 and loaded.version == corpus.version
+                and scorer.idf('python') < scorer.idf('kubernetes')):
+            print("✅ Corpus snapshot counts each resume once and round-trips")
+        else:
+            print("❌ Corpus snapshot statistics wrong")
+            return False
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Local job matching test failed: {e}")
+        return False
+
+def test_analysis_context():
+    """Test that the shared analysis context matches per-pass extraction"""
+    print("\n🧪 Testing shared analysis context...")
+    
+    try:
+        import hashlib
+        import re
+        from backend.services.analyzer import normalize_resume_text, update_normalized_digest
+        from backend.utils.analysis_context import AnalysisContext
+        
+        text = "Senior Python developer.\n  Python, Django and node.js;  7 years of experience."
+        context = AnalysisContext(text)
+        for word in ('python', 'django', 'years', 'node'):
+            if context.count_word(word) != len(re.findall(rf'\b{word}\b', text.lower())):
+                print(f"❌ Token count differs for '{word}'")
+                return False
+        if context.word_count != len(text.split()):
+            print("❌ Word count differs from str.split()")
+            return False
+        print("✅ Context token counts match regex scans")
+        
+        digest = hashlib.sha256()
+        update_normalized_digest(digest, text)
+        if digest.hexdigest() != hashlib.sha256(normalize_resume_text(text).encode('utf-8')).hexdigest():
+            print("❌ Streaming digest differs from normalized text hash")
+            return False
+        print("✅ Streaming digest matches normalized text hash")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Analysis context test failed: {e}")
+        return False
+
+def test_section_segmentation():
+    """Test resume section spans and section-restricted passes"""
+    print("\n🧪 Testing section segmentation...")
+    
+    try:
+        from backend.services.analyzer import ResumeAnalyzer
+        from backend.utils.analysis_context import AnalysisContext
+        
+        text = ("Taylor Swift Backend Engineer SUMMARY Python developer with 6 years of experience. "
+                "Work Experience: Built Django services. INTERESTS Ruby the cat, Go tournaments")
+        context = AnalysisContext(text)
+        names = [span.name for span in context.sections]
+        if names != ['header', 'summary', 'experience', 'interests']:
+            print(f"❌ Unexpected section spans: {names}")
+            return False
+        if not text[context.sections[1].start:context.sections[1].end].startswith('SUMMARY'):
+            print("❌ Section offsets do not point at the heading")
+            return False
+        print(f"✅ Sections segmented: {names}")
+        
+        os.environ.pop('OPENROUTER_API_KEY', None)
+        analyzer = ResumeAnalyzer()
+        features = analyzer.extract_resume_features(text)
+        languages = [skill['name'] for skill in features['basic_skills']['programming_languages']]
+        if languages != ['Python']:
+            print(f"❌ Skills read outside the relevant sections: {languages}")
+            return False
+        prompt = analyzer.prompt_text(context, 'job_comparison')
+        if 'Taylor' in prompt or 'Ruby' in prompt or 'Django' not in prompt:
+            print("❌ Prompt text not restricted to relevant sections")
+            return False
+        print("✅ Skill matcher and prompt builder use section slices")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Section segmentation test failed: {e}")
+        return False
+
+def test_experience_scanner():
+    """Test word-bounded experience indicators and employment date ranges"""
+    print("\n🧪 Testing experience scanner...")
+    
+    try:
+        from datetime import date
+        from backend.services.experience_scanner import scan_experience
+        
+        scan = scan_experience("showed leadership despite misleading specs", date(2025, 1, 1))
+        if scan.term_counts()['senior'] or scan.term_counts()['leadership']:
+            print("❌ 'lead' matched inside other words")
+            return False
+        print("✅ Indicator terms respect word boundaries")
+        
+        scan = scan_experience("acme jan 2018 - dec 2019. beta 06/2019 to present. 3 years with go", date(2024, 12, 31))
+        if scan.employment_years() != 7.0 or scan.claimed_years() != 3:
+            print(f"❌ Unexpected years: {scan.employment_years()} / {scan.claimed_years()}")
+            return False
+        print("✅ Overlapping employment ranges merged into total years")
+        
+        scan = scan_experience("bsc 2012 2016. acme 2018 dec 2019", date(2024, 12, 31))
+        if scan.employment_years() != 2.0:
+            print(f"❌ Bare years read as a range: {scan.employment_years()}")
+            return False
+        print("✅ Two bare years need an explicit separator")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Experience scanner test failed: {e}")
+        return False
+
+def test_skill_search():
+    """Test trie autocomplete and typo-tolerant skill search"""
+    print("\n🧪 Testing skill search...")
+    
+    try:
+        from backend.models.skill_database import SkillDatabase
+        
+        db = SkillDatabase()
+        names = [record.name for record in db.autocomplete('kube', 5)]
+        if not names or names[0] != 'Kubernetes':
+            print(f"❌ Unexpected autocomplete results: {names}")
+            return False
+        print("✅ Prefix autocomplete ranks exact word starts")
+        
+        suggestions = db.suggest('kubernets', 3)
+        if not suggestions or suggestions[0]['name'] != 'Kubernetes' or suggestions[0]['match'] != 'fuzzy':
+            print(f"❌ Misspelled query not matched: {suggestions}")
+            return False
+        if db.suggest('xyzzy'):
+            print("❌ Unrelated query returned suggestions")
+            return False
+        print("✅ Fuzzy search tolerates typos")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Skill search test failed: {e}")
+        return False
+
+def test_skill_aliases():
+    """Test skill alias canonicalization across extractors and comparators"""
+    print("\n🧪 Testing skill alias canonicalization...")
+    
+    try:
+        from backend.models.skill_aliases import SKILL_CANONICALIZER
+        from backend.models.skill_database import SkillDatabase
+        from backend.services.analyzer import ResumeAnalyzer
+        
+        if SKILL_CANONICALIZER.canonical_id('Vue') != SKILL_CANONICALIZER.canonical_id('vue.js'):
+            print("❌ Aliases resolve to different ids")
+            return False
+        if SkillDatabase().get_skill('Azure').name != 'Microsoft Azure':
+            print("❌ Database lookup ignores aliases")
+            return False
+        print("✅ Aliases resolve to one canonical skill")
+        
+        os.environ.pop('OPENROUTER_API_KEY', None)
+        analyzer = ResumeAnalyzer()
+        resume_skills = analyzer._extract_basic_skills("Built SPAs with Vue and Express")
+        job_skills = {'frameworks': [{'name': 'Vue.js'}, {'name': 'Express.js'}]}
+        density = analyzer._calculate_keyword_density(resume_skills, job_skills)
+        if density != 100:
+            print(f"❌ Alias names not matched (density {density})")
+            return False
+        print("✅ Keyword density compares canonical ids")
+        
+        registered = len(SKILL_CANONICALIZER)
+        skills = SKILL_CANONICALIZER.canonicalize_skills({'frameworks': [{'name': 'Vue'}, {'name': 'Zorbflux 3'}]})
+        names = [skill['name'] for skill in skills['frameworks']]
+        if len(SKILL_CANONICALIZER) != registered or names != ['Vue.js', 'Zorbflux 3']:
+            print(f"❌ Unknown LLM skill names registered or renamed: {names}")
+            return False
+        print("✅ Unknown skill names passed through without being registered")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Skill alias test failed: {e}")
+        return False
+
+def test_skill_taxonomy():
+    """Test SQLite taxonomy files, validation and hot reload"""
+    print("\n🧪 Testing skill taxonomy reload...")
+    
+    try:
+        import tempfile
+        from backend.models.skill_database import SkillDatabase
+        from backend.models.skill_taxonomy import TaxonomyError, save_taxonomy
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'skills.db')
+            data = {'tools': {'name': 'Tools', 'skills': [{'name': 'Git', 'category': 'VCS', 'demand': 'High'}]}}
+            save_taxonomy(data, path)
+            
+            db = SkillDatabase(path=path, reload_interval=0)
+            loaded_eagerly = db.version != 0
+            if loaded_eagerly or len(db) != 1 or db.version != 1:
+                print("❌ Taxonomy not loaded lazily from SQLite")
+                return False
+            print("✅ SQLite taxonomy loaded on first use")
+            
+            data['tools']['skills'].append({'name': 'Terraform', 'category': 'IaC', 'demand': 'Medium'})
+            save_taxonomy(data, path)
+            if not db.reload() or db.get_skill('terraform') is None or db.version != 2:
+                print("❌ Reload did not swap in the new taxonomy")
+                return False
+            
+            try:
+                save_taxonomy({'tools': {'name': 'Tools', 'skills': [{'name': 'Git', 'demand': 'Always'}]}}, path)
+                print("❌ Invalid taxonomy was accepted")
+                return False
+            except TaxonomyError:
+                pass
+            
+            import sqlite3
+            conn = sqlite3.connect(path)
+            conn.execute('UPDATE taxonomy_skills SET group_position = 99')
+            conn.commit()
+            conn.close()
+            if db.reload() or db.get_skill('terraform') is None:
+                print("❌ Corrupt SQLite taxonomy replaced the previous snapshot")
+                return False
+            print("✅ Reload swaps indexes and invalid taxonomies are rejected")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Skill taxonomy test failed: {e}")
+        return False
+
+def test_skills_database_response():
+    """Test the pre-serialized, ETag'd skills database endpoint"""
+    print("\n🧪 Testing cached skills database response...")
+    
+    try:
+        from app import app
+        
+        client = app.test_client()
+        response = client.get('/api/skills-database', headers={'Accept-Encoding': 'gzip'})
+        etag = response.headers.get('ETag')
+        if response.status_code != 200 or response.headers.get('Content-Encoding') != 'gzip' or not etag:
+            print("❌ Compressed response with ETag not served")
+            return False
+        print("✅ Compressed skills database served with an ETag")
+        
+        response = client.get('/api/skills-database', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        if response.status_code != 304 or response.data:
+            print(f"❌ Conditional request returned {response.status_code}")
+            return False
+        print("✅ Unchanged taxonomy answered with 304 Not Modified")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Skills database response test failed: {e}")
+        return False
+
+def test_learning_paths():
+    """Test the learning-path graph and bitset gap computation"""
+    print("\n🧪 Testing learning path gaps...")
+    
+    try:
+        from backend.models.skill_database import SkillDatabase
+        
+        db = SkillDatabase()
+        gaps = db.get_learning_gaps({'tools': [{'name': 'K8s'}]}, roles=['devops_engineer'])['devops_engineer']
+        missing = [gap['skill'] for gap in gaps['gaps']]
+        if 'Docker' in missing or 'Linux' in missing or missing[0] != 'Git':
+            print(f"❌ Unexpected devops gaps: {missing}")
+            return False
+        print("✅ Known skills imply their prerequisites; gaps in learning order")
+        
+        jenkins = next(gap for gap in gaps['gaps'] if gap['skill'] == 'Jenkins')
+        priorities = db.learning_graph.learning_priorities(db.learning_graph.known_mask(['Python']))
+        if jenkins['missing_prerequisites'] != ['Git'] or not priorities or priorities[0]['area'] == 'Python':
+            print("❌ Prerequisites or learning priorities not computed")
+            return False
+        print("✅ Learning priorities ranked across roles")
+        
+        path = db.get_learning_path('DevOps Engineer')
+        path['essential'].append('COBOL')
+        if 'COBOL' in db.get_learning_path('devops_engineer')['essential']:
+            print("❌ Mutating a learning path changed the shared role paths")
+            return False
+        print("✅ Learning paths returned as copies")
+        
+        from app import app
+        client = app.test_client()
+        statuses = [client.post('/api/learning-gaps', json={'skills_analysis': value}).status_code
+                    for value in (['Python'], 'Python', {'tools': [{'name': 'Git'}]})]
+        statuses.append(client.post('/api/learning-gaps', json={'resume_id': None}).status_code)
+        if statuses != [400, 400, 200, 400]:
+            print(f"❌ skills_analysis not validated: {statuses}")
+            return False
+        print("✅ Non-object skills_analysis rejected with 400")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Learning path test failed: {e}")
+        return False
+
+def test_openrouter_stub():
+    """Test the local OpenRouter stand-in and the base URL override"""
+    print("\n🧪 Testing OpenRouter stub server...")
+    
+    try:
+        from benchmarks.openrouter_stub import create_stub_app
+        from backend.services.openrouter_service import OpenRouterService, SKILL_ANALYSIS_PROMPT
+        
+        request_body = {'model': 'stub', 'messages': [
+            {'role': 'system', 'content': SKILL_ANALYSIS_PROMPT},
+            {'role': 'user', 'content': 'Python developer using Docker and AWS'}
+        ]}
+        headers = {'Authorization': 'Bearer test'}
+        client = create_stub_app(seed=1).test_client()
+        response = client.post('/api/v1/chat/completions', json=request_body, headers=headers)
+        content = json.loads(response.get_json()['choices'][0]['message']['content'])
+        if [skill['name'] for skill in content['programming_languages']] != ['Python'] or 'tools' not in content:
+            print(f"❌ Unexpected skill analysis answer: {content}")
+            return False
+        
+        streamed = client.post('/api/v1/chat/completions', json=dict(request_body, stream=True), headers=headers)
+        chunks = [json.loads(line[6:]) for line in streamed.get_data(as_text=True).splitlines()
+                  if line.startswith('data: {')]
+        streamed_content = json.loads(''.join(chunk['choices'][0]['delta']['content'] for chunk in chunks))
+        if streamed_content.keys() != content.keys() or chunks[-1]['choices'][0]['finish_reason'] != 'stop':
+            print("❌ Streamed answer is incomplete")
+            return False
+        print("✅ Schema-valid answers, complete and streamed")
+        
+        failing = create_stub_app(rate_429=1.0).test_client()
+        response = failing.post('/api/v1/chat/completions', json=request_body, headers=headers)
+        truncated = create_stub_app(truncate_rate=1.0, seed=1).test_client()
+        choice = truncated.post('/api/v1/chat/completions', json=request_body, headers=headers).get_json()['choices'][0]
+        if response.status_code != 429 or 'Retry-After' not in response.headers or choice['finish_reason'] != 'length':
+            print("❌ Failure or truncation injection not applied")
+            return False
+        print("✅ Rate limiting and truncation injected")
+        
+        os.environ['OPENROUTER_BASE_URL'] = 'http://127.0.0.1:8099/api/v1/'
+        try:
+            service = OpenRouterService()
+        finally:
+            del os.environ['OPENROUTER_BASE_URL']
+        if service.base_url != 'http://127.0.0.1:8099/api/v1':
+            print(f"❌ Base URL override ignored: {service.base_url}")
+            return False
+        print("✅ OPENROUTER_BASE_URL overrides the API endpoint")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ OpenRouter stub test failed: {e}")
+        return False
+
+def test_corpus_generator():
+    """Test the seeded synthetic resume and job description corpus"""
+    print("\n🧪 Testing synthetic corpus generator...")
+    
+    try:
+        import tempfile
+        from benchmarks.corpus import CorpusGenerator, text_to_pdf
+        from backend.utils.pdf_processor import PDFProcessor
+        
+        generator = CorpusGenerator(seed=3)
+        resume = generator.resume(99999, words=800)
+        if resume != CorpusGenerator(seed=3).resume(99999, words=800) or resume == generator.resume(99998, words=800):
+            print("❌ Documents are not deterministic per seed and index")
+            return False
+        if not all(skill in resume.text for skill in resume.skills):
+            print("❌ Resume text is missing its skills")
+            return False
+        print("✅ Seeded resumes are reproducible by index")
+        
+        job = generator.job_description(0, resume=resume, overlap=0.5)
+        if len(set(job.required) & set(resume.skills)) < 3 or not all(name in job.text for name in job.required):
+            print("❌ Matching job description does not share the resume's skills")
+            return False
+        print("✅ Job descriptions overlap their resume")
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'resume.pdf')
+            with open(path, 'wb') as f:
+                f.write(text_to_pdf(resume.text, pages=3))
+            info = PDFProcessor().get_pdf_info(path)
+            text = PDFProcessor().extract_text(path)
+        if info.get('num_pages') != 3 or not text or resume.skills[0] not in text:
+            print(f"❌ Generated PDF not readable: {info}")
+            return False
+        print("✅ Generated PDFs extract with the requested page count")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Corpus generator test failed: {e}")
+        return False
+
+def test_load_test_harness():
+    """Test route mix parsing and latency percentiles of the load test"""
+    print("\n🧪 Testing load test harness...")
+    
+    try:
+        from benchmarks.load_test import parse_mix, percentile, summarize_samples
+        
+        if parse_mix('analyze=1,skills=4') != {'analyze': 1.0, 'skills': 4.0}:
+            print("❌ Route mix not parsed")
+            return False
+        try:
+            parse_mix('upload=1')
+            print("❌ Unknown route accepted in mix")
+            return False
+        except ValueError:
+            pass
+        print("✅ Route mixes parsed and validated")
+        
+        latencies = list(range(1, 101))
+        samples = [('skills', 0.0, ms / 1000, 200 if ms <= 98 else 503) for ms in latencies]
+        summary = summarize_samples(samples, elapsed=10.0)
+        if (percentile(latencies, 50), percentile(latencies, 99)) != (50, 99) or summary['p95_ms'] != 95.0:
+            print(f"❌ Unexpected percentiles: {summary}")
+            return False
+        if summary['errors'] != 2 or summary['throughput_rps'] != 9.8 or summary['statuses'] != {'200': 98, '503': 2}:
+            print(f"❌ Unexpected error accounting: {summary}")
+            return False
+        print("✅ Percentiles, throughput and error rate computed")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Load test harness test failed: {e}")
+        return False
+
+def test_memory_budgets():
+    """Test per-request peak and retained memory of resume uploads against budgets"""
+    print("\n🧪 Testing memory budgets...")
+    
+    try:
+        import app as app_module
+        from benchmarks.corpus import CorpusGenerator, text_to_pdf
+        from benchmarks.memory_profile import (REQUEST_PEAK_BUDGET_KB, RETAINED_BUDGET_KB, StageProfiler,
+                                               profile_stages, request_peak_kb, retained_kb, tracing)
+        from benchmarks.openrouter_stub import patch_service
+        
+        service = app_module.resume_analyzer.openrouter_service
+        api_key = service.api_key
+        patch_service(service)
+        try:
+            corpus = CorpusGenerator(seed=5)
+            pdfs = [text_to_pdf(corpus.resume(i, words=1000).text, pages=2) for i in range(2)]
+            
+            profiler = StageProfiler()
+            with tracing():
+                stages = profile_stages(app_module, pdfs[0], profiler)
+            if list(stages) != ['upload', 'extract_text', 'analyze', 'store', 'serialize']:
+                print(f"❌ Unexpected stages: {list(stages)}")
+                return False
+            peaks = ', '.join(f"{name} {entry['peak_kb']:.0f}" for name, entry in stages.items())
+            print(f"✅ Stage peaks (KB): {peaks}")
+            
+            peak = request_peak_kb(app_module, pdfs[0])
+            if peak > REQUEST_PEAK_BUDGET_KB:
+                print(f"❌ Request peak {peak:.0f} KB exceeds {REQUEST_PEAK_BUDGET_KB} KB")
+                return False
+            print(f"✅ Request peak {peak:.0f} KB within {REQUEST_PEAK_BUDGET_KB} KB")
+            
+            retained, _ = retained_kb(app_module, pdfs, 20)
+            if retained > RETAINED_BUDGET_KB:
+                print(f"❌ {retained:.0f} KB retained after 20 requests exceeds {RETAINED_BUDGET_KB} KB")
+                return False
+            print(f"✅ {retained:.0f} KB retained after 20 requests (budget {RETAINED_BUDGET_KB} KB)")
+        finally:
+            service.api_key = api_key
+            del service._make_request
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Memory budget test failed: {e}")
+        return False
+
+def test_production_entry_point():
+    """Test the gunicorn configuration, warm-up and fork-safe SQLite tier"""
+    print("\n🧪 Testing production entry point...")
+    
+    try:
+        import runpy
+        import tempfile
+        from backend.utils.cache import SQLiteStore
+        
+        os.environ['WEB_CONCURRENCY'] = '3'
+        try:
+            config = runpy.run_path('gunicorn.conf.py')
+        finally:
+            del os.environ['WEB_CONCURRENCY']
+        if not config['preload_app'] or config['workers'] != 3 or config['wsgi_app'] != 'wsgi:application':
+            print("❌ Gunicorn configuration does not preload the WSGI app")
+            return False
+        print("✅ Gunicorn preloads wsgi:application with tunable workers")
+        
+        import app as app_module
+        import wsgi
+        if wsgi.application is not app_module.app or app_module.skills_database_response._prepared is None:
+            print("❌ WSGI application not warmed up")
+            return False
+        print("✅ wsgi.application warmed up")
+        
+        if hasattr(os, 'fork'):
+            with tempfile.TemporaryDirectory() as directory:
+                store = SQLiteStore(os.path.join(directory, 'store.db'))
+                store.set('parent', 1)
+                pid = os.fork()
+                if pid == 0:
+                    try:
+                        store.set('child', store.get('parent') + 1)
+                    finally:
+                        os._exit(0)
+                os.waitpid(pid, 0)
+                if store.get('child') != 2:
+                    print("❌ Forked worker could not use the SQLite tier")
+                    return False
+            print("✅ SQLite tier reconnects in forked workers")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Production entry point test failed: {e}")
+        return False
+
+def test_lazy_startup():
+    """Test that importing the app defers heavy imports and builds each service once"""
+    print("\n🧪 Testing lazy startup...")
+    
+    try:
+        import subprocess
+        import sys
+        import threading
+        from backend.services.registry import ServiceRegistry
+        
+        # A fresh interpreter, so modules imported by earlier tests do not count
+        script = ("import sys, app; "
+                  "print(sorted(m for m in ('PyPDF2', 'numpy', 'requests') if m in sys.modules), "
+                  "len(app.services.created()))")
+        env = dict(os.environ, ANALYSIS_CACHE_PATH='', RESUME_STORE_PATH='', RESUME_INDEX_PATH='')
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                                env=env, check=True).stdout.strip().splitlines()[-1]
+        if output != '[] 0':
+            print(f"❌ Importing the app loaded heavy modules or services: {output}")
+            return False
+        print("✅ Importing the app builds no services and skips PyPDF2, numpy and requests")
+        
+        calls = []
+        registry = ServiceRegistry()
+        registry.register('base', lambda: calls.append('base') or object())
+        registry.register('derived', lambda: calls.append('derived') or (registry.base,))
+        threads = [threading.Thread(target=lambda: registry.derived) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if sorted(calls) != ['base', 'derived'] or registry.derived[0] is not registry.base:
+            print(f"❌ Services created more than once: {calls}")
+            return False
+        print("✅ Each service created once, on first use")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Lazy startup test failed: {e}")
+        return False
+
+def test_json_and_compression():
+    """Test the JSON provider backends and negotiated response compression"""
+    print("\n🧪 Testing JSON serialization and compression...")
+    
+    try:
+        import datetime
+        import gzip
+        from app import app
+        from backend.utils.json_provider import FastJSONProvider, orjson
+        
+        payload = {'when': datetime.datetime(2024, 1, 2), 'name': 'Zoë', 'scores': [1, 2.5, None], 'big': 2 ** 70}
+        documents = {backend: FastJSONProvider(app, backend).dumps_bytes(payload).decode('utf-8')
+                     for backend in ('json', 'orjson') if backend == 'json' or orjson is not None}
+        if len(set(documents.values())) != 1 or 'Tue, 02 Jan 2024' not in documents['json']:
+            print(f"❌ JSON backends disagree: {documents}")
+            return False
+        print(f"✅ JSON backends produce identical documents ({', '.join(documents)})")
+        
+        client = app.test_client()
+        response = client.get('/api/skills/search?q=a&limit=50', headers={'Accept-Encoding': 'gzip'})
+        if (response.headers.get('Content-Encoding') != 'gzip'
+                or app.json.loads(gzip.decompress(response.get_data()))['success'] is not True):
+            print("❌ Large JSON response not gzip-compressed")
+            return False
+        print("✅ Large JSON responses compressed when the client accepts gzip")
+        
+        small = client.get('/health', headers={'Accept-Encoding': 'gzip'})
+        plain = client.get('/api/skills/search?q=a&limit=50')
+        if 'Content-Encoding' in small.headers or 'Content-Encoding' in plain.headers:
+            print("❌ Compressed a small response or one the client did not accept")
+            return False
+        if 'Accept-Encoding' not in plain.headers.get('Vary', ''):
+            print("❌ Compressible responses must vary on Accept-Encoding")
+            return False
+        print("✅ Small responses and clients without Accept-Encoding get identity bodies")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ JSON serialization test failed: {e}")
+        return False
+
+def test_streaming_upload():
+    """Test that uploads are hashed while streamed and bad ones rejected early"""
+    print("\n🧪 Testing streaming upload handling...")
+    
+    try:
+        import hashlib
+        import io
+        from app import app
+        from benchmarks.corpus import CorpusGenerator
+        from benchmarks.memory_profile import multipart_body
+        from backend.utils.upload_stream import CHUNK_SIZE, UploadError, receive_pdf_upload
+        
+        class CountingStream(io.BytesIO):
+            consumed = 0
+            
+            def read(self, size=-1):
+                data = super().read(size)
+                self.consumed += len(data)
+                return data
+        
+        pdf_bytes = CorpusGenerator(seed=3).resume_pdf(0, pages=1)
+        with receive_pdf_upload(CountingStream(multipart_body(pdf_bytes)), b'memory-profile') as upload:
+            if upload.digest != hashlib.sha256(pdf_bytes).hexdigest() or upload.file.read() != pdf_bytes:
+                print("❌ Streamed upload content or digest differs from the file")
+                return False
+        print("✅ Upload spooled and hashed while streamed")
+        
+        # A non-PDF must be refused after the first chunk, an oversized PDF once over the limit
+        for content, max_size, status, limit in ((b'MZ' + b'\0' * (4 * CHUNK_SIZE), None, 400, 2 * CHUNK_SIZE),
+                                                 (b'%PDF-1.4\n' + b'\0' * (8 * CHUNK_SIZE), 2 * CHUNK_SIZE, 413,
+                                                  4 * CHUNK_SIZE)):
+            stream = CountingStream(multipart_body(content))
+            try:
+                receive_pdf_upload(stream, b'memory-profile', max_size=max_size)
+                print("❌ Bad upload accepted")
+                return False
+            except UploadError as e:
+                if e.status_code != status or stream.consumed > limit:
+                    print(f"❌ Bad upload rejected with {e.status_code} after {stream.consumed} bytes")
+                    return False
+        print("✅ Non-PDF and oversized uploads rejected before the body is read")
+        
+        client = app.test_client()
+        responses = [client.post('/api/analyze-resume', data={'resume': (io.BytesIO(body), name)},
+                                 content_type='multipart/form-data')
+                     for body, name in ((b'plain text' * 20, 'resume.pdf'), (pdf_bytes, 'resume.txt'))]
+        if [response.status_code for response in responses] != [400, 400]:
+            print(f"❌ Endpoint accepted invalid uploads: {[r.status_code for r in responses]}")
+            return False
+        too_large = client.post('/api/analyze-resume', data=b'', content_type='multipart/form-data; boundary=x',
+                                environ_overrides={'CONTENT_LENGTH': str(app.config['MAX_CONTENT_LENGTH'] + 1)})
+        if too_large.status_code != 413:
+            print(f"❌ Oversized request returned {too_large.status_code}")
+            return False
+        print("✅ Endpoint answers invalid uploads with 400 and oversized ones with 413")
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Streaming upload test failed: {e}")
+        return False
+
+def test_admission_control():
+    """Test per-client token buckets, the concurrency gate and load shedding"""
+    print("\n🧪 Testing admission control...")
+    
+    try:
+        import subprocess
+        import sys
+        import tempfile
+        import threading
+        import time
+        import app as app_module
+        from backend.utils.admission import (ConcurrencyGate, MemoryTokenBuckets, Overloaded, SQLiteConcurrencyGate,
+                                             SQLiteTokenBuckets, default_gate_sizes)
+        
+        buckets = MemoryTokenBuckets()
+        waits = [buckets.take('client', rate=1.0, burst=2, now=now) for now in (0.0, 0.0, 0.0, 1.0)]
+        if waits != [0.0, 0.0, 1.0, 0.0]:
+            print(f"❌ Token bucket admitted wrongly: {waits}")
+            return False
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'limits.db')
+            workers = [SQLiteTokenBuckets(path), SQLiteTokenBuckets(path)]
+            waits = [workers[i % 2].take('client', rate=1.0, burst=2, now=0.0) for i in range(3)]
+        if waits != [0.0, 0.0, 1.0]:
+            print(f"❌ SQLite buckets not shared between workers: {waits}")
+            return False
+        print("✅ Token buckets refill at the configured rate, shared through SQLite")
+        
+        client = app_module.app.test_client()
+        admission = app_module.services.admission
+        saved = (admission.rate, admission.burst, admission.gate, admission.shed_queue_depth)
+        service = app_module.services.resume_analyzer.openrouter_service
+        api_key = service.api_key
+        llm_calls = []
+        service.api_key = 'test'
+        service._make_request = lambda messages, max_tokens=1000: llm_calls.append(1)
+        data = {'resume_text': 'Python developer with Flask and AWS experience', 'job_description': 'Python engineer'}
+        try:
+            admission.rate, admission.burst = 1 / 60, 2
+            statuses = [client.post('/api/compare-job', json=data, environ_base={'REMOTE_ADDR': '203.0.113.9'})
+                        for _ in range(3)]
+            if [r.status_code for r in statuses] != [200, 200, 429] or int(statuses[2].headers['Retry-After']) < 1:
+                print(f"❌ Rate limit not enforced: {[r.status_code for r in statuses]}")
+                return False
+            print("✅ Clients over their limit get 429 with Retry-After")
+            
+            # Four request threads, as in one gunicorn worker by default: two run, one waits, the fourth is shed
+            admission.rate = 0
+            llm_calls.clear()
+            limit, queue, shed_depth = default_gate_sizes(4)
+            admission.gate = ConcurrencyGate(limit, queue, timeout=10)
+            admission.shed_queue_depth = shed_depth
+            release = threading.Event()
+            service._make_request = lambda messages, max_tokens=1000: llm_calls.append(1) or release.wait(10) and None
+            statuses = []
+            post = lambda: statuses.append(client.post('/api/compare-job', json=data).status_code)
+            threads = [threading.Thread(target=post) for _ in range(limit + queue)]
+            for thread in threads:
+                thread.start()
+            while admission.gate.active < limit or admission.gate.waiting < queue:
+                time.sleep(0.01)
+            shed = client.post('/api/compare-job', json=data)
+            admission.shed_queue_depth = 0
+            busy = client.post('/api/compare-job', json=data)
+            release.set()
+            for thread in threads:
+                thread.join()
+            if shed.status_code != 200 or shed.headers.get('X-Analysis-Mode') != 'local-only' or len(llm_calls) != limit + queue:
+                print(f"❌ Deep queue not shed to local-only analysis ({len(llm_calls)} LLM calls)")
+                return False
+            if busy.status_code != 429 or 'Retry-After' not in busy.headers or statuses != [200] * (limit + queue):
+                print(f"❌ Full queue not refused: {busy.status_code}, {statuses}")
+                return False
+            print("✅ At gunicorn's thread count, a deep queue is shed and a full one refused")
+            
+            # A gate shared through SQLite counts the slots and queue of every worker
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'admission.db')
+                gates = [SQLiteConcurrencyGate(path, limit=1, max_queue=1, timeout=5) for _ in range(3)]
+                # gates[1] takes its slot and never releases it, as if its worker was killed
+                gates[1].lease = 0.3
+                abandoned = [gates[1].slot()]
+                with gates[0].slot():
+                    queued = threading.Thread(target=abandoned[0].__enter__)
+                    queued.start()
+                    while gates[2].waiting < 1:
+                        time.sleep(0.01)
+                    try:
+                        with gates[2].slot():
+                            pass
+                        print("❌ Shared gate admitted more requests than its limit and queue")
+                        return False
+                    except Overloaded:
+                        pass
+                queued.join()
+                started = time.monotonic()
+                with gates[2].slot():
+                    waited = time.monotonic() - started
+                abandoned[0].__exit__(None, None, None)
+            if not 0.1 < waited < 5:
+                print(f"❌ Slot of a dead worker not freed by its lease (waited {waited:.2f}s)")
+                return False
+            print("✅ Shared gate limits all workers and frees the slots of dead ones")
+            
+            script = ("import runpy; runpy.run_path('gunicorn.conf.py'); import app; c = app.app.config; "
+                      "print(c['MAX_CONCURRENT_REQUESTS'], c['ADMISSION_QUEUE_SIZE'], c['SHED_QUEUE_DEPTH'], "
+                      "app.os.environ['GUNICORN_THREADS'])")
+            env = {key: value for key, value in os.environ.items()
+                   if key not in ('MAX_CONCURRENT_REQUESTS', 'ADMISSION_QUEUE_SIZE', 'SHED_QUEUE_DEPTH',
+                                  'GUNICORN_THREADS', 'WEB_CONCURRENCY', 'RATE_LIMIT_STORE_PATH')}
+            output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env,
+                                    check=True).stdout.strip().splitlines()[-1]
+            limit, queue, shed_depth, threads = map(int, output.split())
+            if not (limit + queue < threads and 1 <= shed_depth <= queue):
+                print(f"❌ Gate defaults cannot queue under gunicorn.conf.py: {output}")
+                return False
+            print(f"✅ Gate sized from gunicorn.conf.py ({limit} running, {queue} queued of {threads} threads)")
+            
+            # Behind one trusted proxy, clients are told apart by X-Forwarded-For
+            script = ("import app; client = app.app.test_client(); "
+                      "data = {'resume_text': 'Python developer', 'job_description': 'Python engineer'}; "
+                      "print([client.post('/api/compare-job', json=data, headers={'X-Forwarded-For': address}).status_code "
+                      "for address in ('198.51.100.1', '198.51.100.1', '198.51.100.2')])")
+            env = dict(env, TRUSTED_PROXY_COUNT='1', RATE_LIMIT_PER_MINUTE='1', RATE_LIMIT_BURST='1',
+                       ANALYSIS_CACHE_PATH='', RESUME_STORE_PATH='', RESUME_INDEX_PATH='')
+            env.pop('OPENROUTER_API_KEY', None)
+            output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env,
+                                    check=True).stdout.strip().splitlines()[-1]
+            if output != '[200, 429, 200]':
+                print(f"❌ Clients behind a trusted proxy share a bucket: {output}")
+                return False
+            print("✅ Clients behind a trusted proxy get their own buckets")
+        finally:
+            admission.rate, admission.burst, admission.gate, admission.shed_queue_depth = saved
+            service.api_key = api_key
+            del service._make_request
+        
+        return True
+    
+    except Exception as e:
+        print(f"❌ Admission control test failed: {e}")
+        return False
+
 def run_health_check():
     """Test Flask app health endpoint"""
     print("\n🧪 Testing Flask app health endpoint...")
@@ -259,6 +1532,30 @@ def main():
         ("Static Files", test_static_files),
         ("Template Files", test_templates),
         ("PDF Processor", test_pdf_processor),
+        ("Analysis Cache", test_analysis_cache),
+        ("Resume Handles", test_resume_handles),
+        ("Batch Job Comparison", test_batch_job_comparison),
+        ("Candidate Ranking", test_candidate_ranking),
+        ("Resume Search", test_resume_search),
+        ("Shared Worker State", test_shared_worker_state),
+        ("Local Job Matching", test_local_job_matching),
+        ("Analysis Context", test_analysis_context),
+        ("Section Segmentation", test_section_segmentation),
+        ("Experience Scanner", test_experience_scanner),
+        ("Skill Search", test_skill_search),
+        ("Skill Aliases", test_skill_aliases),
+        ("Skill Taxonomy", test_skill_taxonomy),
+        ("Skills Database Response", test_skills_database_response),
+        ("Learning Paths", test_learning_paths),
+        ("OpenRouter Stub", test_openrouter_stub),
+        ("Corpus Generator", test_corpus_generator),
+        ("Load Test Harness", test_load_test_harness),
+        ("Memory Budgets", test_memory_budgets),
+        ("Production Entry Point", test_production_entry_point),
+        ("Lazy Startup", test_lazy_startup),
+        ("JSON and Compression", test_json_and_compression),
+        ("Streaming Upload", test_streaming_upload),
+        ("Admission Control", test_admission_control),
         ("Health Check", run_health_check)
     ]
     
@@ -0,0 +1,12 @@
+"""
+WSGI entry point for RealiZe
+Production servers import `application`; the app is warmed up before it serves traffic
+Made by: Amir Hafizi Bin Musa, UiTM Science Computer Student
+"""
+
+from app import app, warm_up
+
+# With gunicorn's preload_app this runs once in the master, before workers fork
+warm_up()
+
+application = app